@@ -7,7 +7,11 @@ import numpy as np
 import wave
 import logging
 import random
+import threading
 from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache
+import dataclasses
+from dataclasses import dataclass
 import os
 
 from src.audio_generators.base_audio_generator import IAudioGenerator
@@ -15,6 +19,205 @@ from src.core.data_pipeline import TrendData, AudioEvent
 
 logger = logging.getLogger("TikSimPro")
 
+# Type des échantillons produits par AdvancedSoundGenerator : float32 suffit largement
+# avant la conversion en PCM 16 bits et divise par deux le trafic mémoire. Les phases
+# restent calculées en float64 (précision sur plusieurs secondes de signal).
+_SAMPLE_DTYPE = np.float32
+
+# Numba est optionnel : sans lui, les filtres récursifs restent des boucles Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Remplaçant sans effet de numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# SciPy est optionnel : sans Numba, lfilter (en C) remplace les boucles Python des filtres
+try:
+    from scipy.signal import lfilter, lfiltic
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# ===== NOYAUX ÉCHANTILLON PAR ÉCHANTILLON =====
+# Chaque échantillon dépend du précédent : ces boucles ne se vectorisent pas avec NumPy.
+# nogil : plusieurs sons peuvent être générés en parallèle par des threads
+
+@njit(cache=True, nogil=True)
+def _pink_filter(white):
+    """Filtre un bruit blanc en bruit rose approché (y[i] = 0.5 x[i] + 0.3 y[i-1])"""
+    pink = np.zeros_like(white)
+    if white.shape[0] == 0:
+        return pink
+    pink[0] = white[0]
+    for i in range(1, white.shape[0]):
+        pink[i] = white[i] * 0.5 + pink[i - 1] * 0.3
+    return pink
+
+@njit(cache=True, nogil=True)
+def _lowpass_kernel(signal, alpha, resonance):
+    """Passe-bas à un pôle suivi du feedback de résonance"""
+    n = signal.shape[0]
+    result = np.zeros_like(signal)
+    if n == 0:
+        return result
+    result[0] = signal[0] * (1 - alpha)
+    for i in range(1, n):
+        result[i] = alpha * result[i - 1] + (1 - alpha) * signal[i]
+    
+    if resonance > 0:
+        feedback = resonance * 0.3
+        for i in range(2, n):
+            result[i] += feedback * (result[i - 1] - result[i - 2])
+    return result
+
+@njit(cache=True, nogil=True)
+def _highpass_kernel(signal, alpha):
+    """Passe-haut à un pôle"""
+    n = signal.shape[0]
+    result = np.zeros_like(signal)
+    if n == 0:
+        return result
+    result[0] = signal[0]
+    for i in range(1, n):
+        result[i] = alpha * (result[i - 1] + signal[i] - signal[i - 1])
+    return result
+
+# ===== VARIANTES SCIPY =====
+# Mêmes récurrences exprimées en coefficients IIR ; les premiers échantillons
+# particuliers des boucles sont reproduits par l'état initial du filtre
+
+def _pink_lfilter(white):
+    """Équivalent lfilter de _pink_filter"""
+    if white.shape[0] == 0:
+        return np.zeros_like(white)
+    pink, _ = lfilter([0.5], [1.0, -0.3], white, zi=[0.5 * white[0]])
+    return pink.astype(white.dtype, copy=False)
+
+def _lowpass_lfilter(signal, alpha, resonance):
+    """Équivalent lfilter de _lowpass_kernel"""
+    result = lfilter([1 - alpha], [1.0, -alpha], signal)
+    if resonance > 0 and signal.shape[0] > 2:
+        feedback = resonance * 0.3
+        a = [1.0, -feedback, feedback]
+        zi = lfiltic([1.0], a, y=[result[1], result[0]])
+        result[2:], _ = lfilter([1.0], a, result[2:], zi=zi)
+    return result.astype(signal.dtype, copy=False)
+
+def _highpass_lfilter(signal, alpha):
+    """Équivalent lfilter de _highpass_kernel"""
+    if signal.shape[0] == 0:
+        return np.zeros_like(signal)
+    result, _ = lfilter([alpha, -alpha], [1.0, -alpha], signal,
+                        zi=[(1 - alpha) * signal[0]])
+    return result.astype(signal.dtype, copy=False)
+
+def _lfilter_matches_loops(pink_filter, lowpass_kernel, highpass_kernel) -> bool:
+    """Vérifie sur un signal court que les variantes lfilter reproduisent les noyaux donnés"""
+    # Version Python d'un noyau Numba (appelable sans compilation)
+    pink_filter, lowpass_kernel, highpass_kernel = (
+        getattr(kernel, "py_func", kernel) for kernel in (pink_filter, lowpass_kernel, highpass_kernel)
+    )
+    
+    signal = np.random.default_rng(0).standard_normal(64).astype(_SAMPLE_DTYPE)
+    pairs = [
+        (_pink_lfilter(signal), pink_filter(signal)),
+        (_lowpass_lfilter(signal, 0.9, 0.7), lowpass_kernel(signal, 0.9, 0.7)),
+        (_lowpass_lfilter(signal, 0.9, 0.0), lowpass_kernel(signal, 0.9, 0.0)),
+        (_highpass_lfilter(signal, 0.95), highpass_kernel(signal, 0.95)),
+    ]
+    return all(np.allclose(fast, ref, rtol=1e-5, atol=1e-6) for fast, ref in pairs)
+
+# Choix de l'implémentation : Numba, sinon SciPy (si conforme aux boucles), sinon boucles Python
+if not NUMBA_AVAILABLE and SCIPY_AVAILABLE:
+    if _lfilter_matches_loops(_pink_filter, _lowpass_kernel, _highpass_kernel):
+        _pink_filter = _pink_lfilter
+        _lowpass_kernel = _lowpass_lfilter
+        _highpass_kernel = _highpass_lfilter
+    else:
+        logger.warning("Filtres lfilter non conformes aux boucles : boucles Python conservées")
+
+# ===== TABLES EN CACHE =====
+# Les mêmes durées et presets reviennent sans cesse : ces tableaux sont construits une
+# fois puis partagés en lecture seule (les appelants font signal * envelope, jamais *=)
+
+@lru_cache(maxsize=16)
+def _time_base(sample_rate: int, samples: int) -> np.ndarray:
+    """Instants des échantillons, de 0 à samples / sample_rate"""
+    t = np.linspace(0, samples / sample_rate, samples)
+    t.setflags(write=False)
+    return t
+
+@lru_cache(maxsize=32)
+def _adsr_envelope(sample_rate: int, samples: int, attack_ms: float, decay_ms: float,
+                   sustain_level: float, release_ms: float, curve_type: str) -> np.ndarray:
+    """Enveloppe ADSR (voir AdvancedSoundGenerator.create_adsr_envelope)"""
+    envelope = np.ones(samples, dtype=_SAMPLE_DTYPE)
+    
+    # Conversion en échantillons
+    attack_samples = max(1, int(attack_ms * sample_rate / 1000))
+    decay_samples = max(1, int(decay_ms * sample_rate / 1000))
+    release_samples = max(1, int(release_ms * sample_rate / 1000))
+    
+    # Ajustement des durées si nécessaire
+    total_env = attack_samples + decay_samples + release_samples
+    if total_env >= samples:
+        ratio = samples / total_env * 0.9
+        attack_samples = max(1, int(attack_samples * ratio))
+        decay_samples = max(1, int(decay_samples * ratio))
+        release_samples = max(1, int(release_samples * ratio))
+    
+    sustain_samples = samples - attack_samples - decay_samples - release_samples
+    pos = 0
+    
+    # Attack
+    if attack_samples > 0:
+        if curve_type == "linear":
+            attack_curve = np.linspace(0, 1, attack_samples)
+        elif curve_type == "exponential":
+            attack_curve = 1 - np.exp(-np.linspace(0, 5, attack_samples))
+        elif curve_type == "logarithmic":
+            attack_curve = np.log(np.linspace(1, np.e, attack_samples))
+        else:  # sine
+            attack_curve = np.sin(np.linspace(0, np.pi / 2, attack_samples))
+        
+        envelope[pos:pos + attack_samples] = attack_curve
+        pos += attack_samples
+    
+    # Decay
+    if decay_samples > 0:
+        if curve_type == "linear":
+            decay_curve = np.linspace(1, sustain_level, decay_samples)
+        elif curve_type == "exponential":
+            decay_curve = sustain_level + (1 - sustain_level) * np.exp(-np.linspace(0, 3, decay_samples))
+        else:
+            decay_curve = np.linspace(1, sustain_level, decay_samples)
+        
+        envelope[pos:pos + decay_samples] = decay_curve
+        pos += decay_samples
+    
+    # Sustain
+    if sustain_samples > 0:
+        envelope[pos:pos + sustain_samples] = sustain_level
+        pos += sustain_samples
+    
+    # Release
+    if release_samples > 0:
+        if curve_type == "exponential":
+            release_curve = sustain_level * np.exp(-np.linspace(0, 5, release_samples))
+        else:
+            release_curve = sustain_level * np.cos(np.linspace(0, np.pi / 2, release_samples))
+        
+        envelope[pos:pos + release_samples] = release_curve
+    
+    envelope.setflags(write=False)
+    return envelope
+
 class SimpleMidiExtractor:
     """Extractor for midi files"""
     
@@ -44,55 +247,363 @@ class SimpleMidiExtractor:
         # C major: C D E F G A B C
         return [261.63, 293.66, 329.63, 349.23, 392.00, 440.00, 493.88, 523.25]
 
+# Largeur (en échantillons) des blocs de partiels synthétisés ensemble
+_PARTIAL_TILE = 4096
+
+# Partiels regroupés par forme d'onde : (forme, tableau (K, 3) rapport / amplitude / phase)
+PartialGroups = Tuple[Tuple[str, np.ndarray], ...]
+
+@dataclass(slots=True, frozen=True, eq=False)
+class CompiledPreset:
+    """
+    Config de generate_advanced_sound résolue une fois (voir compile_config)
+    
+    Tableaux en lecture seule et turbulences en tuple : rien n'est modifiable en place.
+    eq=False : égalité et hash par identité (les tableaux NumPy ne sont pas hachables).
+    """
+    frequency: float
+    duration: float
+    volume: float
+    waveform: str
+    harmonics: PartialGroups
+    subharmonics: PartialGroups
+    fm: Optional[Tuple[float, float]]              # (fréquence, profondeur)
+    am: Optional[Tuple[float, float]]
+    turbulence: Optional[Tuple[Tuple[str, Any], ...]]  # Paires (clé, valeur)
+    filters: Tuple[Tuple[str, Tuple[Any, ...]], ...]  # (type, arguments)
+    envelope_points: Optional[np.ndarray]          # (P, 2) si enveloppe personnalisée
+    adsr: Tuple[float, float, float, float, str]   # attack, decay, sustain, release, courbe
+    effects: Tuple[Tuple[str, Tuple[Any, ...]], ...]
+
+# Paramètres (clé, défaut) de chaque filtre et effet, dans l'ordre des arguments
+_FILTER_PARAMS = {
+    "lowpass": (("cutoff", 1000), ("resonance", 0.7)),
+    "highpass": (("cutoff", 100),),
+    "bandpass": (("low_freq", 100), ("high_freq", 1000)),
+    "notch": (("notch_freq", 60), ("q_factor", 10)),
+}
+_EFFECT_PARAMS = {
+    "reverb": (("room_size", 0.5), ("damping", 0.5), ("wet_level", 0.3)),
+    "delay": (("delay_ms", 125), ("feedback", 0.3), ("wet_level", 0.3)),
+    "chorus": (("rate", 2.0), ("depth", 0.02), ("mix", 0.5)),
+    "distortion": (("drive", 2.0), ("tone", 0.5)),
+    "bitcrusher": (("bits", 8), ("sample_rate_reduction", 1)),
+}
+
+def _compile_partials(partials_config: List[Dict[str, Any]], ratio_key: str,
+                      default_ratio: float, default_amplitude: float) -> PartialGroups:
+    """Regroupe les partiels par forme d'onde (ordre de première apparition)"""
+    groups: Dict[str, List[Tuple[float, float, float]]] = {}
+    for partial in partials_config:
+        groups.setdefault(partial.get("waveform", "sine"), []).append((
+            partial.get(ratio_key, default_ratio),
+            partial.get("amplitude", default_amplitude),
+            partial.get("phase", 0.0),
+        ))
+    compiled = []
+    for waveform, rows in groups.items():
+        table = np.array(rows, dtype=np.float64)
+        table.setflags(write=False)
+        compiled.append((waveform, table))
+    return tuple(compiled)
+
+def _compile_steps(steps_config: List[Dict[str, Any]], default_type: str,
+                   params: Dict[str, Tuple[Tuple[str, Any], ...]]) -> Tuple[Tuple[str, Tuple[Any, ...]], ...]:
+    """Résout les filtres ou effets en (type, arguments) ; les types inconnus sont ignorés"""
+    compiled = []
+    for step in steps_config:
+        step_type = step.get("type", default_type)
+        if step_type in params:
+            compiled.append((step_type, tuple(step.get(key, default) for key, default in params[step_type])))
+    return tuple(compiled)
+
+def _pink_noise(white: np.ndarray) -> np.ndarray:
+    """Bruit rose normalisé à partir d'un bruit blanc"""
+    # Approximation simple du bruit rose
+    pink = _pink_filter(white)
+    return pink / (np.max(np.abs(pink)) + 1e-8)
+
+def _brown_noise(white: np.ndarray) -> np.ndarray:
+    """Bruit brun normalisé à partir d'un bruit blanc"""
+    brown = np.cumsum(white)
+    return brown / (np.max(np.abs(brown)) + 1e-8)
+
+class NoisePool:
+    """
+    Bruits tirés une seule fois puis servis par tranches (opt-in, voir AdvancedSoundGenerator)
+    
+    Toutes les tranches viennent du même tirage : deux sons de même durée reçoivent le
+    même bruit. Convient aux démos et textures, pas aux variations aléatoires.
+    """
+    
+    NOISE_TYPES = ("noise", "pink_noise", "brown_noise")
+    
+    def __init__(self, samples: int = 0, seed: Optional[int] = None):
+        self._rng = np.random.default_rng(seed)  # PCG64 : plus rapide que np.random.*
+        self._lock = threading.Lock()
+        self._size = 0
+        self._buffers: Dict[str, np.ndarray] = {}
+        if samples > 0:
+            self._grow(samples)
+    
+    def get(self, noise_type: str, samples: int) -> np.ndarray:
+        """Vue en lecture seule sur les samples premiers échantillons du bruit demandé"""
+        with self._lock:
+            if samples > self._size:
+                self._grow(samples)
+            buffer = self._buffers.get(noise_type)
+            if buffer is None:
+                buffer = self._buffers[noise_type] = self._compute(noise_type)
+        return buffer[:samples]
+    
+    def _grow(self, samples: int):
+        """Nouveau tirage à la taille demandée (les vues déjà servies restent valides)"""
+        self._size = samples
+        self._buffers = {"white": self._rng.standard_normal(samples, dtype=_SAMPLE_DTYPE)}
+    
+    def _compute(self, noise_type: str) -> np.ndarray:
+        """Calcule un bruit à partir du tirage courant"""
+        white = self._buffers["white"]
+        if noise_type == "pink_noise":
+            noise = _pink_noise(white)
+        elif noise_type == "brown_noise":
+            noise = _brown_noise(white)
+        else:  # Bruit blanc uniforme dans [-1, 1)
+            noise = self._rng.random(self._size, dtype=_SAMPLE_DTYPE)
+            noise *= 2
+            noise -= 1
+        noise.setflags(write=False)
+        return noise
+
+# Configs des presets de AdvancedSoundGenerator : fréquence, durée et volume sont
+# fournis à chaque appel, le reste est compilé une fois (voir _compiled_preset)
+_PRESET_CONFIGS: Dict[str, Dict[str, Any]] = {
+    "satisfying_bounce": {
+        "waveform": "sine",
+        "harmonics": [
+            {"harmonic": 2, "amplitude": 0.3, "waveform": "sine"},
+            {"harmonic": 3, "amplitude": 0.15, "waveform": "triangle"}
+        ],
+        "envelope": {
+            "type": "adsr",
+            "attack_ms": 2,
+            "decay_ms": 50,
+            "sustain_level": 0.4,
+            "release_ms": 200,
+            "curve_type": "exponential"
+        },
+        "modulation": {
+            "fm_frequency": 8.0,
+            "fm_depth": 0.05
+        },
+        "turbulence": {
+            "noise_type": "pink",
+            "noise_amount": 0.02
+        },
+        "effects": [
+            {"type": "reverb", "room_size": 0.3, "wet_level": 0.2}
+        ]
+    },
+    "asmr_pop": {
+        "waveform": "sine",
+        "harmonics": [
+            {"harmonic": 1.5, "amplitude": 0.4, "waveform": "triangle"}
+        ],
+        "envelope": {
+            "type": "adsr",
+            "attack_ms": 0.5,
+            "decay_ms": 30,
+            "sustain_level": 0.1,
+            "release_ms": 60,
+            "curve_type": "exponential"
+        },
+        "turbulence": {
+            "noise_type": "pink",
+            "noise_amount": 0.15
+        },
+        "filters": [
+            {"type": "highpass", "cutoff": 150}
+        ]
+    },
+    "soft_chime": {
+        "waveform": "sine",
+        "harmonics": [
+            {"harmonic": 2.4, "amplitude": 0.3, "waveform": "sine"},
+            {"harmonic": 3.8, "amplitude": 0.2, "waveform": "sine"},
+            {"harmonic": 5.2, "amplitude": 0.1, "waveform": "sine"}
+        ],
+        "envelope": {
+            "type": "adsr",
+            "attack_ms": 5,
+            "decay_ms": 200,
+            "sustain_level": 0.6,
+            "release_ms": 400,
+            "curve_type": "exponential"
+        },
+        "effects": [
+            {"type": "reverb", "room_size": 0.7, "wet_level": 0.4}
+        ]
+    },
+    "water_drop": {
+        "waveform": "sine",
+        "harmonics": [
+            {"harmonic": 2, "amplitude": 0.2, "waveform": "sine"}
+        ],
+        "envelope": {
+            "type": "custom",
+            "points": [(0, 0), (0.02, 1), (0.1, 0.3), (1, 0)]
+        },
+        "modulation": {
+            "fm_frequency": 12.0,
+            "fm_depth": 0.1
+        },
+        "filters": [
+            {"type": "bandpass", "low_freq": 200, "high_freq": 2000}
+        ],
+        "effects": [
+            {"type": "reverb", "room_size": 0.4, "wet_level": 0.3}
+        ]
+    },
+    "gentle_pluck": {
+        "waveform": "triangle",
+        "harmonics": [
+            {"harmonic": 2, "amplitude": 0.3, "waveform": "sine"},
+            {"harmonic": 3, "amplitude": 0.2, "waveform": "triangle"}
+        ],
+        "envelope": {
+            "type": "adsr",
+            "attack_ms": 1,
+            "decay_ms": 150,
+            "sustain_level": 0.3,
+            "release_ms": 300,
+            "curve_type": "exponential"
+        },
+        "filters": [
+            {"type": "lowpass", "cutoff": 1500, "resonance": 0.3}
+        ]
+    },
+    "crystal_ting": {
+        "waveform": "sine",
+        "harmonics": [
+            {"harmonic": 2.1, "amplitude": 0.4, "waveform": "sine"},
+            {"harmonic": 3.3, "amplitude": 0.2, "waveform": "sine"},
+            {"harmonic": 4.7, "amplitude": 0.1, "waveform": "sine"}
+        ],
+        "envelope": {
+            "type": "adsr",
+            "attack_ms": 2,
+            "decay_ms": 300,
+            "sustain_level": 0.4,
+            "release_ms": 500,
+            "curve_type": "exponential"
+        },
+        "modulation": {
+            "am_frequency": 4.0,
+            "am_depth": 0.1
+        },
+        "effects": [
+            {"type": "reverb", "room_size": 0.8, "wet_level": 0.5},
+            {"type": "chorus", "rate": 0.7, "depth": 0.02, "mix": 0.3}
+        ]
+    },
+}
+
+@lru_cache(maxsize=None)
+def _compiled_preset(name: str) -> CompiledPreset:
+    """Preset compilé une fois ; les appels le reciblent avec dataclasses.replace"""
+    return AdvancedSoundGenerator.compile_config(_PRESET_CONFIGS[name])
+
 class AdvancedSoundGenerator:
     """Générateur de sons ultra-avancé pour créer tous types de sons"""
     
-    def __init__(self, sample_rate: int = 44100):
+    def __init__(self, sample_rate: int = 44100, noise_pool: Optional[NoisePool] = None):
         self.sample_rate = sample_rate
         self.pi = np.pi
+        self.noise_pool = noise_pool  # Bruits pré-tirés partagés (None : tirage à chaque appel)
         
     # ===== FORMES D'ONDES DE BASE =====
     
     def generate_waveform(self, waveform_type: str, frequency: float, samples: int, 
                          phase: float = 0.0) -> np.ndarray:
         """Génère différents types de formes d'ondes"""
-        t = np.linspace(0, samples / self.sample_rate, samples)
+        if self.noise_pool is not None and waveform_type in NoisePool.NOISE_TYPES:
+            return self.noise_pool.get(waveform_type, samples).copy()  # Appelant libre de modifier
+        
+        t = _time_base(self.sample_rate, samples)
+        wave = np.empty(samples, dtype=_SAMPLE_DTYPE)
         
         if waveform_type == "sine":
-            return np.sin(2 * self.pi * frequency * t + phase)
+            return np.sin(2 * self.pi * frequency * t + phase, out=wave)
         elif waveform_type == "square":
-            return np.sign(np.sin(2 * self.pi * frequency * t + phase))
+            return np.sign(np.sin(2 * self.pi * frequency * t + phase), out=wave)
         elif waveform_type == "sawtooth":
-            return 2 * (t * frequency - np.floor(t * frequency + 0.5)) 
+            return np.multiply(t * frequency - np.floor(t * frequency + 0.5), 2, out=wave)
         elif waveform_type == "triangle":
             saw = 2 * (t * frequency - np.floor(t * frequency + 0.5))
-            return 2 * np.abs(saw) - 1
+            return np.subtract(2 * np.abs(saw), 1, out=wave)
         elif waveform_type == "pulse":
-            return np.where(np.sin(2 * self.pi * frequency * t + phase) > 0, 1, -1)
+            return np.where(np.sin(2 * self.pi * frequency * t + phase) > 0,
+                            _SAMPLE_DTYPE(1), _SAMPLE_DTYPE(-1))
         elif waveform_type == "noise":
-            return np.random.uniform(-1, 1, samples)
+            return np.random.uniform(-1, 1, samples).astype(_SAMPLE_DTYPE)
         elif waveform_type == "pink_noise":
             return self._generate_pink_noise(samples)
         elif waveform_type == "brown_noise":
             return self._generate_brown_noise(samples)
         else:
-            return np.sin(2 * self.pi * frequency * t + phase)
+            return np.sin(2 * self.pi * frequency * t + phase, out=wave)
     
-    def _generate_pink_noise(self, samples: int) -> np.ndarray:
+    def generate_waveforms(self, waveform_types: List[str], frequency: float, samples: int,
+                          phase: float = 0.0) -> Dict[str, np.ndarray]:
+        """
+        Génère plusieurs formes d'ondes de même fréquence en un seul passage
+        
+        La base de temps, la sinusoïde (sine/square/pulse), la dent de scie
+        (sawtooth/triangle) et le bruit blanc (pink/brown) sont calculés une fois.
+        """
+        t = _time_base(self.sample_rate, samples)
+        sine = saw = white = None
+        waves = {}
+        
+        for waveform_type in waveform_types:
+            if waveform_type in ("sawtooth", "triangle"):
+                if saw is None:
+                    saw = np.multiply(t * frequency - np.floor(t * frequency + 0.5), 2,
+                                      out=np.empty(samples, dtype=_SAMPLE_DTYPE))
+                waves[waveform_type] = saw if waveform_type == "sawtooth" else 2 * np.abs(saw) - 1
+            elif waveform_type == "noise":
+                waves[waveform_type] = np.random.uniform(-1, 1, samples).astype(_SAMPLE_DTYPE)
+            elif waveform_type in ("pink_noise", "brown_noise"):
+                if white is None:
+                    white = np.random.normal(0, 1, samples).astype(_SAMPLE_DTYPE)
+                if waveform_type == "pink_noise":
+                    waves[waveform_type] = self._generate_pink_noise(samples, white)
+                else:
+                    waves[waveform_type] = self._generate_brown_noise(samples, white)
+            else:
+                if sine is None:
+                    sine = np.sin(2 * self.pi * frequency * t + phase,
+                                  out=np.empty(samples, dtype=_SAMPLE_DTYPE))
+                if waveform_type == "square":
+                    waves[waveform_type] = np.sign(sine)
+                elif waveform_type == "pulse":
+                    waves[waveform_type] = np.where(sine > 0, _SAMPLE_DTYPE(1), _SAMPLE_DTYPE(-1))
+                else:
+                    waves[waveform_type] = sine
+        
+        return waves
+    
+    def _generate_pink_noise(self, samples: int, white: Optional[np.ndarray] = None) -> np.ndarray:
         """Génère du bruit rose (1/f noise)"""
-        white = np.random.normal(0, 1, samples)
-        # Approximation simple du bruit rose
-        pink = np.zeros(samples)
-        pink[0] = white[0]
-        for i in range(1, samples):
-            pink[i] = white[i] * 0.5 + pink[i-1] * 0.3
-        return pink / (np.max(np.abs(pink)) + 1e-8)
-    
-    def _generate_brown_noise(self, samples: int) -> np.ndarray:
+        if white is None:
+            white = np.random.normal(0, 1, samples).astype(_SAMPLE_DTYPE)
+        return _pink_noise(white)
+    
+    def _generate_brown_noise(self, samples: int, white: Optional[np.ndarray] = None) -> np.ndarray:
         """Génère du bruit brun (Brownian noise)"""
-        white = np.random.normal(0, 1, samples)
-        brown = np.cumsum(white)
-        return brown / (np.max(np.abs(brown)) + 1e-8)
+        if white is None:
+            white = np.random.normal(0, 1, samples).astype(_SAMPLE_DTYPE)
+        return _brown_noise(white)
     
     # ===== SYSTÈME D'HARMONIQUES AVANCÉ =====
     
@@ -106,115 +617,106 @@ class AdvancedSoundGenerator:
             ...
         ]
         """
+        return self._add_harmonic_groups(
+            fundamental, frequency, samples,
+            _compile_partials(harmonics_config, "harmonic", 2, 0.5)
+        )
+    
+    def add_subharmonics(self, fundamental: np.ndarray, frequency: float, samples: int,
+                        subharmonics_config: List[Dict[str, Any]]) -> np.ndarray:
+        """Ajoute des sous-harmoniques"""
+        return self._add_subharmonic_groups(
+            fundamental, frequency, samples,
+            _compile_partials(subharmonics_config, "divisor", 2, 0.3)
+        )
+    
+    def _add_harmonic_groups(self, fundamental: np.ndarray, frequency: float, samples: int,
+                             groups: PartialGroups) -> np.ndarray:
+        """Ajoute des harmoniques déjà compilées (voir _compile_partials)"""
         result = fundamental.copy()
         
-        for harmonic_config in harmonics_config:
-            harmonic_number = harmonic_config.get("harmonic", 2)
-            amplitude = harmonic_config.get("amplitude", 0.5)
-            waveform = harmonic_config.get("waveform", "sine")
-            phase = harmonic_config.get("phase", 0.0)
-            
-            harmonic_freq = frequency * harmonic_number
-            if harmonic_freq < self.sample_rate / 2:  # Évite l'aliasing
-                harmonic_wave = self.generate_waveform(
-                    waveform, harmonic_freq, samples, phase * 2 * self.pi
-                )
-                result += harmonic_wave * amplitude
+        for waveform, table in groups:
+            freqs = frequency * table[:, 0]
+            keep = freqs < self.sample_rate / 2  # Évite l'aliasing
+            if keep.any():
+                self._mix_partials(result, waveform, freqs[keep], table[keep, 1],
+                                   table[keep, 2], samples)
         
         return result
     
-    def add_subharmonics(self, fundamental: np.ndarray, frequency: float, samples: int,
-                        subharmonics_config: List[Dict[str, Any]]) -> np.ndarray:
-        """Ajoute des sous-harmoniques"""
+    def _add_subharmonic_groups(self, fundamental: np.ndarray, frequency: float, samples: int,
+                                groups: PartialGroups) -> np.ndarray:
+        """Ajoute des sous-harmoniques déjà compilées"""
         result = fundamental.copy()
         
-        for sub_config in subharmonics_config:
-            divisor = sub_config.get("divisor", 2)
-            amplitude = sub_config.get("amplitude", 0.3)
-            waveform = sub_config.get("waveform", "sine")
-            phase = sub_config.get("phase", 0.0)
-            
-            sub_freq = frequency / divisor
-            if sub_freq >= 20:  # Fréquence audible minimum
-                sub_wave = self.generate_waveform(
-                    waveform, sub_freq, samples, phase * 2 * self.pi
-                )
-                result += sub_wave * amplitude
+        for waveform, table in groups:
+            freqs = frequency / table[:, 0]
+            keep = freqs >= 20  # Fréquence audible minimum
+            if keep.any():
+                self._mix_partials(result, waveform, freqs[keep], table[keep, 1],
+                                   table[keep, 2], samples)
         
         return result
     
+    def _mix_partials(self, result: np.ndarray, waveform_type: str, frequencies: np.ndarray,
+                      amplitudes: np.ndarray, phases: np.ndarray, samples: int):
+        """Ajoute à result la somme pondérée de K partiels d'une même forme d'onde"""
+        amplitudes = amplitudes.astype(_SAMPLE_DTYPE)
+        phases = phases * 2 * self.pi
+        
+        if waveform_type in ("noise", "pink_noise", "brown_noise"):
+            # Bruits : indépendants de la fréquence, un tirage par partiel
+            for amplitude, frequency, phase in zip(amplitudes, frequencies, phases):
+                noise = self.generate_waveform(waveform_type, frequency, samples, phase)
+                noise *= amplitude
+                result += noise
+            return
+        
+        # Blocs (K, _PARTIAL_TILE) : le tampon de phases float64 reste dans le cache
+        t = _time_base(self.sample_rate, samples)
+        omega = (2 * self.pi * frequencies)[:, None]
+        for start in range(0, samples, _PARTIAL_TILE):
+            stop = min(start + _PARTIAL_TILE, samples)
+            block = self._partials_block(waveform_type, frequencies[:, None], omega,
+                                         phases[:, None], t[start:stop])
+            result[start:stop] += np.dot(amplitudes, block)
+    
+    @staticmethod
+    def _partials_block(waveform_type: str, frequencies: np.ndarray, omega: np.ndarray,
+                        phases: np.ndarray, t: np.ndarray) -> np.ndarray:
+        """Formes périodiques de generate_waveform pour K fréquences (colonnes) à la fois"""
+        block = np.empty((len(frequencies), len(t)), dtype=_SAMPLE_DTYPE)
+        
+        if waveform_type in ("sawtooth", "triangle"):
+            ft = frequencies * t
+            saw = ft - np.floor(ft + 0.5)
+            if waveform_type == "sawtooth":
+                return np.multiply(saw, 2, out=block)
+            return np.subtract(2 * np.abs(2 * saw), 1, out=block)
+        
+        arg = omega * t + phases
+        if waveform_type == "square":
+            return np.sign(np.sin(arg, out=arg), out=block)
+        elif waveform_type == "pulse":
+            np.copyto(block, np.where(np.sin(arg, out=arg) > 0, 1, -1))
+            return block
+        return np.sin(arg, out=block)  # sine et formes inconnues
+    
     # ===== SYSTÈME D'ENVELOPPES AVANCÉ =====
     
     def create_adsr_envelope(self, samples: int, attack_ms: float = 10.0, 
                            decay_ms: float = 50.0, sustain_level: float = 0.7,
                            release_ms: float = 200.0, curve_type: str = "exponential") -> np.ndarray:
-        """Enveloppe ADSR avec différents types de courbes"""
-        envelope = np.ones(samples)
-        
-        # Conversion en échantillons
-        attack_samples = max(1, int(attack_ms * self.sample_rate / 1000))
-        decay_samples = max(1, int(decay_ms * self.sample_rate / 1000))
-        release_samples = max(1, int(release_ms * self.sample_rate / 1000))
-        
-        # Ajustement des durées si nécessaire
-        total_env = attack_samples + decay_samples + release_samples
-        if total_env >= samples:
-            ratio = samples / total_env * 0.9
-            attack_samples = max(1, int(attack_samples * ratio))
-            decay_samples = max(1, int(decay_samples * ratio))
-            release_samples = max(1, int(release_samples * ratio))
-        
-        sustain_samples = samples - attack_samples - decay_samples - release_samples
-        pos = 0
-        
-        # Attack
-        if attack_samples > 0:
-            if curve_type == "linear":
-                attack_curve = np.linspace(0, 1, attack_samples)
-            elif curve_type == "exponential":
-                attack_curve = 1 - np.exp(-np.linspace(0, 5, attack_samples))
-            elif curve_type == "logarithmic":
-                attack_curve = np.log(np.linspace(1, np.e, attack_samples))
-            else:  # sine
-                attack_curve = np.sin(np.linspace(0, self.pi / 2, attack_samples))
-            
-            envelope[pos:pos + attack_samples] = attack_curve
-            pos += attack_samples
-        
-        # Decay
-        if decay_samples > 0:
-            if curve_type == "linear":
-                decay_curve = np.linspace(1, sustain_level, decay_samples)
-            elif curve_type == "exponential":
-                decay_curve = sustain_level + (1 - sustain_level) * np.exp(-np.linspace(0, 3, decay_samples))
-            else:
-                decay_curve = np.linspace(1, sustain_level, decay_samples)
-            
-            envelope[pos:pos + decay_samples] = decay_curve
-            pos += decay_samples
-        
-        # Sustain
-        if sustain_samples > 0:
-            envelope[pos:pos + sustain_samples] = sustain_level
-            pos += sustain_samples
-        
-        # Release
-        if release_samples > 0:
-            if curve_type == "exponential":
-                release_curve = sustain_level * np.exp(-np.linspace(0, 5, release_samples))
-            else:
-                release_curve = sustain_level * np.cos(np.linspace(0, self.pi / 2, release_samples))
-            
-            envelope[pos:pos + release_samples] = release_curve
-        
-        return envelope
+        """Enveloppe ADSR avec différents types de courbes (tableau partagé, en lecture seule)"""
+        return _adsr_envelope(self.sample_rate, samples, attack_ms, decay_ms,
+                              sustain_level, release_ms, curve_type)
     
     def create_custom_envelope(self, samples: int, points: List[Tuple[float, float]]) -> np.ndarray:
         """
         Crée une enveloppe personnalisée à partir de points de contrôle
         points = [(time_ratio, amplitude), ...] où time_ratio est entre 0 et 1
         """
-        envelope = np.ones(samples)
+        envelope = np.ones(samples, dtype=_SAMPLE_DTYPE)
         
         if len(points) < 2:
             return envelope
@@ -241,29 +743,32 @@ class AdvancedSoundGenerator:
     def add_frequency_modulation(self, signal: np.ndarray, mod_frequency: float,
                                mod_depth: float, samples: int) -> np.ndarray:
         """Modulation de fréquence (vibrato)"""
-        t = np.linspace(0, samples / self.sample_rate, samples)
+        t = _time_base(self.sample_rate, samples)
         modulation = np.sin(2 * self.pi * mod_frequency * t) * mod_depth
         
-        # Application de la modulation via interpolation
+        # Application de la modulation via interpolation (hors bornes : signal d'origine)
         result = np.zeros_like(signal)
-        for i in range(samples):
-            mod_index = i + modulation[i]
-            if 0 <= mod_index < samples - 1:
-                # Interpolation linéaire
-                floor_idx = int(mod_index)
-                frac = mod_index - floor_idx
-                result[i] = signal[floor_idx] * (1 - frac) + signal[floor_idx + 1] * frac
-            else:
-                result[i] = signal[i]
+        result[:samples] = signal[:samples]
+        mod_index = np.arange(samples) + modulation
+        inside = np.flatnonzero((mod_index >= 0) & (mod_index < samples - 1))
+        self._interpolate_into(result, signal, inside, mod_index[inside])
         
         return result
     
+    @staticmethod
+    def _interpolate_into(result: np.ndarray, signal: np.ndarray, positions: np.ndarray,
+                          indices: np.ndarray):
+        """Écrit result[positions] = signal interpolé linéairement aux indices (positifs) fractionnaires"""
+        floor_idx = indices.astype(np.intp)
+        frac = indices - floor_idx
+        result[positions] = signal[floor_idx] * (1 - frac) + signal[floor_idx + 1] * frac
+    
     def add_amplitude_modulation(self, signal: np.ndarray, mod_frequency: float,
                                mod_depth: float, samples: int) -> np.ndarray:
         """Modulation d'amplitude (tremolo)"""
-        t = np.linspace(0, samples / self.sample_rate, samples)
+        t = _time_base(self.sample_rate, samples)
         modulation = 1 + mod_depth * np.sin(2 * self.pi * mod_frequency * t)
-        return signal * modulation
+        return np.multiply(signal, modulation, out=np.empty_like(signal))
     
     def add_turbulence(self, signal: np.ndarray, turbulence_config: Dict[str, Any]) -> np.ndarray:
         """
@@ -284,7 +789,10 @@ class AdvancedSoundGenerator:
         noise_type = turbulence_config.get("noise_type", "pink")
         noise_amount = turbulence_config.get("noise_amount", 0.1)
         if noise_amount > 0:
-            noise = self.generate_waveform(noise_type, 0, samples)
+            if self.noise_pool is not None and noise_type in NoisePool.NOISE_TYPES:
+                noise = self.noise_pool.get(noise_type, samples)  # Vue, sans copie
+            else:
+                noise = self.generate_waveform(noise_type, 0, samples)
             result += noise * noise_amount
         
         # Flutter (fluctuations rapides)
@@ -307,30 +815,14 @@ class AdvancedSoundGenerator:
         """Filtre passe-bas simple"""
         # Filtre IIR simple
         alpha = np.exp(-2 * self.pi * cutoff_freq / self.sample_rate)
-        result = np.zeros_like(signal)
-        result[0] = signal[0] * (1 - alpha)
-        
-        for i in range(1, len(signal)):
-            result[i] = alpha * result[i-1] + (1 - alpha) * signal[i]
-        
-        # Ajout de résonance
-        if resonance > 0:
-            # Feedback simple pour la résonance
-            for i in range(2, len(signal)):
-                result[i] += resonance * 0.3 * (result[i-1] - result[i-2])
         
-        return result
+        # Ajout de résonance : feedback simple sur la sortie filtrée
+        return _lowpass_kernel(signal, float(alpha), float(resonance))
     
     def apply_highpass_filter(self, signal: np.ndarray, cutoff_freq: float) -> np.ndarray:
         """Filtre passe-haut simple"""
         alpha = np.exp(-2 * self.pi * cutoff_freq / self.sample_rate)
-        result = np.zeros_like(signal)
-        result[0] = signal[0]
-        
-        for i in range(1, len(signal)):
-            result[i] = alpha * (result[i-1] + signal[i] - signal[i-1])
-        
-        return result
+        return _highpass_kernel(signal, float(alpha))
     
     def apply_bandpass_filter(self, signal: np.ndarray, low_freq: float, high_freq: float) -> np.ndarray:
         """Filtre passe-bande"""
@@ -342,16 +834,20 @@ class AdvancedSoundGenerator:
         """Filtre coupe-bande (notch)"""
         # Implémentation simple d'un filtre notch
         samples = len(signal)
-        t = np.linspace(0, samples / self.sample_rate, samples)
+        t = _time_base(self.sample_rate, samples)
         
         # Génération d'une sinusoïde à éliminer
         notch_signal = np.sin(2 * self.pi * notch_freq * t)
         
-        # Soustraction avec facteur Q
-        correlation = np.correlate(signal, notch_signal, mode='same')
+        # Soustraction avec facteur Q ; équivaut à np.correlate(signal, notch_signal,
+        # mode='same') mais en O(N log N) par FFT au lieu de O(N²)
+        fft_size = 1 << max(2 * samples - 2, 1).bit_length()
+        spectrum = np.fft.rfft(signal, fft_size) * np.fft.rfft(notch_signal[::-1], fft_size)
+        start = (samples - 1) // 2
+        correlation = np.fft.irfft(spectrum, fft_size)[start:start + samples]
         adjustment = correlation * notch_signal / (q_factor * len(signal))
         
-        return signal - adjustment[:len(signal)]
+        return np.subtract(signal, adjustment[:len(signal)], out=np.empty_like(signal))
     
     # ===== SYSTÈME D'EFFETS AVANCÉS =====
     
@@ -370,14 +866,12 @@ class AdvancedSoundGenerator:
         
         gains = [0.7, 0.5, 0.3, 0.2]
         
-        reverb_signal = np.zeros(samples + max(delays))
+        reverb_signal = np.zeros(samples + max(delays), dtype=signal.dtype)
         reverb_signal[:samples] = signal
         
         for delay, gain in zip(delays, gains):
             gain *= room_size
-            for i in range(samples):
-                if i + delay < len(reverb_signal):
-                    reverb_signal[i + delay] += signal[i] * gain * (1 - damping)
+            reverb_signal[delay:delay + samples] += signal * gain * (1 - damping)
         
         # Mixage wet/dry
         return signal * (1 - wet_level) + reverb_signal[:samples] * wet_level
@@ -388,17 +882,15 @@ class AdvancedSoundGenerator:
         delay_samples = int(delay_ms * self.sample_rate / 1000)
         samples = len(signal)
         
-        delayed_signal = np.zeros(samples + delay_samples)
+        delayed_signal = np.zeros(samples + delay_samples, dtype=signal.dtype)
         delayed_signal[:samples] = signal
         
+        # Feedback récursif (second écho), ajouté avant le premier comme dans l'ordre temporel
+        if samples > delay_samples:
+            delayed_signal[2 * delay_samples:] += signal[:samples - delay_samples] * feedback * feedback
+        
         # Application du feedback
-        for i in range(samples):
-            if i + delay_samples < len(delayed_signal):
-                delayed_signal[i + delay_samples] += signal[i] * feedback
-                
-                # Feedback récursif
-                if i + 2 * delay_samples < len(delayed_signal):
-                    delayed_signal[i + 2 * delay_samples] += signal[i] * feedback * feedback
+        delayed_signal[delay_samples:] += signal * feedback
         
         return signal * (1 - wet_level) + delayed_signal[:samples] * wet_level
     
@@ -406,22 +898,15 @@ class AdvancedSoundGenerator:
                     mix: float = 0.5) -> np.ndarray:
         """Effet de chorus"""
         samples = len(signal)
-        t = np.linspace(0, samples / self.sample_rate, samples)
+        t = _time_base(self.sample_rate, samples)
         
         # Modulation de délai variable
         modulation = depth * np.sin(2 * self.pi * rate * t)
         
-        chorus_signal = np.zeros_like(signal)
-        for i in range(samples):
-            delay_samples = modulation[i] * self.sample_rate
-            delayed_idx = i - delay_samples
-            
-            if 0 <= delayed_idx < samples - 1:
-                floor_idx = int(delayed_idx)
-                frac = delayed_idx - floor_idx
-                chorus_signal[i] = signal[floor_idx] * (1 - frac) + signal[floor_idx + 1] * frac
-            else:
-                chorus_signal[i] = signal[i]
+        chorus_signal = signal.copy()
+        delayed_idx = np.arange(samples) - modulation * self.sample_rate
+        inside = np.flatnonzero((delayed_idx >= 0) & (delayed_idx < samples - 1))
+        self._interpolate_into(chorus_signal, signal, inside, delayed_idx[inside])
         
         return signal * (1 - mix) + chorus_signal * mix
     
@@ -455,15 +940,59 @@ class AdvancedSoundGenerator:
             # Interpolation pour retrouver la taille originale
             crushed = np.interp(np.arange(len(signal)), 
                               np.arange(0, len(signal), sample_rate_reduction), 
-                              decimated)
+                              decimated).astype(signal.dtype)
         
         return crushed
     
     # ===== GÉNÉRATEUR PRINCIPAL ULTRA-COMPLET =====
     
-    def generate_advanced_sound(self, config: Dict[str, Any]) -> np.ndarray:
+    @staticmethod
+    def compile_config(config: Dict[str, Any]) -> CompiledPreset:
+        """Résout une fois les valeurs par défaut d'une config de generate_advanced_sound"""
+        modulation = config.get("modulation", {})
+        fm = None
+        if "fm_frequency" in modulation:
+            fm = (modulation["fm_frequency"], modulation.get("fm_depth", 0.1))
+        am = None
+        if "am_frequency" in modulation:
+            am = (modulation["am_frequency"], modulation.get("am_depth", 0.2))
+        
+        envelope_config = config.get("envelope", {})
+        envelope_points = None
+        if envelope_config.get("type") == "custom":
+            points = envelope_config.get("points", [(0, 0), (0.1, 1), (0.9, 0.7), (1, 0)])
+            envelope_points = np.array(points, dtype=np.float64).reshape(-1, 2)
+            envelope_points.setflags(write=False)
+        adsr = (
+            envelope_config.get("attack_ms", 10),
+            envelope_config.get("decay_ms", 100),
+            envelope_config.get("sustain_level", 0.7),
+            envelope_config.get("release_ms", 300),
+            envelope_config.get("curve_type", "exponential"),
+        )
+        
+        turbulence = config.get("turbulence", {})
+        
+        return CompiledPreset(
+            frequency=config.get("frequency", 440.0),
+            duration=config.get("duration", 1.0),
+            volume=config.get("volume", 0.7),
+            waveform=config.get("waveform", "sine"),
+            harmonics=_compile_partials(config.get("harmonics", []), "harmonic", 2, 0.5),
+            subharmonics=_compile_partials(config.get("subharmonics", []), "divisor", 2, 0.3),
+            fm=fm,
+            am=am,
+            turbulence=tuple(turbulence.items()) if turbulence else None,
+            filters=_compile_steps(config.get("filters", []), "lowpass", _FILTER_PARAMS),
+            envelope_points=envelope_points,
+            adsr=adsr,
+            effects=_compile_steps(config.get("effects", []), "reverb", _EFFECT_PARAMS),
+        )
+    
+    def generate_advanced_sound(self, config: Any) -> np.ndarray:
         """
         Générateur principal qui combine tous les éléments
+        config : dict (exemple ci-dessous) ou CompiledPreset issu de compile_config
         
         Exemple de config:
         {
@@ -513,122 +1042,65 @@ class AdvancedSoundGenerator:
         }
         """
         
-        # Paramètres de base
-        frequency = config.get("frequency", 440.0)
-        duration = config.get("duration", 1.0)
-        volume = config.get("volume", 0.7)
-        waveform = config.get("waveform", "sine")
+        if not isinstance(config, CompiledPreset):
+            config = self.compile_config(config)
         
-        samples = int(self.sample_rate * duration)
+        frequency = config.frequency
+        samples = int(self.sample_rate * config.duration)
         
         # 1. Génération de l'onde de base
-        signal = self.generate_waveform(waveform, frequency, samples)
+        signal = self.generate_waveform(config.waveform, frequency, samples)
         
         # 2. Ajout des harmoniques
-        harmonics_config = config.get("harmonics", [])
-        if harmonics_config:
-            signal = self.add_harmonics(signal, frequency, samples, harmonics_config)
+        if config.harmonics:
+            signal = self._add_harmonic_groups(signal, frequency, samples, config.harmonics)
         
         # 3. Ajout des sous-harmoniques
-        subharmonics_config = config.get("subharmonics", [])
-        if subharmonics_config:
-            signal = self.add_subharmonics(signal, frequency, samples, subharmonics_config)
+        if config.subharmonics:
+            signal = self._add_subharmonic_groups(signal, frequency, samples, config.subharmonics)
         
         # 4. Application des modulations
-        modulation = config.get("modulation", {})
-        if "fm_frequency" in modulation:
-            signal = self.add_frequency_modulation(
-                signal, modulation["fm_frequency"], 
-                modulation.get("fm_depth", 0.1), samples
-            )
-        if "am_frequency" in modulation:
-            signal = self.add_amplitude_modulation(
-                signal, modulation["am_frequency"], 
-                modulation.get("am_depth", 0.2), samples
-            )
+        if config.fm is not None:
+            signal = self.add_frequency_modulation(signal, config.fm[0], config.fm[1], samples)
+        if config.am is not None:
+            signal = self.add_amplitude_modulation(signal, config.am[0], config.am[1], samples)
         
         # 5. Ajout des turbulences
-        turbulence = config.get("turbulence", {})
-        if turbulence:
-            signal = self.add_turbulence(signal, turbulence)
+        if config.turbulence:
+            signal = self.add_turbulence(signal, dict(config.turbulence))
         
         # 6. Application des filtres
-        filters = config.get("filters", [])
-        for filter_config in filters:
-            filter_type = filter_config.get("type", "lowpass")
-            if filter_type == "lowpass":
-                signal = self.apply_lowpass_filter(
-                    signal, filter_config.get("cutoff", 1000),
-                    filter_config.get("resonance", 0.7)
-                )
-            elif filter_type == "highpass":
-                signal = self.apply_highpass_filter(
-                    signal, filter_config.get("cutoff", 100)
-                )
-            elif filter_type == "bandpass":
-                signal = self.apply_bandpass_filter(
-                    signal, filter_config.get("low_freq", 100),
-                    filter_config.get("high_freq", 1000)
-                )
-            elif filter_type == "notch":
-                signal = self.apply_notch_filter(
-                    signal, filter_config.get("notch_freq", 60),
-                    filter_config.get("q_factor", 10)
-                )
+        filter_methods = {
+            "lowpass": self.apply_lowpass_filter,
+            "highpass": self.apply_highpass_filter,
+            "bandpass": self.apply_bandpass_filter,
+            "notch": self.apply_notch_filter,
+        }
+        for filter_type, args in config.filters:
+            signal = filter_methods[filter_type](signal, *args)
         
         # 7. Application de l'enveloppe
-        envelope_config = config.get("envelope", {})
-        if envelope_config.get("type") == "custom":
-            points = envelope_config.get("points", [(0, 0), (0.1, 1), (0.9, 0.7), (1, 0)])
-            envelope = self.create_custom_envelope(samples, points)
+        if config.envelope_points is not None:
+            envelope = self.create_custom_envelope(samples, config.envelope_points)
         else:
             # Enveloppe ADSR par défaut
-            envelope = self.create_adsr_envelope(
-                samples,
-                envelope_config.get("attack_ms", 10),
-                envelope_config.get("decay_ms", 100),
-                envelope_config.get("sustain_level", 0.7),
-                envelope_config.get("release_ms", 300),
-                envelope_config.get("curve_type", "exponential")
-            )
+            envelope = self.create_adsr_envelope(samples, *config.adsr)
         
         signal *= envelope
         
         # 8. Application des effets
-        effects = config.get("effects", [])
-        for effect_config in effects:
-            effect_type = effect_config.get("type", "reverb")
-            if effect_type == "reverb":
-                signal = self.apply_reverb(
-                    signal, effect_config.get("room_size", 0.5),
-                    effect_config.get("damping", 0.5),
-                    effect_config.get("wet_level", 0.3)
-                )
-            elif effect_type == "delay":
-                signal = self.apply_delay(
-                    signal, effect_config.get("delay_ms", 125),
-                    effect_config.get("feedback", 0.3),
-                    effect_config.get("wet_level", 0.3)
-                )
-            elif effect_type == "chorus":
-                signal = self.apply_chorus(
-                    signal, effect_config.get("rate", 2.0),
-                    effect_config.get("depth", 0.02),
-                    effect_config.get("mix", 0.5)
-                )
-            elif effect_type == "distortion":
-                signal = self.apply_distortion(
-                    signal, effect_config.get("drive", 2.0),
-                    effect_config.get("tone", 0.5)
-                )
-            elif effect_type == "bitcrusher":
-                signal = self.apply_bitcrusher(
-                    signal, effect_config.get("bits", 8),
-                    effect_config.get("sample_rate_reduction", 1)
-                )
+        effect_methods = {
+            "reverb": self.apply_reverb,
+            "delay": self.apply_delay,
+            "chorus": self.apply_chorus,
+            "distortion": self.apply_distortion,
+            "bitcrusher": self.apply_bitcrusher,
+        }
+        for effect_type, args in config.effects:
+            signal = effect_methods[effect_type](signal, *args)
         
         # 9. Application du volume final
-        signal *= volume
+        signal *= config.volume
         
         # 10. Normalisation et limitation
         max_val = np.max(np.abs(signal))
@@ -639,175 +1111,35 @@ class AdvancedSoundGenerator:
     
     # ===== PRESETS DE SONS AVANCÉS =====
     
+    def _render_preset(self, name: str, frequency: float, duration: float, volume: float) -> np.ndarray:
+        """Génère le preset name (compilé une fois) à la fréquence, durée et volume demandés"""
+        preset = dataclasses.replace(_compiled_preset(name), frequency=frequency,
+                                     duration=duration, volume=volume)
+        return self.generate_advanced_sound(preset)
+    
     def satisfying_bounce(self, frequency: float, duration: float, volume: float = 0.6) -> np.ndarray:
         """Son de rebond satisfaisant avec le nouveau système"""
-        config = {
-            "frequency": frequency,
-            "duration": duration,
-            "volume": volume,
-            "waveform": "sine",
-            "harmonics": [
-                {"harmonic": 2, "amplitude": 0.3, "waveform": "sine"},
-                {"harmonic": 3, "amplitude": 0.15, "waveform": "triangle"}
-            ],
-            "envelope": {
-                "type": "adsr",
-                "attack_ms": 2,
-                "decay_ms": 50,
-                "sustain_level": 0.4,
-                "release_ms": 200,
-                "curve_type": "exponential"
-            },
-            "modulation": {
-                "fm_frequency": 8.0,
-                "fm_depth": 0.05
-            },
-            "turbulence": {
-                "noise_type": "pink",
-                "noise_amount": 0.02
-            },
-            "effects": [
-                {"type": "reverb", "room_size": 0.3, "wet_level": 0.2}
-            ]
-        }
-        return self.generate_advanced_sound(config)
+        return self._render_preset("satisfying_bounce", frequency, duration, volume)
 
     def asmr_pop(self, frequency: float = 300, duration: float = 0.2, volume: float = 0.5) -> np.ndarray:
         """Pop ASMR satisfaisant"""
-        config = {
-            "frequency": frequency,
-            "duration": duration,
-            "volume": volume,
-            "waveform": "sine",
-            "harmonics": [
-                {"harmonic": 1.5, "amplitude": 0.4, "waveform": "triangle"}
-            ],
-            "envelope": {
-                "type": "adsr",
-                "attack_ms": 0.5,
-                "decay_ms": 30,
-                "sustain_level": 0.1,
-                "release_ms": 60,
-                "curve_type": "exponential"
-            },
-            "turbulence": {
-                "noise_type": "pink",
-                "noise_amount": 0.15
-            },
-            "filters": [
-                {"type": "highpass", "cutoff": 150}
-            ]
-        }
-        return self.generate_advanced_sound(config)
+        return self._render_preset("asmr_pop", frequency, duration, volume)
 
     def soft_chime(self, frequency: float = 523, duration: float = 0.8, volume: float = 0.4) -> np.ndarray:
         """Carillon doux"""
-        config = {
-            "frequency": frequency,
-            "duration": duration,
-            "volume": volume,
-            "waveform": "sine",
-            "harmonics": [
-                {"harmonic": 2.4, "amplitude": 0.3, "waveform": "sine"},
-                {"harmonic": 3.8, "amplitude": 0.2, "waveform": "sine"},
-                {"harmonic": 5.2, "amplitude": 0.1, "waveform": "sine"}
-            ],
-            "envelope": {
-                "type": "adsr",
-                "attack_ms": 5,
-                "decay_ms": 200,
-                "sustain_level": 0.6,
-                "release_ms": 400,
-                "curve_type": "exponential"
-            },
-            "effects": [
-                {"type": "reverb", "room_size": 0.7, "wet_level": 0.4}
-            ]
-        }
-        return self.generate_advanced_sound(config)
+        return self._render_preset("soft_chime", frequency, duration, volume)
 
     def water_drop(self, frequency: float, duration: float, volume: float = 0.5) -> np.ndarray:
         """Goutte d'eau"""
-        config = {
-            "frequency": frequency,
-            "duration": duration,
-            "volume": volume,
-            "waveform": "sine",
-            "harmonics": [
-                {"harmonic": 2, "amplitude": 0.2, "waveform": "sine"}
-            ],
-            "envelope": {
-                "type": "custom",
-                "points": [(0, 0), (0.02, 1), (0.1, 0.3), (1, 0)]
-            },
-            "modulation": {
-                "fm_frequency": 12.0,
-                "fm_depth": 0.1
-            },
-            "filters": [
-                {"type": "bandpass", "low_freq": 200, "high_freq": 2000}
-            ],
-            "effects": [
-                {"type": "reverb", "room_size": 0.4, "wet_level": 0.3}
-            ]
-        }
-        return self.generate_advanced_sound(config)
+        return self._render_preset("water_drop", frequency, duration, volume)
 
     def gentle_pluck(self, frequency: float, duration: float, volume: float = 0.4) -> np.ndarray:
         """Pincement doux"""
-        config = {
-            "frequency": frequency,
-            "duration": duration,
-            "volume": volume,
-            "waveform": "triangle",
-            "harmonics": [
-                {"harmonic": 2, "amplitude": 0.3, "waveform": "sine"},
-                {"harmonic": 3, "amplitude": 0.2, "waveform": "triangle"}
-            ],
-            "envelope": {
-                "type": "adsr",
-                "attack_ms": 1,
-                "decay_ms": 150,
-                "sustain_level": 0.3,
-                "release_ms": 300,
-                "curve_type": "exponential"
-            },
-            "filters": [
-                {"type": "lowpass", "cutoff": 1500, "resonance": 0.3}
-            ]
-        }
-        return self.generate_advanced_sound(config)
+        return self._render_preset("gentle_pluck", frequency, duration, volume)
 
     def crystal_ting(self, frequency: float, duration: float, volume: float = 0.35) -> np.ndarray:
         """Tintement cristallin"""
-        config = {
-            "frequency": frequency,
-            "duration": duration,
-            "volume": volume,
-            "waveform": "sine",
-            "harmonics": [
-                {"harmonic": 2.1, "amplitude": 0.4, "waveform": "sine"},
-                {"harmonic": 3.3, "amplitude": 0.2, "waveform": "sine"},
-                {"harmonic": 4.7, "amplitude": 0.1, "waveform": "sine"}
-            ],
-            "envelope": {
-                "type": "adsr",
-                "attack_ms": 2,
-                "decay_ms": 300,
-                "sustain_level": 0.4,
-                "release_ms": 500,
-                "curve_type": "exponential"
-            },
-            "modulation": {
-                "am_frequency": 4.0,
-                "am_depth": 0.1
-            },
-            "effects": [
-                {"type": "reverb", "room_size": 0.8, "wet_level": 0.5},
-                {"type": "chorus", "rate": 0.7, "depth": 0.02, "mix": 0.3}
-            ]
-        }
-        return self.generate_advanced_sound(config)
+        return self._render_preset("crystal_ting", frequency, duration, volume)
     
     # Alias pour compatibilité
     def piano_note(self, frequency: float, duration: float = 0.5, volume: float = 0.7) -> np.ndarray:
@@ -0,0 +1,346 @@
+# physics_engine/collision/broadphase.py
+"""
+Noyaux vectorisés de phase large (grille spatiale sous forme de tableaux)
+"""
+import math
+from collections import defaultdict
+from typing import Set, Tuple
+import numpy as np
+
+from ..core.jit import njit, prange, NUMBA_AVAILABLE
+
+# CuPy est une dépendance optionnelle (phase large sur GPU)
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:
+    cp = None
+    CUPY_AVAILABLE = False
+
+def rasterize_boxes(boxes: np.ndarray, cell_size: float, cols: int, rows: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convertit des AABB en entrées (cellule, corps) de la grille en une seule passe vectorisée
+    
+    Args:
+        boxes: Tableau (N, 4) des boîtes (min_x, min_y, max_x, max_y)
+        cell_size: Taille d'une cellule
+        cols: Nombre de colonnes de la grille
+        rows: Nombre de lignes de la grille
+    
+    Returns:
+        (cell_keys, body_ids, min_col, min_row)
+    """
+    cells = np.floor_divide(boxes, cell_size)
+    min_col = np.clip(cells[:, 0], 0, cols - 1).astype(np.int32)
+    min_row = np.clip(cells[:, 1], 0, rows - 1).astype(np.int32)
+    max_col = np.clip(cells[:, 2], 0, cols - 1).astype(np.int32)
+    max_row = np.clip(cells[:, 3], 0, rows - 1).astype(np.int32)
+    
+    # Nombre de cellules couvertes par chaque corps
+    span_x = max_col - min_col + 1
+    cell_counts = span_x * (max_row - min_row + 1)
+    
+    # Rang de chaque entrée dans le rectangle de son corps
+    body_ids = np.repeat(np.arange(len(boxes), dtype=np.int32), cell_counts)
+    local = np.arange(len(body_ids)) - np.repeat(np.cumsum(cell_counts) - cell_counts, cell_counts)
+    span_x = span_x[body_ids]
+    
+    col = min_col[body_ids] + local % span_x
+    row = min_row[body_ids] + local // span_x
+    return col.astype(np.int64) * rows + row, body_ids, min_col, min_row
+
+@njit(parallel=True)
+def _cell_pairs_parallel(sorted_keys, sorted_bodies, starts, counts, offsets,
+                         min_col, min_row, rows, out_a, out_b, owned):
+    """Énumère les paires de chaque cellule, une cellule par thread"""
+    for c in prange(starts.shape[0]):
+        start = starts[c]
+        count = counts[c]
+        col = sorted_keys[start] // rows
+        row = sorted_keys[start] % rows
+        k = offsets[c]
+        for i in range(count):
+            a = sorted_bodies[start + i]
+            for j in range(i + 1, count):
+                b = sorted_bodies[start + j]
+                out_a[k] = min(a, b)
+                out_b[k] = max(a, b)
+                # La paire n'est émise que par la première cellule qu'elle partage
+                owned[k] = max(min_col[a], min_col[b]) == col and max(min_row[a], min_row[b]) == row
+                k += 1
+
+def _cell_pairs_numpy(sorted_keys: np.ndarray, sorted_bodies: np.ndarray, starts: np.ndarray, counts: np.ndarray,
+                      min_col: np.ndarray, min_row: np.ndarray, rows: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Énumère les paires de chaque cellule en NumPy pur (sans Numba)"""
+    # Rang de chaque entrée dans sa cellule et nombre de partenaires suivants
+    local = np.arange(len(sorted_bodies)) - np.repeat(starts, counts)
+    fanout = np.repeat(counts, counts) - 1 - local
+    
+    first = np.repeat(np.arange(len(sorted_bodies)), fanout)
+    group_start = np.cumsum(fanout) - fanout
+    second = first + 1 + (np.arange(len(first)) - np.repeat(group_start, fanout))
+    
+    a = sorted_bodies[first]
+    b = sorted_bodies[second]
+    
+    # La paire n'est émise que par la première cellule qu'elle partage
+    keys = sorted_keys[first]
+    owned = ((np.maximum(min_col[a], min_col[b]) == keys // rows) &
+             (np.maximum(min_row[a], min_row[b]) == keys % rows))
+    return np.minimum(a, b), np.maximum(a, b), owned
+
+def enumerate_cell_pairs(cell_keys: np.ndarray, body_ids: np.ndarray,
+                         min_col: np.ndarray, min_row: np.ndarray, rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Retourne les paires uniques (ia, ib), ia < ib, de corps partageant au moins une cellule
+    
+    Args:
+        cell_keys: Clé de cellule (col * rows + row) de chaque entrée (cellule, corps)
+        body_ids: Indice du corps de chaque entrée
+        min_col: Colonne minimale occupée par chaque corps
+        min_row: Ligne minimale occupée par chaque corps
+        rows: Nombre de lignes de la grille
+    """
+    empty = np.empty(0, dtype=np.int32)
+    if len(cell_keys) < 2:
+        return empty, empty
+    
+    # Regrouper les entrées par cellule
+    order = np.argsort(cell_keys, kind='stable')
+    sorted_keys = cell_keys[order]
+    sorted_bodies = body_ids[order].astype(np.int32)
+    _, counts = np.unique(sorted_keys, return_counts=True)
+    
+    # Ignorer les cellules ne contenant qu'un seul corps
+    occupied = np.repeat(counts > 1, counts)
+    sorted_keys = sorted_keys[occupied]
+    sorted_bodies = sorted_bodies[occupied]
+    counts = counts[counts > 1]
+    if len(counts) == 0:
+        return empty, empty
+    starts = np.cumsum(counts) - counts
+    
+    if NUMBA_AVAILABLE:
+        # Chaque cellule écrit dans sa propre tranche du tampon de sortie
+        pair_counts = counts * (counts - 1) // 2
+        offsets = np.cumsum(pair_counts) - pair_counts
+        total = int(pair_counts.sum())
+        out_a = np.empty(total, dtype=np.int32)
+        out_b = np.empty(total, dtype=np.int32)
+        owned = np.empty(total, dtype=np.bool_)
+        _cell_pairs_parallel(sorted_keys, sorted_bodies, starts, counts, offsets,
+                             min_col, min_row, rows, out_a, out_b, owned)
+    else:
+        out_a, out_b, owned = _cell_pairs_numpy(sorted_keys, sorted_bodies, starts, counts,
+                                                min_col, min_row, rows)
+    
+    return out_a[owned], out_b[owned]
+
+class SpatialHashGrid:
+    """Grille de hachage spatial non bornée (cellules hachées par XOR de nombres premiers)"""
+    
+    def __init__(self, cell_size: float = 100.0):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        
+        # Couche des corps immobiles, conservée d'une frame à l'autre
+        self.static_cells = defaultdict(list)
+    
+    def clear(self):
+        """Vide la grille (la couche statique est conservée)"""
+        self.cells.clear()
+    
+    def clear_static(self):
+        """Vide la couche des corps immobiles"""
+        self.static_cells.clear()
+    
+    def insert(self, index: int, aabb: Tuple[float, float, float, float], static: bool = False):
+        """Insère l'indice d'un corps dans toutes les cellules couvertes par son AABB"""
+        min_x, min_y, max_x, max_y = aabb
+        inv_cell = 1.0 / self.cell_size
+        min_ix = math.floor(min_x * inv_cell)
+        min_iy = math.floor(min_y * inv_cell)
+        max_ix = math.floor(max_x * inv_cell)
+        max_iy = math.floor(max_y * inv_cell)
+        
+        cells = self.static_cells if static else self.cells
+        for ix in range(min_ix, max_ix + 1):
+            hx = ix * 73856093
+            for iy in range(min_iy, max_iy + 1):
+                cells[hx ^ (iy * 19349663)].append(index)
+    
+    def query_pairs(self) -> Set[Tuple[int, int]]:
+        """Retourne les paires (i, j), i < j, partageant au moins une cellule
+        
+        Les paires entre deux corps de la couche statique ne sont pas retournées.
+        """
+        pairs = set()
+        static_cells = self.static_cells
+        for key, bucket in self.cells.items():
+            count = len(bucket)
+            # Les indices sont insérés dans l'ordre croissant : bucket est trié
+            for a in range(count - 1):
+                i = bucket[a]
+                for b in range(a + 1, count):
+                    j = bucket[b]
+                    if i != j:
+                        pairs.add((i, j))
+            
+            statics = static_cells.get(key)
+            if statics:
+                for i in bucket:
+                    for j in statics:
+                        pairs.add((i, j) if i < j else (j, i))
+        return pairs
+
+@njit(cache=True)
+def _insertion_sort_order(order, keys):
+    """Trie par insertion une permutation presque triée (cohérence d'une frame à l'autre)"""
+    for k in range(1, order.shape[0]):
+        index = order[k]
+        key = keys[index]
+        m = k - 1
+        while m >= 0 and keys[order[m]] > key:
+            order[m + 1] = order[m]
+            m -= 1
+        order[m + 1] = index
+    return order
+
+class SweepAndPrune:
+    """Balayage et élagage sur l'axe x, l'ordre de tri étant conservé entre deux frames"""
+    
+    def __init__(self):
+        self.order = None
+    
+    def query_pairs(self, min_x: np.ndarray, max_x: np.ndarray,
+                    min_y: np.ndarray, max_y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Retourne les indices (ia, ib), ia < ib, des AABB qui se chevauchent, triés"""
+        count = min_x.shape[0]
+        if self.order is not None and self.order.shape[0] == count and NUMBA_AVAILABLE:
+            order = _insertion_sort_order(self.order, min_x)
+        else:
+            order = np.argsort(min_x, kind='stable')
+        self.order = order
+        
+        # Balayage : chaque intervalle est actif jusqu'au premier min_x qui dépasse son max_x
+        sorted_min = min_x[order]
+        ends = np.searchsorted(sorted_min, max_x[order], side='left')
+        spans = np.maximum(ends - np.arange(count) - 1, 0)
+        total = int(spans.sum())
+        if total == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        
+        first = np.repeat(np.arange(count), spans)
+        offsets = np.cumsum(spans) - spans
+        second = first + 1 + np.arange(total) - np.repeat(offsets, spans)
+        ia = order[first]
+        ib = order[second]
+        
+        # Élagage sur l'axe y
+        keep = (min_y[ia] < max_y[ib]) & (min_y[ib] < max_y[ia])
+        ia, ib = np.minimum(ia[keep], ib[keep]), np.maximum(ia[keep], ib[keep])
+        pair_order = np.lexsort((ib, ia))
+        return ia[pair_order], ib[pair_order]
+
+# Noyaux CUDA : grille en listes chaînées (head/next) puis émission des paires voisines
+_GPU_KERNELS_SOURCE = r"""
+extern "C" {
+
+__global__ void build_cell_lists(const double* pos, int n, double cell_size, int cols, int rows,
+                                 int* cell_col, int* cell_row, int* head, int* next_cell) {
+    int i = blockDim.x * blockIdx.x + threadIdx.x;
+    if (i >= n) return;
+    
+    int col = min(max((int)floor(pos[2 * i] / cell_size), 0), cols - 1);
+    int row = min(max((int)floor(pos[2 * i + 1] / cell_size), 0), rows - 1);
+    cell_col[i] = col;
+    cell_row[i] = row;
+    next_cell[i] = atomicExch(&head[col * rows + row], i);
+}
+
+__global__ void emit_neighbor_pairs(const double* pos, const double* radius, int n, int cols, int rows,
+                                    const int* cell_col, const int* cell_row,
+                                    const int* head, const int* next_cell,
+                                    int* out_a, int* out_b, int* out_count, int capacity) {
+    int i = blockDim.x * blockIdx.x + threadIdx.x;
+    if (i >= n) return;
+    
+    for (int dc = -1; dc <= 1; ++dc) {
+        int col = cell_col[i] + dc;
+        if (col < 0 || col >= cols) continue;
+        for (int dr = -1; dr <= 1; ++dr) {
+            int row = cell_row[i] + dr;
+            if (row < 0 || row >= rows) continue;
+            for (int j = head[col * rows + row]; j != -1; j = next_cell[j]) {
+                if (j <= i) continue;
+                double reach = radius[i] + radius[j];
+                if (fabs(pos[2 * j] - pos[2 * i]) >= reach || fabs(pos[2 * j + 1] - pos[2 * i + 1]) >= reach) continue;
+                int k = atomicAdd(out_count, 1);
+                if (k < capacity) {
+                    out_a[k] = i;
+                    out_b[k] = j;
+                }
+            }
+        }
+    }
+}
+
+}
+"""
+
+_gpu_module = None
+
+def gpu_neighbor_pairs(positions, radii, cell_size: float, cols: int, rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Phase large sur GPU pour des cercles (nécessite CuPy)
+    
+    Chaque corps n'est inséré que dans la cellule de son centre : la taille de
+    cellule doit être au moins égale au plus grand diamètre.
+    
+    Args:
+        positions: Tableau (N, 2) des centres (CuPy ou NumPy)
+        radii: Tableau (N,) des rayons (CuPy ou NumPy)
+    
+    Returns:
+        Indices (ia, ib), ia < ib, des paires dont les AABB se chevauchent (tableaux NumPy)
+    """
+    global _gpu_module
+    if _gpu_module is None:
+        _gpu_module = cp.RawModule(code=_GPU_KERNELS_SOURCE)
+    build_cell_lists = _gpu_module.get_function('build_cell_lists')
+    emit_neighbor_pairs = _gpu_module.get_function('emit_neighbor_pairs')
+    
+    positions = cp.ascontiguousarray(cp.asarray(positions, dtype=cp.float64))
+    radii = cp.ascontiguousarray(cp.asarray(radii, dtype=cp.float64))
+    count = positions.shape[0]
+    block = 256
+    grid = ((count + block - 1) // block,)
+    
+    # Noyau 1 : listes chaînées par cellule
+    head = cp.full(cols * rows, -1, dtype=cp.int32)
+    next_cell = cp.empty(count, dtype=cp.int32)
+    cell_col = cp.empty(count, dtype=cp.int32)
+    cell_row = cp.empty(count, dtype=cp.int32)
+    build_cell_lists(grid, (block,), (positions, np.int32(count), np.float64(cell_size),
+                                      np.int32(cols), np.int32(rows), cell_col, cell_row, head, next_cell))
+    
+    # Noyau 2 : émission compactée, relancée avec plus de place si le tampon déborde
+    capacity = max(1024, 8 * count)
+    while True:
+        out_a = cp.empty(capacity, dtype=cp.int32)
+        out_b = cp.empty(capacity, dtype=cp.int32)
+        out_count = cp.zeros(1, dtype=cp.int32)
+        emit_neighbor_pairs(grid, (block,), (positions, radii, np.int32(count), np.int32(cols), np.int32(rows),
+                                             cell_col, cell_row, head, next_cell,
+                                             out_a, out_b, out_count, np.int32(capacity)))
+        pair_count = int(out_count.get()[0])
+        if pair_count <= capacity:
+            break
+        capacity = pair_count
+    
+    # Seules les paires sont relues ; tri pour un ordre déterministe
+    ia = cp.asnumpy(out_a[:pair_count])
+    ib = cp.asnumpy(out_b[:pair_count])
+    order = np.lexsort((ib, ia))
+    return ia[order], ib[order]
@@ -3,11 +3,14 @@
 Système de détection de collisions vectorielles avancé
 """
 import math
+from collections import defaultdict
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
+import numpy as np
 
 from ..core.vector import Vector2D
 from ..physics.body import PhysicsBody, Circle, Segment, Ring
+from .broadphase import enumerate_cell_pairs, rasterize_boxes, gpu_neighbor_pairs, CUPY_AVAILABLE
 
 @dataclass
 class CollisionInfo:
@@ -24,6 +27,74 @@ class CollisionInfo:
         if self.metadata is None:
             self.metadata = {}
 
+# Types de collision, indexés par CollisionBatch.type_tag
+COLLISION_TYPES = ('circle-circle', 'circle-segment', 'circle-ring', 'circle-circle-ccd')
+_COLLISION_TYPE_TAGS = {name: tag for tag, name in enumerate(COLLISION_TYPES)}
+
+class CollisionBatch:
+    """Lot de collisions stocké en tableaux (SoA)
+    
+    ia/ib indexent la liste bodies. Les CollisionInfo ne sont matérialisées
+    qu'à la demande (itération, indexation), typiquement pour les callbacks.
+    """
+    
+    def __init__(self, bodies: List[PhysicsBody], ia: np.ndarray, ib: np.ndarray,
+                 contact: np.ndarray, normal: np.ndarray, penetration: np.ndarray,
+                 type_tag: np.ndarray, metadata: Dict[int, Dict] = None,
+                 infos: List[CollisionInfo] = None):
+        self.bodies = bodies
+        self.ia = ia
+        self.ib = ib
+        self.contact = contact  # (K, 2)
+        self.normal = normal  # (K, 2), pointant de A vers B
+        self.penetration = penetration
+        self.type_tag = type_tag
+        self.metadata = metadata or {}  # indice -> métadonnées, seulement si présentes
+        self._infos = infos
+    
+    @classmethod
+    def from_collisions(cls, collisions: List[CollisionInfo]) -> 'CollisionBatch':
+        """Construit un lot à partir de CollisionInfo déjà matérialisées"""
+        count = len(collisions)
+        slots = {}
+        ia = np.fromiter((slots.setdefault(c.body_a, len(slots)) for c in collisions), np.int32, count)
+        ib = np.fromiter((slots.setdefault(c.body_b, len(slots)) for c in collisions), np.int32, count)
+        
+        contact = np.array([(c.contact_point.x, c.contact_point.y) for c in collisions],
+                           dtype=np.float64).reshape(count, 2)
+        normal = np.array([(c.normal.x, c.normal.y) for c in collisions], dtype=np.float64).reshape(count, 2)
+        penetration = np.fromiter((c.penetration for c in collisions), np.float64, count)
+        type_tag = np.fromiter((_COLLISION_TYPE_TAGS.get(c.collision_type, -1) for c in collisions),
+                               np.int8, count)
+        
+        return cls(list(slots), ia, ib, contact, normal, penetration, type_tag, infos=list(collisions))
+    
+    def __len__(self) -> int:
+        return len(self.ia)
+    
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+    
+    def __getitem__(self, k: int) -> CollisionInfo:
+        """Vue CollisionInfo de la k-ième collision (créée une seule fois)"""
+        if self._infos is None:
+            self._infos = [None] * len(self)
+        
+        info = self._infos[k]
+        if info is None:
+            info = CollisionInfo(
+                body_a=self.bodies[self.ia[k]],
+                body_b=self.bodies[self.ib[k]],
+                contact_point=Vector2D(*self.contact[k].tolist()),
+                normal=Vector2D(*self.normal[k].tolist()),
+                penetration=float(self.penetration[k]),
+                collision_type=COLLISION_TYPES[self.type_tag[k]],
+                metadata=self.metadata.get(k)
+            )
+            self._infos[k] = info
+        return info
+
 class SpatialGrid:
     """Grille spatiale pour optimiser la détection de collisions"""
     
@@ -33,11 +104,13 @@ class SpatialGrid:
         self.cell_size = cell_size
         self.cols = int(math.ceil(world_width / cell_size))
         self.rows = int(math.ceil(world_height / cell_size))
-        self.grid = {}
+        self.grid = defaultdict(list)  # clé de cellule (col * rows + row) -> corps
+        self.body_cells = {}  # corps -> clés des cellules occupées lors de la dernière insertion
         
     def clear(self):
         """Vide la grille"""
         self.grid.clear()
+        self.body_cells.clear()
     
     def _get_cell_coords(self, x: float, y: float) -> Tuple[int, int]:
         """Convertit les coordonnées monde en coordonnées de cellule"""
@@ -47,10 +120,10 @@ class SpatialGrid:
     
     def _get_cells_for_body(self, body: PhysicsBody) -> List[Tuple[int, int]]:
         """Retourne toutes les cellules occupées par un corps"""
-        min_pos, max_pos = body.get_bounding_box()
+        min_x, min_y, max_x, max_y = body.get_bounding_box_raw()
         
-        min_col, min_row = self._get_cell_coords(min_pos.x, min_pos.y)
-        max_col, max_row = self._get_cell_coords(max_pos.x, max_pos.y)
+        min_col, min_row = self._get_cell_coords(min_x, min_y)
+        max_col, max_row = self._get_cell_coords(max_x, max_y)
         
         cells = []
         for row in range(min_row, max_row + 1):
@@ -59,62 +132,151 @@ class SpatialGrid:
         
         return cells
     
+    def _get_cell_keys_for_body(self, body: PhysicsBody) -> List[int]:
+        """Retourne les clés entières (col * rows + row) des cellules occupées par un corps"""
+        min_x, min_y, max_x, max_y = body.get_bounding_box_raw()
+        
+        min_col, min_row = self._get_cell_coords(min_x, min_y)
+        max_col, max_row = self._get_cell_coords(max_x, max_y)
+        
+        rows = self.rows
+        return [col * rows + row
+                for row in range(min_row, max_row + 1)
+                for col in range(min_col, max_col + 1)]
+    
     def insert(self, body: PhysicsBody):
         """Insère un corps dans la grille"""
-        cells = self._get_cells_for_body(body)
-        for cell in cells:
-            if cell not in self.grid:
-                self.grid[cell] = []
-            self.grid[cell].append(body)
+        keys = self._get_cell_keys_for_body(body)
+        grid = self.grid
+        for key in keys:
+            grid[key].append(body)
+        self.body_cells[body] = keys
+    
+    def remove(self, body: PhysicsBody):
+        """Retire un corps de la grille"""
+        for key in self.body_cells.pop(body, ()):
+            cell_bodies = self.grid[key]
+            cell_bodies.remove(body)
+            if not cell_bodies:
+                del self.grid[key]
+    
+    def update(self, body: PhysicsBody):
+        """Réinsère un corps seulement si ses cellules ont changé"""
+        if self.body_cells.get(body) == self._get_cell_keys_for_body(body):
+            return
+        self.remove(body)
+        self.insert(body)
     
     def get_potential_collisions(self) -> List[Tuple[PhysicsBody, PhysicsBody]]:
         """Retourne les paires de corps potentiellement en collision"""
-        pairs = set()
+        body_cells = self.body_cells
+        rows = self.rows
         
-        for cell_bodies in self.grid.values():
+        for key, cell_bodies in self.grid.items():
+            col, row = divmod(key, rows)
+            
+            # Première cellule occupée par chaque corps
+            min_cells = [divmod(body_cells[body][0], rows) for body in cell_bodies]
+            
             for i in range(len(cell_bodies)):
+                min_col_a, min_row_a = min_cells[i]
                 for j in range(i + 1, len(cell_bodies)):
-                    body_a, body_b = cell_bodies[i], cell_bodies[j]
+                    min_col_b, min_row_b = min_cells[j]
                     
-                    # Éviter les doublons
-                    pair = (min(id(body_a), id(body_b)), max(id(body_a), id(body_b)))
-                    if pair not in pairs:
-                        pairs.add(pair)
-                        yield (body_a, body_b)
+                    # Éviter les doublons : seule la première cellule commune émet la paire
+                    if max(min_col_a, min_col_b) == col and max(min_row_a, min_row_b) == row:
+                        yield (cell_bodies[i], cell_bodies[j])
+    
+    def get_potential_pair_indices(self, bodies: List[PhysicsBody]) -> Tuple[np.ndarray, np.ndarray]:
+        """Retourne les indices (ia, ib) des paires potentielles, sans passer par le dict de cellules"""
+        boxes = np.empty((len(bodies), 4), dtype=np.float64)
+        for index, body in enumerate(bodies):
+            boxes[index] = body.get_bounding_box_raw()
+        
+        cell_keys, body_ids, min_col, min_row = rasterize_boxes(boxes, self.cell_size, self.cols, self.rows)
+        return enumerate_cell_pairs(cell_keys, body_ids, min_col, min_row, self.rows)
+    
+    def build_on_gpu(self, positions, radii) -> Tuple[np.ndarray, np.ndarray]:
+        """Construit la grille sur GPU et retourne les indices (ia, ib) des paires potentielles (CuPy requis)"""
+        return gpu_neighbor_pairs(positions, radii, self.cell_size, self.cols, self.rows)
 
 class CollisionDetector:
     """Détecteur de collisions principal"""
     
-    def __init__(self, use_spatial_optimization: bool = True, cell_size: float = 100.0):
+    def __init__(self, use_spatial_optimization: bool = True, cell_size: float = 100.0,
+                 use_gpu_broadphase: bool = False):
         self.use_spatial_optimization = use_spatial_optimization
         self.spatial_grid = None
         self.cell_size = cell_size
         
+        # Au-delà de ce nombre de corps, la phase large passe par les noyaux vectorisés
+        self.array_broadphase_threshold = 64
+        
+        # Phase large GPU (CuPy) pour les grandes scènes de cercles, sinon repli sur le CPU
+        self.use_gpu_broadphase = use_gpu_broadphase
+        self.gpu_broadphase_threshold = 5000
+        
         # Statistiques
         self.collision_checks = 0
         self.collisions_found = 0
         
+        # Cache de la dernière détection (réutilisé si aucun corps n'a bougé)
+        self._last_bodies = []
+        self._last_collisions = None
+        self._all_circles = False
+        
+        # Scène mixte : les anneaux sont testés en lot contre tous les cercles,
+        # hors phase large (leur boîte englobante couvre la plupart des cercles)
+        self._circles = []
+        self._rings = []
+        self._pair_bodies = []
+        
     def setup_spatial_grid(self, world_width: float, world_height: float):
         """Configure la grille spatiale"""
         if self.use_spatial_optimization:
             self.spatial_grid = SpatialGrid(world_width, world_height, self.cell_size)
     
-    def detect_collisions(self, bodies: List[PhysicsBody]) -> List[CollisionInfo]:
+    def detect_collisions(self, bodies: List[PhysicsBody]) -> CollisionBatch:
         """Détecte toutes les collisions entre les corps"""
+        same_bodies = len(bodies) == len(self._last_bodies) and all(
+            a is b for a, b in zip(bodies, self._last_bodies))
+        
+        # Aucun corps n'a bougé : le résultat précédent est toujours valide
+        if same_bodies and self._last_collisions is not None and not any(b._moved for b in bodies):
+            return self._last_collisions
+        if not same_bodies:
+            self._last_bodies = list(bodies)
+        
         self.collision_checks = 0
         self.collisions_found = 0
         collisions = []
         
-        if self.use_spatial_optimization and self.spatial_grid:
+        if not same_bodies:
+            self._all_circles = bool(bodies) and all(body.TAG == Circle.TAG for body in bodies)
+            self._circles = [body for body in bodies if body.TAG == Circle.TAG]
+            self._rings = [body for body in bodies if body.TAG == Ring.TAG] if self._circles else []
+            self._pair_bodies = [body for body in bodies if body.TAG != Ring.TAG] if self._rings else bodies
+        
+        if not self._all_circles and self._rings:
+            collisions.extend(self._detect_ring_collisions(self._circles, self._rings))
+            bodies = self._pair_bodies
+        
+        if self._all_circles:
+            # Scène homogène de cercles : une seule passe NumPy
+            batch = self._detect_circle_collisions(bodies)
+        elif self.use_spatial_optimization and self.spatial_grid:
             # Utiliser la grille spatiale
-            self.spatial_grid.clear()
-            
-            # Insérer tous les corps dans la grille
-            for body in bodies:
-                self.spatial_grid.insert(body)
+            if len(bodies) >= self.array_broadphase_threshold:
+                # Phase large vectorisée (grandes scènes)
+                self.spatial_grid.clear()
+                ia, ib = self.spatial_grid.get_potential_pair_indices(bodies)
+                candidates = ((bodies[i], bodies[j]) for i, j in zip(ia.tolist(), ib.tolist()))
+            else:
+                self._update_spatial_grid(bodies, same_bodies)
+                candidates = self.spatial_grid.get_potential_collisions()
             
             # Tester les paires potentielles
-            for body_a, body_b in self.spatial_grid.get_potential_collisions():
+            for body_a, body_b in candidates:
                 self.collision_checks += 1
                 collision = self._check_collision(body_a, body_b)
                 if collision:
@@ -136,27 +298,119 @@ class CollisionDetector:
                         collisions.append(collision)
                         self.collisions_found += 1
         
+        if not self._all_circles:
+            batch = CollisionBatch.from_collisions(collisions)
+        
+        for body in self._last_bodies:
+            body._moved = False
+        self._last_collisions = batch
+        
+        return batch
+    
+    def _detect_circle_collisions(self, circles: List[Circle]) -> CollisionBatch:
+        """Détection fusionnée pour une scène ne contenant que des cercles"""
+        count = len(circles)
+        x = np.fromiter((c.position.x for c in circles), np.float64, count)
+        y = np.fromiter((c.position.y for c in circles), np.float64, count)
+        radius = np.fromiter((c.radius for c in circles), np.float64, count)
+        
+        # Paires candidates
+        if self._can_use_gpu_broadphase(count, radius):
+            ia, ib = self.spatial_grid.build_on_gpu(np.column_stack((x, y)), radius)
+        elif self.use_spatial_optimization and self.spatial_grid:
+            ia, ib = self.spatial_grid.get_potential_pair_indices(circles)
+        else:
+            ia, ib = np.triu_indices(count, 1)
+            # Skip si les deux sont statiques
+            static = np.fromiter((c.static for c in circles), np.bool_, count)
+            dynamic_pair = ~(static[ia] & static[ib])
+            ia, ib = ia[dynamic_pair], ib[dynamic_pair]
+        self.collision_checks = len(ia)
+        
+        # Test de recouvrement sur toutes les paires à la fois
+        dx = x[ib] - x[ia]
+        dy = y[ib] - y[ia]
+        distance_sq = dx * dx + dy * dy
+        radius_sum = radius[ia] + radius[ib]
+        hits = np.flatnonzero((distance_sq < radius_sum * radius_sum) & (distance_sq > 0))
+        
+        ia, ib = ia[hits], ib[hits]
+        distance = np.sqrt(distance_sq[hits])
+        normal = np.column_stack((dx[hits] / distance, dy[hits] / distance))
+        penetration = radius_sum[hits] - distance
+        contact = np.column_stack((x[ia], y[ia])) + normal * radius[ia][:, None]
+        self.collisions_found = len(hits)
+        
+        # Compacter les indices sur les seuls cercles impliqués
+        involved, inverse = np.unique(np.concatenate((ia, ib)), return_inverse=True)
+        inverse = inverse.astype(np.int32)
+        
+        return CollisionBatch([circles[i] for i in involved.tolist()], inverse[:len(hits)], inverse[len(hits):],
+                              contact, normal, penetration,
+                              np.full(len(hits), _COLLISION_TYPE_TAGS['circle-circle'], dtype=np.int8))
+    
+    def _detect_ring_collisions(self, circles: List[Circle], rings: List[Ring]) -> List[CollisionInfo]:
+        """Collisions cercle-anneau, chaque anneau testé contre tous les cercles en une passe NumPy"""
+        count = len(circles)
+        x = np.fromiter((c.position.x for c in circles), np.float64, count)
+        y = np.fromiter((c.position.y for c in circles), np.float64, count)
+        radius = np.fromiter((c.radius for c in circles), np.float64, count)
+        
+        collisions = []
+        for ring in rings:
+            self.collision_checks += count
+            indices, normal, penetration, contact, outer = ring.collision_with_circles(x, y, radius)
+            
+            # Seuls les contacts sont matérialisés
+            for i, (nx, ny), pen, (px, py), is_outer in zip(indices.tolist(), normal.tolist(),
+                                                            penetration.tolist(), contact.tolist(),
+                                                            outer.tolist()):
+                collisions.append(CollisionInfo(
+                    body_a=circles[i],
+                    body_b=ring,
+                    contact_point=Vector2D(px, py),
+                    normal=Vector2D(nx, ny),
+                    penetration=pen,
+                    collision_type='circle-ring',
+                    metadata={'ring_collision_type': 'outer' if is_outer else 'inner'}
+                ))
+        
+        self.collisions_found += len(collisions)
         return collisions
     
+    def _can_use_gpu_broadphase(self, count: int, radius: np.ndarray) -> bool:
+        """La phase large GPU n'insère que les centres : les cellules doivent couvrir le plus grand diamètre"""
+        return (self.use_gpu_broadphase and CUPY_AVAILABLE
+                and self.use_spatial_optimization and self.spatial_grid is not None
+                and count >= self.gpu_broadphase_threshold
+                and 2 * radius.max() <= self.spatial_grid.cell_size)
+    
+    def _update_spatial_grid(self, bodies: List[PhysicsBody], same_bodies: bool):
+        """Met à jour la grille spatiale (incrémentale si les corps sont les mêmes)"""
+        if same_bodies and len(self.spatial_grid.body_cells) == len(bodies):
+            # Ne réinsérer que les corps déplacés
+            for body in bodies:
+                if body._moved:
+                    self.spatial_grid.update(body)
+        else:
+            self.spatial_grid.clear()
+            
+            # Insérer tous les corps dans la grille
+            for body in bodies:
+                self.spatial_grid.insert(body)
+    
     def _check_collision(self, body_a: PhysicsBody, body_b: PhysicsBody) -> Optional[CollisionInfo]:
         """Vérifie la collision entre deux corps spécifiques"""
-        # Détermine le type de collision
-        type_a = type(body_a).__name__
-        type_b = type(body_b).__name__
+        # Dispatch sur les tags entiers de type
+        entry = _COLLISION_DISPATCH.get((body_a.TAG << 3) | body_b.TAG)
+        if entry is None:
+            return None
         
         # Organiser pour avoir des fonctions symétriques
-        if (type_a, type_b) in [('Circle', 'Circle')]:
-            return self._circle_circle_collision(body_a, body_b)
-        elif (type_a, type_b) == ('Circle', 'Segment') or (type_a, type_b) == ('Segment', 'Circle'):
-            circle = body_a if type_a == 'Circle' else body_b
-            segment = body_a if type_a == 'Segment' else body_b
-            return self._circle_segment_collision(circle, segment)
-        elif (type_a, type_b) == ('Circle', 'Ring') or (type_a, type_b) == ('Ring', 'Circle'):
-            circle = body_a if type_a == 'Circle' else body_b
-            ring = body_a if type_a == 'Ring' else body_b
-            return self._circle_ring_collision(circle, ring)
-        
-        return None
+        handler, swap = entry
+        if swap:
+            return handler(self, body_b, body_a)
+        return handler(self, body_a, body_b)
     
     def _circle_circle_collision(self, circle_a: Circle, circle_b: Circle) -> Optional[CollisionInfo]:
         """Collision entre deux cercles"""
@@ -165,7 +419,7 @@ class CollisionDetector:
         
         if distance < radius_sum and distance > 0:
             # Collision détectée
-            normal = (circle_b.position - circle_a.position).normalized
+            normal = (circle_b.position - circle_a.position).normalize()
             penetration = radius_sum - distance
             contact_point = circle_a.position + normal * circle_a.radius
             
@@ -182,14 +436,18 @@ class CollisionDetector:
     
     def _circle_segment_collision(self, circle: Circle, segment: Segment) -> Optional[CollisionInfo]:
         """Collision entre un cercle et un segment"""
-        # Trouver le point le plus proche sur le segment
-        closest_point = segment.closest_point_on_segment(circle.position)
-        distance = circle.position.distance_to(closest_point)
+        # Trouver le point le plus proche sur le segment (flottants, Vector2D seulement au contact)
+        px = circle.position.x
+        py = circle.position.y
+        cx, cy = segment._closest_point_xy(px, py)
+        dx = px - cx
+        dy = py - cy
+        distance = math.hypot(dx, dy)
         
         if distance < circle.radius + segment.thickness / 2:
             # Collision détectée
             if distance > 0:
-                normal = (circle.position - closest_point).normalized
+                normal = Vector2D(dx / distance, dy / distance)
             else:
                 # Si le centre du cercle est exactement sur le segment
                 normal = segment.get_normal()
@@ -199,7 +457,7 @@ class CollisionDetector:
             return CollisionInfo(
                 body_a=circle,
                 body_b=segment,
-                contact_point=closest_point,
+                contact_point=Vector2D(cx, cy),
                 normal=normal,
                 penetration=penetration,
                 collision_type='circle-segment'
@@ -224,6 +482,15 @@ class CollisionDetector:
         
         return None
 
+# Table de dispatch : (tag_a << 3) | tag_b -> (méthode, arguments inversés)
+_COLLISION_DISPATCH = {
+    (Circle.TAG << 3) | Circle.TAG: (CollisionDetector._circle_circle_collision, False),
+    (Circle.TAG << 3) | Segment.TAG: (CollisionDetector._circle_segment_collision, False),
+    (Segment.TAG << 3) | Circle.TAG: (CollisionDetector._circle_segment_collision, True),
+    (Circle.TAG << 3) | Ring.TAG: (CollisionDetector._circle_ring_collision, False),
+    (Ring.TAG << 3) | Circle.TAG: (CollisionDetector._circle_ring_collision, True),
+}
+
 class ContinuousCollisionDetector:
     """Détecteur de collisions continues (CCD) pour éviter le tunneling"""
     
@@ -233,85 +500,64 @@ class ContinuousCollisionDetector:
     
     def detect_continuous_collision(self, body_a: PhysicsBody, body_b: PhysicsBody, dt: float) -> Optional[CollisionInfo]:
         """Détecte les collisions continues entre deux corps en mouvement"""
-        if isinstance(body_a, Circle) and isinstance(body_b, Circle):
+        if body_a.TAG == Circle.TAG and body_b.TAG == Circle.TAG:
             return self._circle_circle_ccd(body_a, body_b, dt)
         
         return None
     
     def _circle_circle_ccd(self, circle_a: Circle, circle_b: Circle, dt: float) -> Optional[CollisionInfo]:
-        """CCD pour deux cercles"""
-        # Calculer les positions finales
-        final_pos_a = circle_a.position + circle_a.velocity * dt
-        final_pos_b = circle_b.position + circle_b.velocity * dt
-        
-        # Vérifier la collision à t=0
-        initial_distance = circle_a.position.distance_to(circle_b.position)
+        """CCD pour deux cercles
+        
+        Dans le repère relatif, le temps d'impact est la plus petite racine de
+        |d + v t|² = (ra + rb)², avec d et v la position et la vitesse relatives.
+        """
+        dx = circle_a.position.x - circle_b.position.x
+        dy = circle_a.position.y - circle_b.position.y
+        vx = circle_a.velocity.x - circle_b.velocity.x
+        vy = circle_a.velocity.y - circle_b.velocity.y
         radius_sum = circle_a.radius + circle_b.radius
         
-        if initial_distance < radius_sum:
+        a = vx * vx + vy * vy
+        b = 2 * (dx * vx + dy * vy)
+        c = dx * dx + dy * dy - radius_sum * radius_sum
+        
+        if c < 0:
             # Déjà en collision
             return None
         
-        # Vérifier la collision à t=dt
-        final_distance = final_pos_a.distance_to(final_pos_b)
-        
-        if final_distance >= radius_sum:
-            # Pas de collision
+        discriminant = b * b - 4 * a * c
+        if a == 0 or discriminant < 0:
+            # Pas de mouvement relatif ou trajectoires qui ne se croisent pas
             return None
         
-        # Il y a une collision quelque part dans l'intervalle
-        # Utiliser la recherche dichotomique pour trouver le temps de collision
-        t_collision = self._binary_search_collision_time(circle_a, circle_b, dt, radius_sum)
-        
-        if t_collision is not None:
-            # Calculer les positions au moment de la collision
-            pos_a_collision = circle_a.position + circle_a.velocity * t_collision
-            pos_b_collision = circle_b.position + circle_b.velocity * t_collision
-            
-            normal = (pos_b_collision - pos_a_collision).normalized
-            contact_point = pos_a_collision + normal * circle_a.radius
-            
-            return CollisionInfo(
-                body_a=circle_a,
-                body_b=circle_b,
-                contact_point=contact_point,
-                normal=normal,
-                penetration=0.0,  # Collision exacte
-                collision_type='circle-circle-ccd',
-                metadata={'collision_time': t_collision}
-            )
-        
-        return None
-    
-    def _binary_search_collision_time(self, circle_a: Circle, circle_b: Circle, dt: float, radius_sum: float) -> Optional[float]:
-        """Recherche dichotomique du temps de collision"""
-        t_min = 0.0
-        t_max = dt
-        tolerance = 1e-6
-        max_iterations = 20
-        
-        for _ in range(max_iterations):
-            t_mid = (t_min + t_max) / 2
-            
-            pos_a = circle_a.position + circle_a.velocity * t_mid
-            pos_b = circle_b.position + circle_b.velocity * t_mid
-            distance = pos_a.distance_to(pos_b)
-            
-            if abs(distance - radius_sum) < tolerance:
-                return t_mid
-            
-            if distance > radius_sum:
-                t_min = t_mid
-            else:
-                t_max = t_mid
-            
-            if t_max - t_min < tolerance:
-                break
+        t_collision = (-b - math.sqrt(discriminant)) / (2 * a)
+        if not 0 <= t_collision <= dt:
+            return None
         
-        return (t_min + t_max) / 2
+        # Calculer les positions au moment de la collision
+        pos_a_collision = circle_a.position + circle_a.velocity * t_collision
+        pos_b_collision = circle_b.position + circle_b.velocity * t_collision
+        
+        normal = (pos_b_collision - pos_a_collision).normalize()
+        contact_point = pos_a_collision + normal * circle_a.radius
+        
+        return CollisionInfo(
+            body_a=circle_a,
+            body_b=circle_b,
+            contact_point=contact_point,
+            normal=normal,
+            penetration=0.0,  # Collision exacte
+            collision_type='circle-circle-ccd',
+            metadata={'collision_time': t_collision}
+        )
 
 class QuadTree:
-    """Quadtree pour optimisation spatiale avancée"""
+    """Quadtree pour optimisation spatiale avancée
+    
+    Les nœuds sont stockés dans des tableaux plats selon une disposition implicite :
+    les enfants du nœud k sont 4k+1 .. 4k+4 (quadrant = droite | bas << 1).
+    L'arbre est reconstruit en entier à la première requête après des insertions.
+    """
     
     def __init__(self, bounds: Tuple[float, float, float, float], max_objects: int = 10, max_levels: int = 5, level: int = 0):
         self.bounds = bounds  # (x, y, width, height)
@@ -319,84 +565,144 @@ class QuadTree:
         self.max_levels = max_levels
         self.level = level
         self.objects = []
-        self.nodes = []
+        
+        # Profondeur et nombre de nœuds de l'arbre complet
+        self.depth = max(0, max_levels - level)
+        self.node_count = (4 ** (self.depth + 1) - 1) // 3
+        
+        # Bornes (x, y, width, height) de chaque nœud
+        self.node_bounds = np.empty((self.node_count, 4), dtype=np.float64)
+        self.node_bounds[0] = bounds
+        for k in range(1, self.node_count):
+            x, y, width, height = self.node_bounds[(k - 1) // 4]
+            quadrant = (k - 1) % 4
+            self.node_bounds[k] = (x + (quadrant & 1) * width / 2, y + (quadrant >> 1) * height / 2,
+                                   width / 2, height / 2)
+        
+        # État de l'arbre construit
+        self.node_split = np.zeros(self.node_count, dtype=np.bool_)
+        self.node_obj_start = np.zeros(self.node_count, dtype=np.int32)
+        self.node_obj_count = np.zeros(self.node_count, dtype=np.int32)
+        self.objects_flat = np.empty(0, dtype=np.int32)
+        self._dirty = False
     
     def clear(self):
         """Vide le quadtree"""
         self.objects.clear()
-        for node in self.nodes:
-            node.clear()
-        self.nodes.clear()
-    
-    def split(self):
-        """Divise le nœud en 4 sous-nœuds"""
-        x, y, width, height = self.bounds
-        sub_width = width / 2
-        sub_height = height / 2
-        
-        # Créer les 4 quadrants
-        self.nodes = [
-            QuadTree((x + sub_width, y, sub_width, sub_height), self.max_objects, self.max_levels, self.level + 1),  # NE
-            QuadTree((x, y, sub_width, sub_height), self.max_objects, self.max_levels, self.level + 1),              # NW
-            QuadTree((x, y + sub_height, sub_width, sub_height), self.max_objects, self.max_levels, self.level + 1), # SW
-            QuadTree((x + sub_width, y + sub_height, sub_width, sub_height), self.max_objects, self.max_levels, self.level + 1)  # SE
-        ]
-    
-    def get_index(self, body: PhysicsBody) -> int:
-        """Détermine dans quel quadrant placer l'objet"""
-        x, y, width, height = self.bounds
+        self.node_split[:] = False
+        self.node_obj_count[:] = 0
+        self.objects_flat = np.empty(0, dtype=np.int32)
+        self._dirty = False
+    
+    def get_index(self, body: PhysicsBody, node: int = 0) -> int:
+        """Détermine dans quel quadrant du nœud placer l'objet"""
+        return self._get_quadrant(body.get_bounding_box_raw(), node)
+    
+    def _get_quadrant(self, aabb: Tuple[float, float, float, float], node: int) -> int:
+        """Quadrant (droite | bas << 1) contenant la boîte, ou -1 si elle chevauche les médianes"""
+        x, y, width, height = self.node_bounds[node]
         vertical_midpoint = x + width / 2
         horizontal_midpoint = y + height / 2
         
-        min_pos, max_pos = body.get_bounding_box()
-        
-        # L'objet peut tenir complètement dans le quadrant supérieur
-        top_quadrant = min_pos.y < horizontal_midpoint and max_pos.y < horizontal_midpoint
-        # L'objet peut tenir complètement dans le quadrant inférieur
-        bottom_quadrant = min_pos.y > horizontal_midpoint
-        
-        # L'objet peut tenir complètement dans le quadrant gauche
-        if min_pos.x < vertical_midpoint and max_pos.x < vertical_midpoint:
-            if top_quadrant:
-                return 1  # NW
-            elif bottom_quadrant:
-                return 2  # SW
-        # L'objet peut tenir complètement dans le quadrant droit
-        elif min_pos.x > vertical_midpoint:
-            if top_quadrant:
-                return 0  # NE
-            elif bottom_quadrant:
-                return 3  # SE
+        min_x, min_y, max_x, max_y = aabb
+        right = min_x > vertical_midpoint
+        bottom = min_y > horizontal_midpoint
+        fits_x = right or max_x < vertical_midpoint
+        fits_y = bottom or max_y < horizontal_midpoint
         
+        if fits_x and fits_y:
+            return int(right) | (int(bottom) << 1)
         return -1  # L'objet ne peut pas tenir dans un quadrant spécifique
     
     def insert(self, body: PhysicsBody):
         """Insère un objet dans le quadtree"""
-        if self.nodes:
-            index = self.get_index(body)
-            if index != -1:
-                self.nodes[index].insert(body)
-                return
-        
         self.objects.append(body)
-        
-        if len(self.objects) > self.max_objects and self.level < self.max_levels:
-            if not self.nodes:
-                self.split()
-            
-            i = 0
-            while i < len(self.objects):
-                index = self.get_index(self.objects[i])
-                if index != -1:
-                    obj = self.objects.pop(i)
-                    self.nodes[index].insert(obj)
-                else:
-                    i += 1
+        self._dirty = True
+    
+    def _build(self):
+        """Reconstruit tout l'arbre dans les tableaux plats"""
+        count = len(self.objects)
+        boxes = np.empty((count, 4), dtype=np.float64)
+        for i, body in enumerate(self.objects):
+            boxes[i] = body.get_bounding_box_raw()
+        
+        # Chemin de chaque objet : nœud le plus profond qui le contient à chaque niveau
+        paths = np.zeros((self.depth + 1, count), dtype=np.int32)
+        reach = np.zeros(count, dtype=np.int32)
+        node = paths[0].copy()
+        active = np.ones(count, dtype=np.bool_)
+        for level in range(self.depth):
+            x, y, width, height = self.node_bounds[node].T
+            mid_x = x + width / 2
+            mid_y = y + height / 2
+            right = boxes[:, 0] > mid_x
+            bottom = boxes[:, 1] > mid_y
+            active &= (right | (boxes[:, 2] < mid_x)) & (bottom | (boxes[:, 3] < mid_y))
+            node = np.where(active, 4 * node + 1 + (right | (bottom << 1)), node)
+            reach += active
+            paths[level + 1] = node
+        
+        # Descente niveau par niveau : un nœud se divise s'il dépasse max_objects
+        self.node_split[:] = False
+        assigned = np.zeros(count, dtype=np.int32)
+        assigned_level = np.zeros(count, dtype=np.int32)
+        for level in range(self.depth):
+            here = assigned_level == level
+            load = np.bincount(assigned[here], minlength=self.node_count)
+            self.node_split |= load > self.max_objects
+            move = here & self.node_split[assigned] & (reach > level)
+            assigned[move] = paths[level + 1][move]
+            assigned_level[move] = level + 1
+        
+        # Objets regroupés par nœud
+        self.objects_flat = np.argsort(assigned, kind='stable').astype(np.int32)
+        self.node_obj_count = np.bincount(assigned, minlength=self.node_count).astype(np.int32)
+        self.node_obj_start = (np.cumsum(self.node_obj_count) - self.node_obj_count).astype(np.int32)
+        self._dirty = False
     
     def retrieve(self, return_objects: List[PhysicsBody], body: PhysicsBody):
         """Récupère tous les objets qui pourraient entrer en collision avec l'objet donné"""
-        index = self.get_index(body)
-        if index != -1 and self.nodes:
-            self.nodes[index].retrieve(return_objects, body)
+        return_objects.extend(self.objects[index] for index in self._retrieve_indices(body))
+        return return_objects
+    
+    def _retrieve_indices(self, body: PhysicsBody) -> List[int]:
+        """Indices des objets stockés sur le chemin de l'objet donné"""
+        if self._dirty:
+            self._build()
+        
+        indices = []
+        aabb = body.get_bounding_box_raw()
+        node = 0
+        while True:
+            start = self.node_obj_start[node]
+            indices.extend(self.objects_flat[start:start + self.node_obj_count[node]].tolist())
+            
+            if not self.node_split[node]:
+                break
+            quadrant = self._get_quadrant(aabb, node)
+            if quadrant == -1:
+                break
+            node = 4 * node + 1 + quadrant
         
-        return_objects.extend(self.objects)
\ No newline at end of file
+        return indices
+    
+    def get_potential_collisions(self) -> List[Tuple[PhysicsBody, PhysicsBody]]:
+        """Retourne les paires uniques d'objets potentiellement en collision
+        
+        Chaque paire (i, j), i < j, est retrouvée depuis les deux objets : un bitset
+        plat indexé par le rang triangulaire de la paire évite les doublons sans hachage.
+        """
+        count = len(self.objects)
+        seen = bytearray((count * (count - 1) // 2 >> 3) + 1)
+        
+        for i, body in enumerate(self.objects):
+            for j in self._retrieve_indices(body):
+                if j == i:
+                    continue
+                a, b = (i, j) if i < j else (j, i)
+                index = a * count - a * (a + 1) // 2 + (b - a - 1)
+                byte = index >> 3
+                bit = 1 << (index & 7)
+                if not seen[byte] & bit:
+                    seen[byte] |= bit
+                    yield (self.objects[a], self.objects[b])
@@ -2,9 +2,14 @@
 """
 Résolveur de collisions avec différentes stratégies
 """
-from typing import List
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union
+import numpy as np
+
 from ..core.vector import Vector2D
-from .detector import CollisionInfo
+from .detector import CollisionBatch, CollisionInfo
 
 class CollisionResolver:
     """Résolveur de collisions principal"""
@@ -14,10 +19,143 @@ class CollisionResolver:
         self.position_correction_factor = 0.8
         self.velocity_threshold = 0.01
         
-    def resolve_collisions(self, collisions: List[CollisionInfo], dt: float):
-        """Résout toutes les collisions"""
-        for collision in collisions:
-            self.resolve_collision(collision, dt)
+        # Découpage des grandes classes de couleur sur plusieurs threads
+        self.parallel_batch_size = 4096
+        self.max_workers = os.cpu_count() or 1
+        self._executor = None
+        
+    def resolve_collisions(self, collisions: Union[CollisionBatch, List[CollisionInfo]], dt: float):
+        """Résout toutes les collisions par passes vectorisées
+        
+        Les collisions sont colorées de sorte qu'une même classe ne partage aucun
+        corps dynamique : chaque classe est résolue d'un bloc (schéma de Jacobi),
+        et les classes s'enchaînent en voyant les vitesses mises à jour.
+        """
+        if not len(collisions):
+            return
+        
+        batch = collisions if isinstance(collisions, CollisionBatch) else CollisionBatch.from_collisions(collisions)
+        bodies = batch.bodies
+        ia = batch.ia
+        ib = batch.ib
+        normal = batch.normal
+        penetration = batch.penetration
+        
+        # Propriétés des corps impliqués (SoA)
+        pos = np.array([(b.position.x, b.position.y) for b in bodies], dtype=np.float64)
+        vel = np.array([(b.velocity.x, b.velocity.y) for b in bodies], dtype=np.float64)
+        inv_mass = np.array([b.inv_mass for b in bodies], dtype=np.float64)
+        restitution = np.array([b.restitution for b in bodies], dtype=np.float64)
+        friction = np.array([b.friction for b in bodies], dtype=np.float64)
+        
+        colors = self._color_collisions(ia, ib, (inv_mass > 0).tolist())
+        order = np.argsort(colors, kind='stable')
+        bounds = np.cumsum(np.bincount(colors)).tolist()
+        
+        start = 0
+        for end in bounds:
+            chunk = order[start:end]
+            self._resolve_color_class(pos, vel, inv_mass, restitution, friction,
+                                      ia[chunk], ib[chunk], normal[chunk], penetration[chunk])
+            start = end
+        
+        # Écriture des résultats sur les corps dynamiques
+        for body, (px, py), (vx, vy) in zip(bodies, pos.tolist(), vel.tolist()):
+            if not body.static:
+                if body.position.x != px or body.position.y != py:
+                    body.position.x, body.position.y = px, py
+                    body.invalidate_aabb()
+                body.velocity.x, body.velocity.y = vx, vy
+        
+        # Callbacks de collision (hors du noyau vectorisé, CollisionInfo créées à la demande)
+        has_callback = np.array([b.on_collision is not None for b in bodies], dtype=np.bool_)
+        if has_callback.any():
+            for k in np.flatnonzero(has_callback[ia] | has_callback[ib]).tolist():
+                collision = batch[k]
+                if collision.body_a.on_collision:
+                    collision.body_a.on_collision(collision.body_a, collision.body_b, collision)
+                if collision.body_b.on_collision:
+                    collision.body_b.on_collision(collision.body_b, collision.body_a, collision)
+    
+    def _color_collisions(self, ia: np.ndarray, ib: np.ndarray, dynamic: List[bool]) -> np.ndarray:
+        """Coloration gloutonne : deux collisions partageant un corps dynamique ont des couleurs différentes
+        
+        Les corps statiques ne sont jamais modifiés et ne créent donc pas de conflit.
+        """
+        body_colors = [0] * len(dynamic)  # masque des couleurs déjà utilisées par corps
+        colors = []
+        for a, b in zip(ia.tolist(), ib.tolist()):
+            used = (body_colors[a] if dynamic[a] else 0) | (body_colors[b] if dynamic[b] else 0)
+            color = (~used & (used + 1)).bit_length() - 1  # plus petite couleur libre
+            colors.append(color)
+            body_colors[a] |= 1 << color
+            body_colors[b] |= 1 << color
+        return np.array(colors, dtype=np.int32)
+    
+    def _resolve_color_class(self, pos: np.ndarray, vel: np.ndarray, inv_mass: np.ndarray,
+                             restitution: np.ndarray, friction: np.ndarray,
+                             ia: np.ndarray, ib: np.ndarray, normal: np.ndarray, penetration: np.ndarray):
+        """Résout une classe de collisions disjointes, en parallèle si elle est grande"""
+        count = len(ia)
+        if count <= self.parallel_batch_size or self.max_workers <= 1:
+            self._resolve_batch(pos, vel, inv_mass, restitution, friction, ia, ib, normal, penetration)
+            return
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        
+        # Les tranches ne partagent aucun corps dynamique : pas de conflit d'écriture
+        chunks = np.array_split(np.arange(count), min(self.max_workers, -(-count // self.parallel_batch_size)))
+        futures = [self._executor.submit(self._resolve_batch, pos, vel, inv_mass, restitution, friction,
+                                         ia[chunk], ib[chunk], normal[chunk], penetration[chunk])
+                   for chunk in chunks]
+        for future in futures:
+            future.result()
+    
+    def _resolve_batch(self, pos: np.ndarray, vel: np.ndarray, inv_mass: np.ndarray,
+                       restitution: np.ndarray, friction: np.ndarray,
+                       ia: np.ndarray, ib: np.ndarray, normal: np.ndarray, penetration: np.ndarray):
+        """Noyau vectorisé : corrections de position, impulsions normales et friction"""
+        inv_mass_a = inv_mass[ia]
+        inv_mass_b = inv_mass[ib]
+        total_inv_mass = inv_mass_a + inv_mass_b
+        solvable = total_inv_mass > 0
+        safe_total = np.where(solvable, total_inv_mass, 1.0)
+        
+        # Correction de position
+        if self.position_correction:
+            depth = np.where(solvable & (penetration > 0), penetration, 0.0)
+            correction = normal * (depth * self.position_correction_factor / safe_total)[:, None]
+            np.subtract.at(pos, ia, correction * inv_mass_a[:, None])
+            np.add.at(pos, ib, correction * inv_mass_b[:, None])
+        
+        # Vitesses relatives
+        relative_velocity = vel[ib] - vel[ia]
+        velocity_along_normal = np.einsum('ij,ij->i', relative_velocity, normal)
+        
+        # Ne pas résoudre si les objets se séparent déjà
+        active = solvable & (velocity_along_normal <= 0)
+        
+        # Impulsion normale
+        e = np.minimum(restitution[ia], restitution[ib])
+        impulse_scalar = np.where(active, -(1 + e) * velocity_along_normal / safe_total, 0.0)
+        
+        # Friction : la composante tangentielle n'est pas modifiée par l'impulsion normale
+        tangent = relative_velocity - normal * velocity_along_normal[:, None]
+        tangent_magnitude_sq = np.einsum('ij,ij->i', tangent, tangent)
+        sliding = active & (tangent_magnitude_sq >= self.velocity_threshold * self.velocity_threshold)
+        tangent_magnitude = np.sqrt(tangent_magnitude_sq)
+        safe_magnitude = np.where(sliding, tangent_magnitude, 1.0)
+        mu = np.sqrt(friction[ia] * friction[ib])
+        
+        # Friction statique (annule le glissement) ou dynamique (bornée par mu * j)
+        friction_scalar = np.where(tangent_magnitude < impulse_scalar * mu,
+                                   -tangent_magnitude, -impulse_scalar * mu)
+        friction_scalar = np.where(sliding, friction_scalar / safe_magnitude, 0.0)
+        
+        impulse = normal * impulse_scalar[:, None] + tangent * friction_scalar[:, None]
+        np.subtract.at(vel, ia, impulse * inv_mass_a[:, None])
+        np.add.at(vel, ib, impulse * inv_mass_b[:, None])
     
     def resolve_collision(self, collision: CollisionInfo, dt: float):
         """Résout une collision individuelle"""
@@ -26,12 +164,20 @@ class CollisionResolver:
         normal = collision.normal
         penetration = collision.penetration
         
-        # Correction de position
-        if self.position_correction and penetration > 0:
-            self._resolve_position(body_a, body_b, normal, penetration)
+        # Masses inverses effectives (nulles pour les corps statiques), calculées une seule fois
+        inv_mass_a = body_a.inv_mass
+        inv_mass_b = body_b.inv_mass
+        total_inv_mass = inv_mass_a + inv_mass_b
         
-        # Résolution de vitesse
-        self._resolve_velocity(body_a, body_b, normal, collision)
+        if total_inv_mass > 0:
+            # Correction de position
+            if self.position_correction and penetration > 0:
+                self._resolve_position(body_a, body_b, normal, penetration,
+                                       inv_mass_a, inv_mass_b, total_inv_mass)
+            
+            # Résolution de vitesse
+            self._resolve_velocity(body_a, body_b, normal, collision,
+                                   inv_mass_a, inv_mass_b, total_inv_mass)
         
         # Callbacks de collision
         if body_a.on_collision:
@@ -39,29 +185,29 @@ class CollisionResolver:
         if body_b.on_collision:
             body_b.on_collision(body_b, body_a, collision)
     
-    def _resolve_position(self, body_a, body_b, normal: Vector2D, penetration: float):
+    def _resolve_position(self, body_a, body_b, normal: Vector2D, penetration: float,
+                          inv_mass_a: float, inv_mass_b: float, total_inv_mass: float):
         """Corrige les positions pour séparer les objets"""
-        # Calcul de la masse totale inverse
-        inv_mass_a = 0 if body_a.static else body_a.inv_mass
-        inv_mass_b = 0 if body_b.static else body_b.inv_mass
-        total_inv_mass = inv_mass_a + inv_mass_b
-        
-        if total_inv_mass <= 0:
-            return
-        
         # Correction proportionnelle à la masse inverse
         correction = normal * (penetration * self.position_correction_factor / total_inv_mass)
         
-        if not body_a.static:
+        if inv_mass_a:
             body_a.position -= correction * inv_mass_a
-        if not body_b.static:
+        if inv_mass_b:
             body_b.position += correction * inv_mass_b
     
-    def _resolve_velocity(self, body_a, body_b, normal: Vector2D, collision: CollisionInfo):
+    def _resolve_velocity(self, body_a, body_b, normal: Vector2D, collision: CollisionInfo,
+                          inv_mass_a: float, inv_mass_b: float, total_inv_mass: float):
         """Résout les vitesses après collision"""
+        velocity_a = body_a.velocity
+        velocity_b = body_b.velocity
+        normal_x = normal.x
+        normal_y = normal.y
+        
         # Vitesses relatives
-        relative_velocity = body_b.velocity - body_a.velocity
-        velocity_along_normal = relative_velocity.dot(normal)
+        rv_x = velocity_b.x - velocity_a.x
+        rv_y = velocity_b.y - velocity_a.y
+        velocity_along_normal = rv_x * normal_x + rv_y * normal_y
         
         # Ne pas résoudre si les objets se séparent déjà
         if velocity_along_normal > 0:
@@ -71,39 +217,40 @@ class CollisionResolver:
         restitution = min(body_a.restitution, body_b.restitution)
         
         # Calcul de l'impulsion
-        impulse_scalar = -(1 + restitution) * velocity_along_normal
-        
-        # Masses
-        inv_mass_a = 0 if body_a.static else body_a.inv_mass
-        inv_mass_b = 0 if body_b.static else body_b.inv_mass
-        
-        impulse_scalar /= inv_mass_a + inv_mass_b
-        impulse = normal * impulse_scalar
+        impulse_scalar = -(1 + restitution) * velocity_along_normal / total_inv_mass
+        impulse_x = normal_x * impulse_scalar
+        impulse_y = normal_y * impulse_scalar
         
         # Appliquer l'impulsion
-        if not body_a.static:
-            body_a.velocity -= impulse * inv_mass_a
-        if not body_b.static:
-            body_b.velocity += impulse * inv_mass_b
+        if inv_mass_a:
+            velocity_a.x -= impulse_x * inv_mass_a
+            velocity_a.y -= impulse_y * inv_mass_a
+        if inv_mass_b:
+            velocity_b.x += impulse_x * inv_mass_b
+            velocity_b.y += impulse_y * inv_mass_b
         
         # Friction
-        self._apply_friction(body_a, body_b, normal, impulse_scalar)
+        self._apply_friction(body_a, body_b, normal, impulse_scalar, rv_x, rv_y, velocity_along_normal,
+                             inv_mass_a, inv_mass_b)
     
-    def _apply_friction(self, body_a, body_b, normal: Vector2D, impulse_scalar: float):
-        """Applique la friction lors de la collision"""
-        # Vitesse relative
-        relative_velocity = body_b.velocity - body_a.velocity
+    def _apply_friction(self, body_a, body_b, normal: Vector2D, impulse_scalar: float,
+                        rv_x: float, rv_y: float, velocity_along_normal: float,
+                        inv_mass_a: float, inv_mass_b: float):
+        """Applique la friction lors de la collision
         
+        (rv_x, rv_y) est la vitesse relative avant l'impulsion normale : celle-ci ne
+        modifie pas sa composante tangentielle, inutile de la recalculer.
+        """
         # Composante tangentielle
-        tangent = relative_velocity - normal * relative_velocity.dot(normal)
+        tangent_x = rv_x - normal.x * velocity_along_normal
+        tangent_y = rv_y - normal.y * velocity_along_normal
+        tangent_magnitude = math.hypot(tangent_x, tangent_y)
         
-        if tangent.magnitude < self.velocity_threshold:
+        if tangent_magnitude < self.velocity_threshold:
             return
         
-        tangent = tangent.normalized
-        
-        # Magnitude de la friction
-        friction_magnitude = -relative_velocity.dot(tangent)
+        # La magnitude de la friction vaut -|tangente|
+        friction_magnitude = -tangent_magnitude
         
         # Coefficient de friction combiné
         mu = math.sqrt(body_a.friction * body_b.friction)
@@ -111,19 +258,19 @@ class CollisionResolver:
         # Impulsion de friction
         if abs(friction_magnitude) < impulse_scalar * mu:
             # Friction statique
-            friction_impulse = tangent * friction_magnitude
+            friction_scalar = friction_magnitude
         else:
             # Friction dynamique
-            friction_impulse = tangent * (-impulse_scalar * mu)
+            friction_scalar = -impulse_scalar * mu
         
-        # Masses
-        inv_mass_a = 0 if body_a.static else body_a.inv_mass
-        inv_mass_b = 0 if body_b.static else body_b.inv_mass
+        scale = friction_scalar / tangent_magnitude
+        friction_x = tangent_x * scale
+        friction_y = tangent_y * scale
         
         # Appliquer la friction
-        if not body_a.static:
-            body_a.velocity -= friction_impulse * inv_mass_a
-        if not body_b.static:
-            body_b.velocity += friction_impulse * inv_mass_b
-
-import math  # Import nécessaire pour la friction
\ No newline at end of file
+        if inv_mass_a:
+            body_a.velocity.x -= friction_x * inv_mass_a
+            body_a.velocity.y -= friction_y * inv_mass_a
+        if inv_mass_b:
+            body_b.velocity.x += friction_x * inv_mass_b
+            body_b.velocity.y += friction_y * inv_mass_b
@@ -0,0 +1,182 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# physics_engine/core/_vector.pyx
+"""
+Vector2D compilé (Cython), même interface que la classe Python de vector.py
+
+Compilation : cythonize -i src/utils/physics_engine/core/_vector.pyx
+"""
+from libc.math cimport sqrt, atan2, cos, sin
+
+cdef inline Vector2D _new(double x, double y):
+    """Crée un vecteur sans passer par __init__"""
+    cdef Vector2D v = Vector2D.__new__(Vector2D)
+    v.x = x
+    v.y = y
+    return v
+
+cdef class Vector2D:
+    """Vecteur 2D avec opérations vectorielles optimisées"""
+
+    cdef public double x
+    cdef public double y
+
+    def __init__(self, double x=0.0, double y=0.0):
+        self.x = x
+        self.y = y
+
+    # Opérateurs mathématiques
+    def __add__(self, Vector2D other not None):
+        return _new(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, Vector2D other not None):
+        return _new(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, double scalar):
+        return _new(self.x * scalar, self.y * scalar)
+
+    def __rmul__(self, double scalar):
+        return _new(self.x * scalar, self.y * scalar)
+
+    def __truediv__(self, double scalar):
+        if scalar == 0:
+            raise ZeroDivisionError("float division by zero")
+        return _new(self.x / scalar, self.y / scalar)
+
+    def __iadd__(self, Vector2D other not None):
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __isub__(self, Vector2D other not None):
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __imul__(self, double scalar):
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def __neg__(self):
+        return _new(-self.x, -self.y)
+
+    # Propriétés vectorielles
+    @property
+    def magnitude(self):
+        """Magnitude (longueur) du vecteur"""
+        return sqrt(self.x * self.x + self.y * self.y)
+
+    @property
+    def magnitude_squared(self):
+        """Magnitude au carré (évite sqrt pour optimisation)"""
+        return self.x * self.x + self.y * self.y
+
+    @property
+    def normalized(self):
+        """Vecteur normalisé (longueur 1)"""
+        cdef double mag_sq = self.x * self.x + self.y * self.y
+        if mag_sq == 0:
+            return _new(0.0, 0.0)
+        cdef double inv_mag = 1.0 / sqrt(mag_sq)
+        return _new(self.x * inv_mag, self.y * inv_mag)
+
+    def normalize(self):
+        """Normalise ce vecteur (modifie en place)"""
+        cdef double mag_sq = self.x * self.x + self.y * self.y
+        cdef double inv_mag
+        if mag_sq > 0:
+            inv_mag = 1.0 / sqrt(mag_sq)
+            self.x *= inv_mag
+            self.y *= inv_mag
+        return self
+
+    def normalize_into(self, Vector2D out not None):
+        """Écrit le vecteur normalisé dans out (sans allocation)"""
+        cdef double mag_sq = self.x * self.x + self.y * self.y
+        cdef double inv_mag
+        if mag_sq > 0:
+            inv_mag = 1.0 / sqrt(mag_sq)
+            out.x = self.x * inv_mag
+            out.y = self.y * inv_mag
+        else:
+            out.x = 0.0
+            out.y = 0.0
+        return out
+
+    def dot(self, Vector2D other not None):
+        """Produit scalaire"""
+        return self.x * other.x + self.y * other.y
+
+    def cross(self, Vector2D other not None):
+        """Produit vectoriel (scalaire en 2D)"""
+        return self.x * other.y - self.y * other.x
+
+    def distance_to(self, Vector2D other not None):
+        """Distance vers un autre vecteur"""
+        cdef double dx = self.x - other.x
+        cdef double dy = self.y - other.y
+        return sqrt(dx * dx + dy * dy)
+
+    def distance_squared_to(self, Vector2D other not None):
+        """Distance au carré (évite sqrt)"""
+        cdef double dx = self.x - other.x
+        cdef double dy = self.y - other.y
+        return dx * dx + dy * dy
+
+    def angle_to(self, Vector2D other not None):
+        """Angle vers un autre vecteur (en radians)"""
+        return atan2(other.y - self.y, other.x - self.x)
+
+    def rotate(self, double angle):
+        """Rotation (radians)"""
+        cdef double cos_a = cos(angle)
+        cdef double sin_a = sin(angle)
+        return _new(self.x * cos_a - self.y * sin_a,
+                    self.x * sin_a + self.y * cos_a)
+
+    def reflect(self, Vector2D normal not None):
+        """Réflexion par rapport à une normale"""
+        # v' = v - 2(v·n)n
+        cdef double k = 2 * (self.x * normal.x + self.y * normal.y)
+        return _new(self.x - k * normal.x, self.y - k * normal.y)
+
+    def project_onto(self, Vector2D other not None):
+        """Projection sur un autre vecteur"""
+        cdef double other_mag_sq = other.x * other.x + other.y * other.y
+        if other_mag_sq == 0:
+            return _new(0.0, 0.0)
+        cdef double k = (self.x * other.x + self.y * other.y) / other_mag_sq
+        return _new(other.x * k, other.y * k)
+
+    def lerp(self, Vector2D other not None, double t):
+        """Interpolation linéaire"""
+        return _new(self.x + (other.x - self.x) * t, self.y + (other.y - self.y) * t)
+
+    # Accès de type séquence (pygame accepte directement le vecteur comme coordonnées)
+    def __len__(self):
+        return 2
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __getitem__(self, index):
+        if index == 0:
+            return self.x
+        if index == 1:
+            return self.y
+        return (self.x, self.y)[index]
+
+    def copy(self):
+        """Copie du vecteur"""
+        return _new(self.x, self.y)
+
+    def tuple(self):
+        """Conversion en tuple"""
+        return (self.x, self.y)
+
+    def __str__(self):
+        return f"Vector2D({self.x:.2f}, {self.y:.2f})"
+
+    def __repr__(self):
+        return f"Vector2D({self.x}, {self.y})"
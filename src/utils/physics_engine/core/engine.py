@@ -3,13 +3,26 @@
 Moteur de physique principal
 """
 import pygame
+import math
+import threading
 import time
+import numpy as np
 from typing import List, Optional, Callable
 from dataclasses import dataclass
 
 from .vector import Vector2D
+from .jit import njit, prange, NUMBA_AVAILABLE
 
-@dataclass
+# numexpr est une dépendance optionnelle (intégration vectorisée SIMD sans Numba)
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+from ..physics.body import Circle, Ring, outlined_circle_sprite
+from ..collision.broadphase import SpatialHashGrid, SweepAndPrune
+
+@dataclass(slots=True, frozen=True)
 class EngineConfig:
     """Configuration du moteur"""
     width: int = 1080
@@ -22,6 +35,60 @@ class EngineConfig:
     background_color: tuple = (15, 15, 25)
     max_velocity: float = 2000.0  # Vitesse max pour éviter les bugs
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _integrate_kernel(px, py, vx, vy, ax, ay, static_mask, dt, max_v, friction, n):
+    """Intégration de Verlet, limitation de vitesse et friction (un corps par itération)"""
+    half_dt2 = 0.5 * dt * dt
+    damping = 1.0 - friction * dt
+    for i in prange(n):
+        if static_mask[i]:
+            continue
+        
+        px[i] += vx[i] * dt + ax[i] * half_dt2
+        py[i] += vy[i] * dt + ay[i] * half_dt2
+        
+        nvx = vx[i] + ax[i] * dt
+        nvy = vy[i] + ay[i] * dt
+        
+        speed2 = nvx * nvx + nvy * nvy
+        if speed2 > max_v * max_v:
+            scale = max_v / speed2 ** 0.5
+            nvx *= scale
+            nvy *= scale
+        
+        vx[i] = nvx * damping
+        vy[i] = nvy * damping
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _step_kernel(px, py, vx, vy, ax, ay, fx, fy, inv_mass, drag, static_mask,
+                 gx, gy, dt, max_v, friction, n):
+    """Forces, intégration de Verlet, limitation de vitesse et friction fusionnées en une passe"""
+    half_dt2 = 0.5 * dt * dt
+    damping = 1.0 - friction * dt
+    for i in prange(n):
+        if static_mask[i]:
+            continue
+        
+        # Gravité + traînée + forces personnalisées
+        k = -0.5 * drag[i] * (vx[i] * vx[i] + vy[i] * vy[i]) ** 0.5 * inv_mass[i]
+        ax[i] = gx + k * vx[i] + fx[i] * inv_mass[i]
+        ay[i] = gy + k * vy[i] + fy[i] * inv_mass[i]
+        
+        px[i] += vx[i] * dt + ax[i] * half_dt2
+        py[i] += vy[i] * dt + ay[i] * half_dt2
+        
+        nvx = vx[i] + ax[i] * dt
+        nvy = vy[i] + ay[i] * dt
+        
+        speed2 = nvx * nvx + nvy * nvy
+        if speed2 > max_v * max_v:
+            scale = max_v / speed2 ** 0.5
+            nvx *= scale
+            nvy *= scale
+        
+        vx[i] = nvx * damping
+        vy[i] = nvy * damping
+
 class PhysicsEngine:
     """Moteur de physique 2D modulaire"""
     
@@ -42,6 +109,36 @@ class PhysicsEngine:
         self.bodies = []
         self.constraints = []
         self.collision_pairs = []
+        self._pair_indices = []
+        
+        # État des corps en structure de tableaux (SoA), synchronisé à chaque pas
+        self._allocate_arrays(0)
+        
+        # Phase large au-delà de ce nombre de corps : 'hash' (grille) ou 'sap' (scènes allongées)
+        self.broadphase = 'hash'
+        self.spatial_hash = SpatialHashGrid()
+        self.sweep_and_prune = SweepAndPrune()
+        self.spatial_hash_threshold = 500
+        self._static_hash_signature = None  # (taille de cellule, (indice, version) des corps immobiles)
+        
+        # Sommeil : un corps sous sleep_velocity pendant sleep_frames pas n'est plus simulé
+        self.sleep_enabled = False
+        self.sleep_velocity = 10.0
+        self.sleep_frames = 30
+        
+        # Rendu en pipeline : le frame N est dessiné par un thread pendant le pas N+1.
+        # Le thread ne dessine que dans une surface hors écran ; blit, debug (polices) et
+        # display.flip restent sur le thread principal (exigé par SDL sous macOS et Windows)
+        self.threaded_render = False
+        self.render_callbacks_thread_safe = False  # Autorise les render_callbacks dans le thread
+        self._render_canvas = None  # Surface hors écran du thread de rendu
+        self._render_pending = False  # Un frame dessiné attend d'être affiché
+        self._render_buffers = ([], [])
+        self._render_index = 0
+        self._render_ready = threading.Event()
+        self._render_idle = threading.Event()
+        self._render_idle.set()
+        self._render_thread = None
         
         # Callbacks
         self.update_callbacks = []
@@ -50,29 +147,49 @@ class PhysicsEngine:
         
         # Timing
         self.dt = 1.0 / self.config.fps
-        self.last_time = time.time()
+        self.last_time = time.perf_counter_ns()
         self.frame_count = 0
         
+        # Pas fixe de run() (accumulateur), avec au plus max_substeps pas par frame
+        self.fixed_dt = 1.0 / 120
+        self.max_substeps = 4
+        self._accumulator = 0.0
+        
         # Debug
         self.debug_mode = False
+        self._debug_font = pygame.font.Font(None, 36)
+        self._debug_cache = {}  # Texte -> Surface déjà rendue
         self.performance_stats = {
             'fps': 0,
-            'frame_time': 0,
-            'physics_time': 0,
-            'render_time': 0,
+            'frame_time_ns': 0,
+            'physics_time_ns': 0,
+            'render_time_ns': 0,
             'bodies_count': 0
         }
     
+    def _timing_enabled(self) -> bool:
+        """Mesures de temps seulement en debug ou une frame sur 30"""
+        return self.debug_mode or self.frame_count % 30 == 0
+    
     def add_body(self, body):
         """Ajoute un corps physique"""
+        body._idx = len(self.bodies)
         self.bodies.append(body)
         body.engine = self
     
     def remove_body(self, body):
-        """Supprime un corps physique"""
-        if body in self.bodies:
-            self.bodies.remove(body)
-            body.engine = None
+        """Supprime un corps physique (O(1) : le dernier corps prend sa place)"""
+        bodies = self.bodies
+        index = getattr(body, '_idx', None)
+        if index is None or index >= len(bodies) or bodies[index] is not body:
+            return
+        
+        last = bodies.pop()
+        if last is not body:
+            bodies[index] = last
+            last._idx = index
+        body._idx = None
+        body.engine = None
     
     def add_constraint(self, constraint):
         """Ajoute une contrainte"""
@@ -99,13 +216,20 @@ class PhysicsEngine:
         if dt is None:
             dt = self.dt * self.time_scale
         
-        physics_start = time.time()
+        timed = self._timing_enabled()
+        if timed:
+            physics_start = time.perf_counter_ns()
+        
+        # Copier l'état des corps dans les tableaux
+        self._sync_bodies_to_arrays()
+        self._prev_pos_x[:] = self.pos_x
+        self._prev_pos_y[:] = self.pos_y
         
-        # 1. Appliquer les forces
-        self._apply_forces(dt)
+        # 1-2. Appliquer les forces et intégrer les positions (passe fusionnée)
+        self._step_bodies(dt)
         
-        # 2. Intégrer les positions
-        self._integrate(dt)
+        # Répercuter l'état intégré sur les corps
+        self._sync_arrays_to_bodies()
         
         # 3. Détecter les collisions
         self._detect_collisions()
@@ -116,131 +240,418 @@ class PhysicsEngine:
         # 5. Appliquer les contraintes
         self._apply_constraints(dt)
         
+        # Mise en sommeil des corps au repos
+        if self.sleep_enabled:
+            self._update_sleep()
+        
         # 6. Callbacks de mise à jour
         for callback in self.update_callbacks:
             callback(dt)
         
-        self.performance_stats['physics_time'] = time.time() - physics_start
+        if timed:
+            self.performance_stats['physics_time_ns'] = time.perf_counter_ns() - physics_start
         self.performance_stats['bodies_count'] = len(self.bodies)
     
-    def _apply_forces(self, dt: float):
-        """Applique les forces à tous les corps"""
-        for body in self.bodies:
-            if not body.static:
-                # Gravité
-                body.acceleration = self.config.gravity.copy()
-                
-                # Résistance de l'air
-                if body.velocity.magnitude > 0:
-                    air_force = body.velocity.normalized * -body.velocity.magnitude_squared * 0.5 * body.drag_coefficient
-                    body.acceleration += air_force / body.mass
-                
-                # Forces personnalisées
+    def _allocate_arrays(self, count: int):
+        """Alloue les tableaux d'état des corps"""
+        self.pos_x = np.zeros(count)
+        self.pos_y = np.zeros(count)
+        self.vel_x = np.zeros(count)
+        self.vel_y = np.zeros(count)
+        self.acc_x = np.zeros(count)
+        self.acc_y = np.zeros(count)
+        self.inv_mass = np.zeros(count)
+        self.radius = np.zeros(count)
+        self.drag = np.zeros(count)
+        self.static_mask = np.zeros(count, dtype=bool)  # Corps immobiles ce pas (statiques ou endormis)
+        
+        # Tampons de travail réutilisés d'un pas à l'autre (aucune allocation par frame)
+        self._dynamic_mask = np.zeros(count, dtype=bool)
+        self._scratch_a = np.zeros(count)
+        self._scratch_b = np.zeros(count)
+        self._force_x = np.zeros(count)
+        self._force_y = np.zeros(count)
+        
+        # Positions au début du dernier pas (interpolation du rendu)
+        self._prev_pos_x = np.zeros(count)
+        self._prev_pos_y = np.zeros(count)
+    
+    def _sync_bodies_to_arrays(self):
+        """Copie l'état des corps dans les tableaux SoA"""
+        bodies = self.bodies
+        count = len(bodies)
+        if self.pos_x.shape[0] != count:
+            self._allocate_arrays(count)
+        
+        self.pos_x[:] = [body.position.x for body in bodies]
+        self.pos_y[:] = [body.position.y for body in bodies]
+        self.vel_x[:] = [body.velocity.x for body in bodies]
+        self.vel_y[:] = [body.velocity.y for body in bodies]
+        self.acc_x[:] = [body.acceleration.x for body in bodies]
+        self.acc_y[:] = [body.acceleration.y for body in bodies]
+        self.inv_mass[:] = [0.0 if body.sleeping else body.inv_mass for body in bodies]
+        self.radius[:] = [getattr(body, 'radius', 0.0) for body in bodies]
+        self.drag[:] = [body.drag_coefficient for body in bodies]
+        self.static_mask[:] = [body.static or body.sleeping for body in bodies]
+    
+    def _sync_arrays_to_bodies(self):
+        """Répercute les tableaux SoA sur les vecteurs des corps dynamiques"""
+        for body, px, py, vx, vy, ax, ay, static in zip(
+                self.bodies, self.pos_x.tolist(), self.pos_y.tolist(),
+                self.vel_x.tolist(), self.vel_y.tolist(),
+                self.acc_x.tolist(), self.acc_y.tolist(), self.static_mask.tolist()):
+            if static:
+                continue
+            position = body.position
+            position.x = px
+            position.y = py
+            body.position = position
+            velocity = body.velocity
+            velocity.x = vx
+            velocity.y = vy
+            acceleration = body.acceleration
+            acceleration.x = ax
+            acceleration.y = ay
+    
+    def _step_bodies(self, dt: float):
+        """Forces, intégration, limitation de vitesse et friction en une seule passe"""
+        if not NUMBA_AVAILABLE:
+            self._apply_forces(dt)
+            self._integrate(dt)
+            return
+        
+        self._gather_custom_forces()
+        gravity = self.config.gravity
+        _step_kernel(self.pos_x, self.pos_y, self.vel_x, self.vel_y, self.acc_x, self.acc_y,
+                     self._force_x, self._force_y, self.inv_mass, self.drag, self.static_mask,
+                     gravity.x, gravity.y, dt, self.config.max_velocity, self.config.friction,
+                     len(self.bodies))
+    
+    def _gather_custom_forces(self):
+        """Somme les forces personnalisées de chaque corps dans _force_x / _force_y"""
+        force_x = self._force_x
+        force_y = self._force_y
+        force_x.fill(0.0)
+        force_y.fill(0.0)
+        for i, body in enumerate(self.bodies):
+            if body.forces and not body.static:
                 for force in body.forces:
-                    body.acceleration += force / body.mass
+                    force_x[i] += force.x
+                    force_y[i] += force.y
                 
                 # Nettoyer les forces
                 body.forces.clear()
     
+    def _apply_forces(self, dt: float):
+        """Applique les forces à tous les corps (passe séparée, voir _step_bodies)"""
+        dynamic = np.logical_not(self.static_mask, out=self._dynamic_mask)
+        
+        # Résistance de l'air : -0.5 * Cd * |v| * v / m
+        drag = np.hypot(self.vel_x, self.vel_y, out=self._scratch_a)
+        drag *= self.drag
+        drag *= -0.5
+        drag *= self.inv_mass
+        
+        # Gravité + traînée (les corps statiques gardent leur accélération)
+        gravity = self.config.gravity
+        acceleration = np.multiply(drag, self.vel_x, out=self._scratch_b)
+        acceleration += gravity.x
+        np.copyto(self.acc_x, acceleration, where=dynamic)
+        acceleration = np.multiply(drag, self.vel_y, out=self._scratch_b)
+        acceleration += gravity.y
+        np.copyto(self.acc_y, acceleration, where=dynamic)
+        
+        # Forces personnalisées
+        self._gather_custom_forces()
+        for acc, force in ((self.acc_x, self._force_x), (self.acc_y, self._force_y)):
+            np.multiply(force, self.inv_mass, out=self._scratch_b)
+            np.add(acc, self._scratch_b, out=acc, where=dynamic)
+    
     def _integrate(self, dt: float):
-        """Intégration de Verlet pour plus de stabilité"""
-        for body in self.bodies:
-            if not body.static:
-                # Sauvegarde position précédente
-                old_pos = body.position.copy()
-                
-                # Nouvelle position (Verlet)
-                body.position += body.velocity * dt + body.acceleration * 0.5 * dt * dt
-                
-                # Nouvelle vitesse
-                body.velocity += body.acceleration * dt
-                
-                # Limitation de vitesse
-                if body.velocity.magnitude > self.config.max_velocity:
-                    body.velocity = body.velocity.normalized * self.config.max_velocity
-                
-                # Friction
-                body.velocity *= (1.0 - self.config.friction * dt)
+        """Intégration de Verlet pour plus de stabilité (passe séparée, voir _step_bodies)"""
+        if NUMBA_AVAILABLE:
+            _integrate_kernel(self.pos_x, self.pos_y, self.vel_x, self.vel_y,
+                              self.acc_x, self.acc_y, self.static_mask,
+                              dt, self.config.max_velocity, self.config.friction, len(self.bodies))
+            return
+        
+        if NUMEXPR_AVAILABLE:
+            self._integrate_numexpr(dt)
+            return
+        
+        dynamic = np.logical_not(self.static_mask, out=self._dynamic_mask)
+        half_dt2 = 0.5 * dt * dt
+        step = self._scratch_a
+        term = self._scratch_b
+        
+        # Nouvelle position (Verlet)
+        for pos, vel, acc in ((self.pos_x, self.vel_x, self.acc_x), (self.pos_y, self.vel_y, self.acc_y)):
+            np.multiply(vel, dt, out=step)
+            step += np.multiply(acc, half_dt2, out=term)
+            np.add(pos, step, out=pos, where=dynamic)
+        
+        # Nouvelle vitesse
+        for vel, acc in ((self.vel_x, self.acc_x), (self.vel_y, self.acc_y)):
+            np.add(vel, np.multiply(acc, dt, out=step), out=vel, where=dynamic)
+        
+        # Limitation de vitesse et friction : échelle max_v / max(|v|, max_v)
+        max_velocity = self.config.max_velocity
+        scale = np.hypot(self.vel_x, self.vel_y, out=step)
+        np.maximum(scale, max_velocity, out=scale)
+        np.divide(max_velocity, scale, out=scale)
+        scale *= 1.0 - self.config.friction * dt
+        np.multiply(self.vel_x, scale, out=self.vel_x, where=dynamic)
+        np.multiply(self.vel_y, scale, out=self.vel_y, where=dynamic)
+    
+    def _integrate_numexpr(self, dt: float):
+        """Intégration de Verlet évaluée par numexpr (FMA vectorisées, sans temporaires)"""
+        static = self.static_mask
+        half_dt2 = 0.5 * dt * dt
+        
+        # Nouvelle position puis nouvelle vitesse
+        for pos, vel, acc in ((self.pos_x, self.vel_x, self.acc_x), (self.pos_y, self.vel_y, self.acc_y)):
+            ne.evaluate("where(static, pos, pos + vel * dt + acc * half_dt2)", out=pos)
+            ne.evaluate("where(static, vel, vel + acc * dt)", out=vel)
+        
+        # Limitation de vitesse et friction
+        vx = self.vel_x
+        vy = self.vel_y
+        max_v = self.config.max_velocity
+        max_v2 = max_v * max_v
+        damping = 1.0 - self.config.friction * dt
+        speed2 = ne.evaluate("vx * vx + vy * vy", out=self._scratch_a)
+        scale = ne.evaluate("where(speed2 > max_v2, max_v / sqrt(speed2), 1.0) * damping", out=self._scratch_b)
+        ne.evaluate("where(static, vx, vx * scale)", out=vx)
+        ne.evaluate("where(static, vy, vy * scale)", out=vy)
     
     def _detect_collisions(self):
         """Détection de collisions optimisée"""
         self.collision_pairs.clear()
+        self._pair_indices.clear()
+        bodies = self.bodies
+        count = len(bodies)
         
-        # Collision simple O(n²) - à optimiser avec spatial hashing si nécessaire
-        for i in range(len(self.bodies)):
-            for j in range(i + 1, len(self.bodies)):
-                body_a = self.bodies[i]
-                body_b = self.bodies[j]
-                
-                # Skip si les deux sont statiques
-                if body_a.static and body_b.static:
-                    continue
-                
-                # Détection de collision spécifique aux formes
-                collision_info = self._check_collision(body_a, body_b)
-                if collision_info:
-                    self.collision_pairs.append((body_a, body_b, collision_info))
+        if count >= self.spatial_hash_threshold:
+            if self.broadphase == 'sap':
+                candidates = self._sweep_and_prune_pairs()
+            else:
+                candidates = self._spatial_hash_pairs()
+        else:
+            candidates = self._broadcast_pairs()
+        
+        static_mask = self.static_mask
+        for i, j in candidates:
+            # Skip si les deux sont immobiles (statiques ou endormis)
+            if static_mask[i] and static_mask[j]:
+                continue
+            
+            body_a = bodies[i]
+            body_b = bodies[j]
+            
+            # Détection de collision spécifique aux formes
+            collision_info = self._check_collision(body_a, body_b)
+            if collision_info:
+                self.collision_pairs.append((body_a, body_b, collision_info))
+                self._pair_indices.append((i, j))
+    
+    def _broadcast_pairs(self) -> List[tuple]:
+        """Paires en contact, testées toutes à la fois sur le triangle supérieur (petites scènes)"""
+        ia, ib = np.triu_indices(len(self.bodies), 1)
+        dx = self.pos_x[ib] - self.pos_x[ia]
+        dy = self.pos_y[ib] - self.pos_y[ia]
+        radius_sum = self.radius[ia] + self.radius[ib]
+        hit = (dx * dx + dy * dy < radius_sum * radius_sum) & ~(self.static_mask[ia] & self.static_mask[ib])
+        
+        pairs = np.flatnonzero(hit)
+        return list(zip(ia[pairs].tolist(), ib[pairs].tolist()))
+    
+    def _spatial_hash_pairs(self) -> List[tuple]:
+        """Paires candidates issues de la grille de hachage (cellule ≈ 2× le plus grand rayon)"""
+        max_radius = float(self.radius.max())
+        if max_radius <= 0:
+            return []
+        
+        grid = self.spatial_hash
+        grid.cell_size = 2.0 * max_radius
+        grid.clear()
+        
+        # Seuls les cercles (rayon > 0) participent à la détection du moteur
+        circle = self.radius > 0
+        immobile = circle & self.static_mask
+        
+        # Les corps immobiles ne sont ré-insérés que si l'un d'eux (ou la grille) a changé
+        bodies = self.bodies
+        static_indices = np.flatnonzero(immobile).tolist()
+        signature = (grid.cell_size, tuple((i, bodies[i]._aabb_version) for i in static_indices))
+        if signature != self._static_hash_signature:
+            self._static_hash_signature = signature
+            grid.clear_static()
+            for i in static_indices:
+                x, y, r = float(self.pos_x[i]), float(self.pos_y[i]), float(self.radius[i])
+                grid.insert(i, (x - r, y - r, x + r, y + r), static=True)
+        
+        moving = np.flatnonzero(circle & ~self.static_mask)
+        for i, x, y, r in zip(moving.tolist(), self.pos_x[moving].tolist(),
+                              self.pos_y[moving].tolist(), self.radius[moving].tolist()):
+            grid.insert(i, (x - r, y - r, x + r, y + r))
+        
+        # Tri : même ordre de résolution que la double boucle
+        return sorted(grid.query_pairs())
+    
+    def _sweep_and_prune_pairs(self) -> List[tuple]:
+        """Paires candidates issues du balayage sur l'axe x"""
+        radius = self.radius
+        # Les corps sans rayon sont repoussés hors de tout chevauchement
+        active = radius > 0
+        min_x = np.where(active, self.pos_x - radius, np.inf)
+        max_x = np.where(active, self.pos_x + radius, -np.inf)
+        min_y = self.pos_y - radius
+        max_y = self.pos_y + radius
+        
+        ia, ib = self.sweep_and_prune.query_pairs(min_x, max_x, min_y, max_y)
+        return list(zip(ia.tolist(), ib.tolist()))
     
     def _check_collision(self, body_a, body_b):
         """Vérifie la collision entre deux corps"""
         # Cette méthode sera implémentée dans le module collision
         # Pour l'instant, collision cercle-cercle simple
-        if hasattr(body_a, 'radius') and hasattr(body_b, 'radius'):
-            distance = body_a.position.distance_to(body_b.position)
-            if distance < body_a.radius + body_b.radius:
-                normal = (body_b.position - body_a.position).normalized
-                penetration = body_a.radius + body_b.radius - distance
-                return {
-                    'normal': normal,
-                    'penetration': penetration,
-                    'contact_point': body_a.position + normal * body_a.radius
-                }
-        return None
-    
-    def _resolve_collisions(self, dt: float):
-        """Résout les collisions détectées"""
-        for body_a, body_b, collision_info in self.collision_pairs:
-            # Séparer les objets
-            normal = collision_info['normal']
-            penetration = collision_info['penetration']
+        if body_a.TAG == Circle.TAG and body_b.TAG == Circle.TAG:
+            pos_a = body_a.position
+            pos_b = body_b.position
+            dx = pos_b.x - pos_a.x
+            dy = pos_b.y - pos_a.y
+            radius_sum = body_a.radius + body_b.radius
             
-            # Correction de position
-            correction = normal * penetration * 0.5
-            if not body_a.static:
-                body_a.position -= correction
-            if not body_b.static:
-                body_b.position += correction
+            # Test sur les distances au carré : la racine n'est calculée qu'en cas de contact
+            distance_squared = dx * dx + dy * dy
+            if distance_squared >= radius_sum * radius_sum:
+                return None
             
-            # Calcul des vitesses relatives
-            relative_velocity = body_b.velocity - body_a.velocity
-            velocity_along_normal = relative_velocity.dot(normal)
+            distance = math.sqrt(distance_squared)
+            if distance > 0:
+                inv_distance = 1.0 / distance
+                nx = dx * inv_distance
+                ny = dy * inv_distance
+            else:
+                nx = ny = 0.0
             
-            # Ne pas résoudre si les objets se séparent déjà
-            if velocity_along_normal > 0:
+            return {
+                'normal': Vector2D(nx, ny),
+                'penetration': radius_sum - distance,
+                'contact_point': Vector2D(pos_a.x + nx * body_a.radius, pos_a.y + ny * body_a.radius)
+            }
+        return None
+    
+    def _resolve_collisions(self, dt: float):
+        """Résout les collisions détectées (gather/scatter vectorisé sur les tableaux SoA)"""
+        pairs = self.collision_pairs
+        if not pairs:
+            return
+        
+        indices = np.array(self._pair_indices, dtype=np.intp)
+        ia = indices[:, 0]
+        ib = indices[:, 1]
+        nx = np.array([info['normal'].x for _, _, info in pairs])
+        ny = np.array([info['normal'].y for _, _, info in pairs])
+        penetration = np.array([info['penetration'] for _, _, info in pairs])
+        restitution = np.array([min(body_a.restitution, body_b.restitution) for body_a, body_b, _ in pairs])
+        
+        # Masses inverses en cache (nulles pour les corps statiques)
+        dynamic = ~self.static_mask
+        inv_mass = self.inv_mass
+        inv_mass_a = inv_mass[ia]
+        inv_mass_b = inv_mass[ib]
+        dynamic_a = dynamic[ia]
+        dynamic_b = dynamic[ib]
+        
+        # Séparer les objets (correction de position)
+        correction_x = nx * penetration * 0.5
+        correction_y = ny * penetration * 0.5
+        np.add.at(self.pos_x, ia, -correction_x * dynamic_a)
+        np.add.at(self.pos_y, ia, -correction_y * dynamic_a)
+        np.add.at(self.pos_x, ib, correction_x * dynamic_b)
+        np.add.at(self.pos_y, ib, correction_y * dynamic_b)
+        
+        # Vitesse relative le long de la normale (ignorer les objets qui se séparent déjà)
+        rv_x = self.vel_x[ib] - self.vel_x[ia]
+        rv_y = self.vel_y[ib] - self.vel_y[ia]
+        velocity_along_normal = rv_x * nx + rv_y * ny
+        approaching = velocity_along_normal <= 0
+        
+        # Calculer et appliquer l'impulsion
+        impulse = np.where(approaching,
+                           -(1 + restitution) * velocity_along_normal / (inv_mass_a + inv_mass_b), 0.0)
+        np.add.at(self.vel_x, ia, -impulse * nx * inv_mass_a)
+        np.add.at(self.vel_y, ia, -impulse * ny * inv_mass_a)
+        np.add.at(self.vel_x, ib, impulse * nx * inv_mass_b)
+        np.add.at(self.vel_y, ib, impulse * ny * inv_mass_b)
+        
+        # Répercuter sur les corps touchés
+        bodies = self.bodies
+        touched = np.unique(indices).tolist()
+        for i, px, py, vx, vy in zip(touched, self.pos_x[touched].tolist(), self.pos_y[touched].tolist(),
+                                     self.vel_x[touched].tolist(), self.vel_y[touched].tolist()):
+            body = bodies[i]
+            if self.static_mask[i]:
+                # Un corps endormi touché par un corps éveillé se réveille au pas suivant
+                if body.sleeping:
+                    body.wake()
                 continue
+            position = body.position
+            position.x = px
+            position.y = py
+            body.position = position
+            velocity = body.velocity
+            velocity.x = vx
+            velocity.y = vy
+        
+        # Callbacks de collision
+        if self.collision_callbacks:
+            for body_a, body_b, collision_info in pairs:
+                for callback in self.collision_callbacks:
+                    callback(body_a, body_b, collision_info)
+    
+    def update_animations(self, dt: float):
+        """Anime en lot la pulsation des cercles et le décalage de couleur des anneaux
+        
+        Équivaut à appeler update_pulse / update_color_shift sur chaque corps.
+        """
+        bodies = self.bodies
+        pulsing = [body for body in bodies if body.TAG == Circle.TAG and body.pulsing]
+        if pulsing:
+            count = len(pulsing)
+            phase = np.fromiter((body.pulse_phase for body in pulsing), np.float64, count)
+            phase += np.fromiter((body.pulse_speed for body in pulsing), np.float64, count) * dt
             
-            # Coefficient de restitution
-            restitution = min(body_a.restitution, body_b.restitution)
-            
-            # Calculer l'impulsion
-            impulse_scalar = -(1 + restitution) * velocity_along_normal
-            
-            # Masses
-            inv_mass_a = 0 if body_a.static else 1.0 / body_a.mass
-            inv_mass_b = 0 if body_b.static else 1.0 / body_b.mass
-            
-            impulse_scalar /= inv_mass_a + inv_mass_b
-            impulse = normal * impulse_scalar
-            
-            # Appliquer l'impulsion
-            if not body_a.static:
-                body_a.velocity -= impulse * inv_mass_a
-            if not body_b.static:
-                body_b.velocity += impulse * inv_mass_b
+            # Un seul np.sin pour tous les cercles
+            scale = np.sin(phase)
+            scale *= np.fromiter((body.pulse_amplitude for body in pulsing), np.float64, count)
+            scale += 1.0
+            scale *= np.fromiter((body.original_radius for body in pulsing), np.float64, count)
             
-            # Callback de collision
-            for callback in self.collision_callbacks:
-                callback(body_a, body_b, collision_info)
+            # pulse_phase ne touche pas la géométrie : écriture directe, sans __setattr__
+            for body, p, radius in zip(pulsing, phase.tolist(), scale.tolist()):
+                object.__setattr__(body, 'pulse_phase', p)
+                body.radius = radius
+        
+        for body in bodies:
+            if body.TAG == Ring.TAG and body.color_shift_enabled:
+                body.color_phase += body.color_shift_speed * dt
+    
+    def _update_sleep(self):
+        """Endort les corps dont la vitesse reste sous le seuil"""
+        threshold = self.sleep_velocity * self.sleep_velocity
+        for body in self.bodies:
+            if body.static or body.sleeping:
+                continue
+            if body.velocity.magnitude_squared < threshold:
+                body.sleep_timer += 1
+                if body.sleep_timer > self.sleep_frames:
+                    body.sleeping = True
+                    body.velocity.x = 0.0
+                    body.velocity.y = 0.0
+            else:
+                body.sleep_timer = 0
     
     def _apply_constraints(self, dt: float):
         """Applique les contraintes"""
@@ -249,7 +660,17 @@ class PhysicsEngine:
     
     def render(self):
         """Rendu de la scène"""
-        render_start = time.time()
+        if self.threaded_render and self._fill_render_snapshot():
+            self._publish_render_snapshot()
+            return
+        
+        # Attendre que le thread de rendu ait fini ; son frame en attente est périmé
+        self._render_idle.wait()
+        self._render_pending = False
+        
+        timed = self._timing_enabled()
+        if timed:
+            render_start = time.perf_counter_ns()
         
         # Nettoyer l'écran
         self.screen.fill(self.config.background_color)
@@ -268,31 +689,162 @@ class PhysicsEngine:
         
         pygame.display.flip()
         
-        self.performance_stats['render_time'] = time.time() - render_start
+        if timed:
+            self.performance_stats['render_time_ns'] = time.perf_counter_ns() - render_start
+    
+    def _advance(self, frame_dt: float):
+        """Accumulateur à pas fixe : autant de pas de fixed_dt que le temps écoulé le permet"""
+        if self.paused:
+            return
+        
+        self._accumulator += frame_dt
+        substeps = 0
+        while self._accumulator >= self.fixed_dt and substeps < self.max_substeps:
+            self.step(self.fixed_dt)
+            self._accumulator -= self.fixed_dt
+            substeps += 1
+        
+        # Évite la spirale de la mort : le retard au-delà d'un pas est abandonné
+        if substeps == self.max_substeps:
+            self._accumulator = min(self._accumulator, self.fixed_dt)
+    
+    def _render_interpolated(self, alpha: float):
+        """Rendu aux positions lerp(précédente, courante, alpha), puis restauration"""
+        bodies = self.bodies
+        if alpha >= 1.0 or self._prev_pos_x.shape[0] != len(bodies):
+            self.render()
+            return
+        
+        saved = []
+        for body, prev_x, prev_y, static in zip(bodies, self._prev_pos_x.tolist(),
+                                                self._prev_pos_y.tolist(), self.static_mask.tolist()):
+            if static:
+                continue
+            position = body.position
+            saved.append((position, position.x, position.y))
+            position.x = prev_x + (position.x - prev_x) * alpha
+            position.y = prev_y + (position.y - prev_y) * alpha
+        
+        try:
+            self.render()
+        finally:
+            for position, x, y in saved:
+                position.x = x
+                position.y = y
+    
+    def _fill_render_snapshot(self) -> bool:
+        """Copie l'état visible dans le tampon libre (False si la scène exige un rendu direct)"""
+        if self.render_callbacks and not self.render_callbacks_thread_safe:
+            return False
+        
+        snapshot = self._render_buffers[1 - self._render_index]
+        snapshot.clear()
+        for body in self.bodies:
+            if not body.visible:
+                continue
+            # Seuls les cercles simples se résument à un tuple de dessin
+            if body.TAG != Circle.TAG or body.trail_enabled or body.glow or body.pattern is not None:
+                return False
+            radius = int(body.radius)
+            if radius > 0:
+                snapshot.append((body.color, (int(body.position.x), int(body.position.y)), radius,
+                                 body.outline_width, body.outline_color))
+        return True
+    
+    def _publish_render_snapshot(self):
+        """Affiche le frame précédent puis passe le tampon rempli au thread (double tampon)"""
+        if self._render_thread is None:
+            self._render_canvas = self.screen.copy()  # Même format que l'écran : blit rapide
+            self._render_thread = threading.Thread(target=self._render_worker, daemon=True)
+            self._render_thread.start()
+        
+        # Le thread doit avoir fini le frame précédent avant d'échanger les tampons
+        self._render_idle.wait()
+        self._present_render_canvas()
+        self._render_idle.clear()
+        self._render_index = 1 - self._render_index
+        self._render_pending = True
+        self._render_ready.set()
+    
+    def _present_render_canvas(self):
+        """Affiche le dernier frame du thread de rendu (thread principal uniquement)"""
+        if not self._render_pending:
+            return
+        self._render_pending = False
+        self.screen.blit(self._render_canvas, (0, 0))
+        if self.debug_mode:
+            self._render_debug()
+        pygame.display.flip()
+    
+    def _render_worker(self):
+        """Thread de rendu : dessine le dernier instantané publié dans la surface hors écran"""
+        while self._render_thread is not None:
+            if not self._render_ready.wait(0.1):
+                continue
+            self._render_ready.clear()
+            
+            timed = self._timing_enabled()
+            if timed:
+                render_start = time.perf_counter_ns()
+            screen = self._render_canvas
+            screen.fill(self.config.background_color)
+            
+            for color, pos, radius, outline_width, outline_color in self._render_buffers[self._render_index]:
+                if outline_width > 0:
+                    # Disque + contour en un seul blit
+                    sprite = outlined_circle_sprite(radius, color, outline_color, outline_width)
+                    screen.blit(sprite, (pos[0] - radius, pos[1] - radius))
+                else:
+                    pygame.draw.circle(screen, color, pos, radius)
+            
+            for callback in self.render_callbacks:
+                callback(screen)
+            
+            if timed:
+                self.performance_stats['render_time_ns'] = time.perf_counter_ns() - render_start
+            self._render_idle.set()
+    
+    def stop_render_thread(self):
+        """Arrête le thread de rendu après le frame en cours (affiché avant l'arrêt)"""
+        thread = self._render_thread
+        if thread is not None:
+            self._render_idle.wait()
+            self._present_render_canvas()
+            self._render_thread = None
+            thread.join()
     
     def _render_debug(self):
         """Rendu des informations de debug"""
-        font = pygame.font.Font(None, 36)
         y_offset = 10
         
         debug_info = [
             f"FPS: {self.performance_stats['fps']:.1f}",
             f"Bodies: {self.performance_stats['bodies_count']}",
-            f"Physics: {self.performance_stats['physics_time']*1000:.1f}ms",
-            f"Render: {self.performance_stats['render_time']*1000:.1f}ms",
+            f"Physics: {self.performance_stats['physics_time_ns'] / 1e6:.1f}ms",
+            f"Render: {self.performance_stats['render_time_ns'] / 1e6:.1f}ms",
         ]
         
+        # Ne re-rastériser que les lignes dont le texte a changé
+        previous = self._debug_cache
+        cache = {}
         for info in debug_info:
-            text = font.render(info, True, (255, 255, 255))
+            text = previous.get(info)
+            if text is None:
+                text = self._debug_font.render(info, True, (255, 255, 255))
+            cache[info] = text
             self.screen.blit(text, (10, y_offset))
             y_offset += 30
+        self._debug_cache = cache
     
     def run(self):
         """Boucle principale du moteur"""
         self.running = True
+        self.last_time = time.perf_counter_ns()
         
         while self.running:
-            frame_start = time.time()
+            timed = self._timing_enabled()
+            if timed:
+                frame_start = time.perf_counter_ns()
             
             # Événements
             for event in pygame.event.get():
@@ -306,20 +858,24 @@ class PhysicsEngine:
                     elif event.key == pygame.K_ESCAPE:
                         self.running = False
             
-            # Simulation
-            self.step()
+            # Simulation à pas fixe
+            now = time.perf_counter_ns()
+            frame_dt = min((now - self.last_time) / 1e9, 0.25)
+            self.last_time = now
+            self._advance(frame_dt * self.time_scale)
             
-            # Rendu
-            self.render()
+            # Rendu interpolé entre les deux derniers états physiques
+            self._render_interpolated(self._accumulator / self.fixed_dt)
             
             # Timing
             self.clock.tick(self.config.fps)
             
             # Stats de performance
-            frame_time = time.time() - frame_start
-            self.performance_stats['frame_time'] = frame_time
+            if timed:
+                self.performance_stats['frame_time_ns'] = time.perf_counter_ns() - frame_start
             self.performance_stats['fps'] = self.clock.get_fps()
             
             self.frame_count += 1
         
+        self.stop_render_thread()
         pygame.quit()
\ No newline at end of file
@@ -0,0 +1,18 @@
+# physics_engine/core/jit.py
+"""
+Compilation JIT optionnelle (Numba) pour les noyaux de calcul
+"""
+
+# Numba est une dépendance optionnelle : sans lui, les noyaux restent en Python
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Remplaçant sans effet de numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
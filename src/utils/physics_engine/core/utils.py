@@ -4,8 +4,11 @@ Utilitaires pour le moteur de physique
 """
 import math
 import random
-from typing import Tuple, List
+from typing import Tuple, List, Union
+import numpy as np
+
 from .vector import Vector2D
+from .jit import njit
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
     """Limite une valeur entre min et max"""
@@ -31,8 +34,14 @@ def hsv_to_rgb(h: float, s: float, v: float) -> Tuple[int, int, int]:
     r, g, b = colorsys.hsv_to_rgb(h, s, v)
     return (int(r * 255), int(g * 255), int(b * 255))
 
+# Table des teintes pleines (saturation = valeur = 1), partagée par tous les appels
+_RAINBOW_LUT_SIZE = 1024
+_RAINBOW_LUT = tuple(hsv_to_rgb(i / _RAINBOW_LUT_SIZE, 1.0, 1.0) for i in range(_RAINBOW_LUT_SIZE))
+
 def rainbow_color(t: float, saturation: float = 1.0, value: float = 1.0) -> Tuple[int, int, int]:
     """Génère une couleur arc-en-ciel"""
+    if saturation == 1.0 and value == 1.0:
+        return _RAINBOW_LUT[int(t * _RAINBOW_LUT_SIZE) & (_RAINBOW_LUT_SIZE - 1)]
     hue = (t % 1.0)
     return hsv_to_rgb(hue, saturation, value)
 
@@ -48,30 +57,42 @@ def distance_point_to_line(point: Vector2D, line_start: Vector2D, line_end: Vect
     projection = line_start + line_vec * t
     return point.distance_to(projection)
 
-def polygon_contains_point(polygon: List[Vector2D], point: Vector2D) -> bool:
-    """Test si un point est dans un polygone (ray casting)"""
+def polygon_arrays(polygon: List[Vector2D]) -> Tuple[np.ndarray, np.ndarray]:
+    """Extrait les sommets d'un polygone en tableaux (xs, ys), à conserver avec le polygone"""
     n = len(polygon)
+    xs = np.fromiter((v.x for v in polygon), dtype=np.float64, count=n)
+    ys = np.fromiter((v.y for v in polygon), dtype=np.float64, count=n)
+    return xs, ys
+
+@njit(cache=True)
+def _polygon_contains_point(xs, ys, px, py):
+    """Ray casting sur les sommets (xs, ys)"""
+    n = xs.shape[0]
     inside = False
     
-    p1x, p1y = polygon[0].x, polygon[0].y
+    p1x, p1y = xs[n - 1], ys[n - 1]
     
-    for i in range(1, n + 1):
-        p2x, p2y = polygon[i % n].x, polygon[i % n].y
+    for i in range(n):
+        p2x, p2y = xs[i], ys[i]
         
-        if point.y > min(p1y, p2y):
-            if point.y <= max(p1y, p2y):
-                if point.x <= max(p1x, p2x):
-                    if p1y != p2y:
-                        xinters = (point.y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                    if p1x == p2x or point.x <= xinters:
-                        inside = not inside
+        # L'arête traverse l'horizontale du point (jamais vrai si p1y == p2y) à droite du point
+        if ((p1y > py) != (p2y > py)) and (px < (p2x - p1x) * (py - p1y) / (p2y - p1y) + p1x):
+            inside = not inside
         p1x, p1y = p2x, p2y
     
     return inside
 
-def smooth_step(edge0: float, edge1: float, x: float) -> float:
-    """Fonction de lissage"""
-    t = clamp((x - edge0) / (edge1 - edge0), 0.0, 1.0)
+def polygon_contains_point(polygon: Union[List[Vector2D], Tuple[np.ndarray, np.ndarray]], point: Vector2D) -> bool:
+    """Test si un point est dans un polygone (ray casting), polygone en Vector2D ou issu de polygon_arrays"""
+    if isinstance(polygon, tuple):
+        xs, ys = polygon
+    else:
+        xs, ys = polygon_arrays(polygon)
+    return bool(_polygon_contains_point(xs, ys, point.x, point.y))
+
+def smooth_step(edge0: float, edge1: float, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """Fonction de lissage (scalaire ou tableau NumPy, élément par élément)"""
+    t = np.clip((x - edge0) / (edge1 - edge0), 0.0, 1.0)
     return t * t * (3.0 - 2.0 * t)
 
 def ease_in_out_quad(t: float) -> float:
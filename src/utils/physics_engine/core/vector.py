@@ -62,19 +62,33 @@ class Vector2D:
     @property
     def normalized(self) -> 'Vector2D':
         """Vecteur normalisé (longueur 1)"""
-        mag = self.magnitude
-        if mag == 0:
+        mag_sq = self.x * self.x + self.y * self.y
+        if mag_sq == 0:
             return Vector2D(0, 0)
-        return Vector2D(self.x / mag, self.y / mag)
+        inv_mag = 1.0 / math.sqrt(mag_sq)
+        return Vector2D(self.x * inv_mag, self.y * inv_mag)
     
     def normalize(self) -> 'Vector2D':
         """Normalise ce vecteur (modifie en place)"""
-        mag = self.magnitude
-        if mag > 0:
-            self.x /= mag
-            self.y /= mag
+        mag_sq = self.x * self.x + self.y * self.y
+        if mag_sq > 0:
+            inv_mag = 1.0 / math.sqrt(mag_sq)
+            self.x *= inv_mag
+            self.y *= inv_mag
         return self
     
+    def normalize_into(self, out: 'Vector2D') -> 'Vector2D':
+        """Écrit le vecteur normalisé dans out (sans allocation)"""
+        mag_sq = self.x * self.x + self.y * self.y
+        if mag_sq > 0:
+            inv_mag = 1.0 / math.sqrt(mag_sq)
+            out.x = self.x * inv_mag
+            out.y = self.y * inv_mag
+        else:
+            out.x = 0.0
+            out.y = 0.0
+        return out
+    
     def dot(self, other: 'Vector2D') -> float:
         """Produit scalaire"""
         return self.x * other.x + self.y * other.y
@@ -124,6 +138,21 @@ class Vector2D:
         """Interpolation linéaire"""
         return self + (other - self) * t
     
+    # Accès de type séquence (pygame accepte directement le vecteur comme coordonnées)
+    def __len__(self) -> int:
+        return 2
+    
+    def __iter__(self):
+        yield self.x
+        yield self.y
+    
+    def __getitem__(self, index):
+        if index == 0:
+            return self.x
+        if index == 1:
+            return self.y
+        return (self.x, self.y)[index]
+    
     def copy(self) -> 'Vector2D':
         """Copie du vecteur"""
         return Vector2D(self.x, self.y)
@@ -136,4 +165,11 @@ class Vector2D:
         return f"Vector2D({self.x:.2f}, {self.y:.2f})"
     
     def __repr__(self) -> str:
-        return f"Vector2D({self.x}, {self.y})"
\ No newline at end of file
+        return f"Vector2D({self.x}, {self.y})"
+
+# Extension Cython optionnelle (core/_vector.pyx compilé), sinon la classe Python ci-dessus
+try:
+    from ._vector import Vector2D
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
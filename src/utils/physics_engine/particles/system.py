@@ -5,12 +5,13 @@ Système de particules avancé pour effets visuels
 import pygame
 import math
 import random
+import numpy as np
 from typing import List, Tuple, Optional, Dict, Callable
-from dataclasses import dataclass, field
 from enum import Enum
 
 from ..core.vector import Vector2D
-from ..core.utils import hsv_to_rgb, rainbow_color, lerp, smooth_step
+from ..core.utils import hsv_to_rgb, rainbow_color, smooth_step
+from ..core.jit import njit, NUMBA_AVAILABLE
 
 class BlendMode(Enum):
     """Modes de mélange pour les particules"""
@@ -19,30 +20,183 @@ class BlendMode(Enum):
     MULTIPLY = 2
     SCREEN = 3
 
-@dataclass
-class ParticleData:
-    """Données d'une particule individuelle"""
-    position: Vector2D
-    velocity: Vector2D
-    acceleration: Vector2D = field(default_factory=lambda: Vector2D(0, 0))
-    
-    # Propriétés visuelles
-    color: Tuple[int, int, int] = (255, 255, 255)
-    alpha: float = 1.0
-    size: float = 5.0
-    rotation: float = 0.0
-    
-    # Propriétés d'animation
-    life: float = 1.0  # Durée de vie restante (0-1)
-    max_life: float = 1.0  # Durée de vie totale
-    
-    # Propriétés physiques
-    mass: float = 1.0
-    drag: float = 0.0
-    gravity_scale: float = 1.0
-    
-    # Propriétés spéciales
-    metadata: Dict = field(default_factory=dict)
+# Quantification des sprites additifs : 64 niveaux par canal, 16 niveaux d'alpha
+_RGBA_QUANT_MASK = np.array([0xFC, 0xFC, 0xFC, 0xF0], dtype=np.uint8)
+_SPRITE_CACHE_LIMIT = 1024
+
+# Rayon maximal rendu par sprite plutôt que par draw.circle en mode normal
+_TINY_DOT_MAX_RADIUS = 3
+
+# Nombre de pas de la table d'interpolation de couleur
+_COLOR_LUT_SIZE = 256
+
+# Tables sinus/cosinus pour l'émission (angle quantifié sur 10 bits)
+_TRIG_LUT_SIZE = 1024
+_TRIG_LUT_MASK = _TRIG_LUT_SIZE - 1
+_TRIG_LUT_SCALE = _TRIG_LUT_SIZE / (2 * math.pi)
+_SIN_LUT = np.sin(np.linspace(0.0, 2 * math.pi, _TRIG_LUT_SIZE, endpoint=False))
+_COS_LUT = np.cos(np.linspace(0.0, 2 * math.pi, _TRIG_LUT_SIZE, endpoint=False))
+
+def _trig_indices(angles: np.ndarray) -> np.ndarray:
+    """Indices dans les tables sinus/cosinus pour des angles en radians"""
+    index = np.rint(angles * _TRIG_LUT_SCALE).astype(np.intp)
+    index &= _TRIG_LUT_MASK
+    return index
+
+# Disques blancs pré-rendus, partagés par tous les émetteurs (clé : rayon)
+_CIRCLE_SURFACES: Dict[int, pygame.Surface] = {}
+
+def _circle_mask(radius: int) -> pygame.Surface:
+    """Disque blanc opaque de rayon donné sur fond transparent (mis en cache)"""
+    surface = _CIRCLE_SURFACES.get(radius)
+    if surface is None:
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (255, 255, 255, 255), (radius, radius), radius)
+        _CIRCLE_SURFACES[radius] = surface
+    return surface
+
+@njit(fastmath=True, cache=True)
+def _integrate_particles(px, py, vx, vy, life, mass, drag, gravity_scale, emitter_id,
+                         gx, gy, gravity_active, dt, n):
+    """Durée de vie, gravité (par émetteur), drag et intégration d'Euler semi-implicite, retourne le nombre de mortes"""
+    dead = 0
+    for i in range(n):
+        life[i] -= dt
+        if life[i] <= 0:
+            dead += 1
+        
+        nvx = vx[i]
+        nvy = vy[i]
+        acc_x = 0.0
+        acc_y = 0.0
+        if gravity_active:
+            k = emitter_id[i]
+            acc_x = gx[k] * gravity_scale[i]
+            acc_y = gy[k] * gravity_scale[i]
+        
+        # Drag quadratique : F = -v|v|·drag
+        if drag[i] > 0:
+            speed2 = nvx * nvx + nvy * nvy
+            if speed2 > 0:
+                drag_factor = math.sqrt(speed2) * drag[i] / mass[i]
+                acc_x -= nvx * drag_factor
+                acc_y -= nvy * drag_factor
+        
+        nvx += acc_x * dt
+        nvy += acc_y * dt
+        vx[i] = nvx
+        vy[i] = nvy
+        px[i] += nvx * dt
+        py[i] += nvy * dt
+    return dead
+
+def _integrate_soa(p: 'ParticleSoA', gx: np.ndarray, gy: np.ndarray, gravity_active: bool,
+                   dt: float, n: int) -> int:
+    """Intègre les n premières particules de p (gravité indexée par emitter_id), retourne le nombre de mortes"""
+    if NUMBA_AVAILABLE:
+        return _integrate_particles(p.pos_x, p.pos_y, p.vel_x, p.vel_y,
+                                    p.life, p.mass, p.drag, p.gravity_scale, p.emitter_id,
+                                    gx, gy, gravity_active, dt, n)
+    
+    p.life[:n] -= dt
+    
+    # Accélération : gravité + drag (F = -v|v|·drag, a = F/m)
+    vx, vy = p.vel_x[:n], p.vel_y[:n]
+    if gravity_active:
+        ids = p.emitter_id[:n]
+        ax = p.gravity_scale[:n] * gx[ids]
+        ay = p.gravity_scale[:n] * gy[ids]
+    else:
+        ax = np.zeros(n, dtype=np.float32)
+        ay = np.zeros(n, dtype=np.float32)
+    drag = p.drag[:n]
+    if drag.any():
+        drag_factor = np.sqrt(vx * vx + vy * vy)
+        drag_factor *= drag
+        drag_factor /= p.mass[:n]
+        ax -= vx * drag_factor
+        ay -= vy * drag_factor
+    
+    # Intégration d'Euler semi-implicite
+    vx += ax * dt
+    vy += ay * dt
+    p.pos_x[:n] += vx * dt
+    p.pos_y[:n] += vy * dt
+    return n - int(np.count_nonzero(p.life[:n] > 0))
+
+class ParticleSoA:
+    """Stockage des particules en structure de tableaux (un tableau NumPy par champ)"""
+
+    FIELDS = {
+        'pos_x': np.float32, 'pos_y': np.float32,
+        'vel_x': np.float32, 'vel_y': np.float32,
+        'life': np.float32, 'max_life': np.float32,
+        'size': np.float32, 'initial_size': np.float32, 'alpha': np.float32,
+        'r': np.uint8, 'g': np.uint8, 'b': np.uint8,
+        'mass': np.float32, 'drag': np.float32, 'gravity_scale': np.float32,
+        'emitter_id': np.int32,
+    }
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = max(1, capacity)
+        self.count = 0
+        for name, dtype in self.FIELDS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def ensure_capacity(self, needed: int):
+        """Agrandit les tableaux (doublement) pour contenir needed particules"""
+        if needed <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        for name in self.FIELDS:
+            # Les slots au-delà de count sont libres : leur contenu n'a pas d'importance
+            setattr(self, name, np.resize(getattr(self, name), capacity))
+        self.capacity = capacity
+
+    def compact(self, alive: np.ndarray):
+        """Retire les particules mortes en comblant leurs slots avec les dernières vivantes"""
+        dead = np.flatnonzero(~alive)
+        if dead.size == 0:
+            return
+        kept = self.count - dead.size
+        
+        # Slots libérés dans [0, kept) et survivants situés au-delà : même nombre
+        holes = dead[dead < kept]
+        if holes.size:
+            movers = np.flatnonzero(alive[kept:])
+            movers += kept
+            for name in self.FIELDS:
+                array = getattr(self, name)
+                array[holes] = array[movers]
+        self.count = kept
+    
+    def extend(self, other: 'ParticleSoA', emitter_id: int):
+        """Copie les particules de other à la suite, étiquetées emitter_id"""
+        n = other.count
+        self.ensure_capacity(self.count + n)
+        block = slice(self.count, self.count + n)
+        for name in self.FIELDS:
+            getattr(self, name)[block] = getattr(other, name)[:n]
+        self.emitter_id[block] = emitter_id
+        self.count += n
+    
+    def take(self, index) -> 'ParticleSoA':
+        """Copie des particules désignées par index (indices) dans un nouveau stockage"""
+        n = len(index)
+        taken = ParticleSoA(n)
+        for name in self.FIELDS:
+            getattr(taken, name)[:n] = getattr(self, name)[index]
+        taken.count = n
+        return taken
+    
+    def clear(self):
+        """Supprime toutes les particules"""
+        self.count = 0
 
 class ParticleEmitter:
     """Émetteur de particules"""
@@ -50,7 +204,18 @@ class ParticleEmitter:
     def __init__(self, position: Vector2D):
         self.position = position.copy()
         self.active = True
-        self.particles = []
+        self._dead = False  # Marqué pour retrait par l'EffectManager
+        
+        # Stockage propre, remplacé par le pool partagé quand l'émetteur est ajouté à un EffectManager
+        # (d'où l'attribut privé : le pool mélange les particules de tous les émetteurs)
+        self._store = ParticleSoA()
+        self._shared = False
+        self._pool_id = 0
+        self._particle_count = 0
+        self._rng = np.random.default_rng()
+        self._sprite_cache: Dict[Tuple[int, int, int, int, int], pygame.Surface] = {}
+        self._rgba_buf = np.empty((self._store.capacity, 4), dtype=np.uint8)
+        self._curve_vectorized: Dict[Callable, bool] = {}
         
         # Propriétés d'émission
         self.emission_rate = 10.0  # particules par seconde
@@ -73,9 +238,9 @@ class ParticleEmitter:
         self.particle_size_min = 2.0
         self.particle_size_max = 8.0
         
-        # Couleurs
+        # Couleurs (la table d'interpolation est reconstruite à chaque changement)
+        self._color_end = (255, 255, 255)
         self.color_start = (255, 255, 255)
-        self.color_end = (255, 255, 255)
         self.color_variance = 0.1
         
         # Physique
@@ -91,178 +256,368 @@ class ParticleEmitter:
         self.blend_mode = BlendMode.NORMAL
         self.texture = None
         
+    @property
+    def color_start(self) -> Tuple[int, int, int]:
+        """Couleur des particules à leur naissance"""
+        return self._color_start
+    
+    @color_start.setter
+    def color_start(self, color: Tuple[int, int, int]):
+        self._color_start = tuple(color)
+        self._color_start_column = np.array(self._color_start, dtype=np.int32)[:, None]
+        self._build_color_lut()
+    
+    @property
+    def color_variance(self) -> float:
+        """Variance de couleur à l'émission (fraction de 255)"""
+        return self._color_variance
+    
+    @color_variance.setter
+    def color_variance(self, variance: float):
+        self._color_variance = variance
+        self._variance_int = int(variance * 255)
+    
+    @property
+    def color_end(self) -> Tuple[int, int, int]:
+        """Couleur des particules en fin de vie"""
+        return self._color_end
+    
+    @color_end.setter
+    def color_end(self, color: Tuple[int, int, int]):
+        self._color_end = tuple(color)
+        self._build_color_lut()
+    
+    def _build_color_lut(self):
+        """Précalcule l'interpolation color_start -> color_end sur 256 pas"""
+        t = np.linspace(0.0, 1.0, _COLOR_LUT_SIZE)[:, None]
+        start = np.array(self._color_start, dtype=np.float64)
+        end = np.array(self._color_end, dtype=np.float64)
+        self._color_lut = (start + (end - start) * t).astype(np.uint8)
+    
+    @property
+    def emission_shape(self) -> str:
+        """Forme de la zone d'émission ("point", "circle", "line" ou "rect")"""
+        return self._emission_shape
+    
+    @emission_shape.setter
+    def emission_shape(self, shape: str):
+        self._emission_shape = shape
+        # Toute forme inconnue est traitée comme un rectangle
+        self._emit_fn = {
+            "point": self._emit_point,
+            "circle": self._emit_circle,
+            "line": self._emit_line,
+        }.get(shape, self._emit_rect)
+    
+    def _emit_point(self, n: int) -> Tuple[float, float]:
+        """Position d'émission d'une source ponctuelle (diffusée sur tout le bloc)"""
+        return self.position.x, self.position.y
+    
+    def _emit_circle(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions d'émission dans un disque de rayon emission_radius"""
+        # Angle tiré directement comme indice de table
+        theta = self._rng.integers(0, _TRIG_LUT_SIZE, n)
+        radius = self._rng.uniform(0, self.emission_radius, n)
+        px = self.position.x + np.take(_COS_LUT, theta) * radius
+        py = self.position.y + np.take(_SIN_LUT, theta) * radius
+        return px, py
+    
+    def _emit_line(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions d'émission sur un segment horizontal de longueur emission_size.x"""
+        px = self.position.x + self._rng.uniform(-0.5, 0.5, n) * self.emission_size.x
+        return px, self.position.y
+    
+    def _emit_rect(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Positions d'émission dans un rectangle emission_size centré"""
+        half_w = self.emission_size.x / 2
+        half_h = self.emission_size.y / 2
+        px = self.position.x + self._rng.uniform(-half_w, half_w, n)
+        py = self.position.y + self._rng.uniform(-half_h, half_h, n)
+        return px, py
+    
+    @property
+    def gravity(self) -> Vector2D:
+        """Gravité appliquée aux particules (réassigner pour la modifier)"""
+        return Vector2D(self._gravity_x, self._gravity_y)
+    
+    @gravity.setter
+    def gravity(self, gravity: Vector2D):
+        self._gravity_x = float(gravity.x)
+        self._gravity_y = float(gravity.y)
+        self._gravity_active = self._gravity_x * self._gravity_x + self._gravity_y * self._gravity_y > 0
+        # Tables à une entrée pour le noyau d'intégration (stockage propre, emitter_id = 0)
+        self._gravity_table_x = np.array([self._gravity_x])
+        self._gravity_table_y = np.array([self._gravity_y])
+    
+    @property
+    def particles(self) -> ParticleSoA:
+        """Particules de cet émetteur (copie extraite du pool si l'émetteur est géré)"""
+        if self._shared:
+            return self._store.take(self._particle_index())
+        return self._store
+    
+    @property
+    def particle_count(self) -> int:
+        """Nombre de particules vivantes de cet émetteur"""
+        return self._particle_count if self._shared else self._store.count
+    
+    def _particle_index(self):
+        """Indices de ses particules dans self._store (tranche si le stockage est propre)"""
+        if self._shared:
+            p = self._store
+            return np.flatnonzero(p.emitter_id[:p.count] == self._pool_id)
+        return slice(0, self._store.count)
+    
     def emit_burst(self, count: int):
         """Émet un burst de particules"""
-        for _ in range(count):
-            self._create_particle()
+        if count > 0:
+            self._create_particles_batch(count)
     
-    def _create_particle(self) -> ParticleData:
-        """Crée une nouvelle particule"""
+    def _create_particle(self) -> int:
+        """Crée une nouvelle particule et retourne son indice"""
+        return self._create_particles_batch(1)
+    
+    def _create_particles_batch(self, n: int) -> int:
+        """Crée n particules en un seul tirage vectorisé, retourne l'indice de la première"""
+        rng = self._rng
+        
         # Position d'émission
-        if self.emission_shape == "point":
-            pos = self.position.copy()
-        elif self.emission_shape == "circle":
-            angle = random.uniform(0, 2 * math.pi)
-            radius = random.uniform(0, self.emission_radius)
-            offset = Vector2D(math.cos(angle) * radius, math.sin(angle) * radius)
-            pos = self.position + offset
-        elif self.emission_shape == "line":
-            t = random.uniform(-0.5, 0.5)
-            pos = self.position + Vector2D(t * self.emission_size.x, 0)
-        else:  # rect
-            offset = Vector2D(
-                random.uniform(-self.emission_size.x/2, self.emission_size.x/2),
-                random.uniform(-self.emission_size.y/2, self.emission_size.y/2)
-            )
-            pos = self.position + offset
+        px, py = self._emit_fn(n)
         
         # Vitesse initiale
-        angle = math.radians(random.uniform(self.particle_angle_min, self.particle_angle_max))
-        speed = random.uniform(self.particle_speed_min, self.particle_speed_max)
-        velocity = Vector2D(math.cos(angle) * speed, math.sin(angle) * speed)
-        
-        # Propriétés
-        life = random.uniform(self.particle_life_min, self.particle_life_max)
-        size = random.uniform(self.particle_size_min, self.particle_size_max)
-        
-        # Couleur avec variance
-        color = self._vary_color(self.color_start, self.color_variance)
-        
-        particle = ParticleData(
-            position=pos,
-            velocity=velocity,
-            color=color,
-            size=size,
-            life=life,
-            max_life=life,
-            gravity_scale=1.0,
-            drag=self.drag
-        )
-        
-        self.particles.append(particle)
-        return particle
+        angles = np.radians(rng.uniform(self.particle_angle_min, self.particle_angle_max, n))
+        speeds = rng.uniform(self.particle_speed_min, self.particle_speed_max, n)
+        
+        # Couleur avec variance : un seul tirage (3, n) puis un seul clip
+        v = self._variance_int
+        if v:
+            colors = rng.integers(-v, v + 1, (3, n), dtype=np.int32)
+            colors += self._color_start_column
+            np.clip(colors, 0, 255, out=colors)
+        else:
+            colors = np.broadcast_to(self._color_start_column, (3, n))
+        
+        # Écriture en bloc dans les slots libres [count, count + n)
+        particles = self._store
+        particles.ensure_capacity(particles.count + n)
+        start = particles.count
+        block = slice(start, start + n)
+        particles.pos_x[block] = px
+        particles.pos_y[block] = py
+        direction = _trig_indices(angles)
+        np.multiply(np.take(_COS_LUT, direction), speeds, out=particles.vel_x[block], casting='same_kind')
+        np.multiply(np.take(_SIN_LUT, direction), speeds, out=particles.vel_y[block], casting='same_kind')
+        
+        # Durée de vie et taille tirées directement dans les tableaux
+        self._uniform_into(particles.life[block], self.particle_life_min, self.particle_life_max)
+        self._uniform_into(particles.size[block], self.particle_size_min, self.particle_size_max)
+        particles.max_life[block] = particles.life[block]
+        particles.initial_size[block] = particles.size[block]
+        particles.alpha[block] = 1.0
+        particles.r[block] = colors[0]
+        particles.g[block] = colors[1]
+        particles.b[block] = colors[2]
+        particles.mass[block] = 1.0
+        particles.drag[block] = self.drag
+        particles.gravity_scale[block] = 1.0
+        particles.emitter_id[block] = self._pool_id
+        particles.count = start + n
+        self._particle_count += n
+        return start
     
-    def _vary_color(self, base_color: Tuple[int, int, int], variance: float) -> Tuple[int, int, int]:
-        """Applique une variance à une couleur"""
-        r, g, b = base_color
-        
-        r = max(0, min(255, r + random.randint(-int(variance * 255), int(variance * 255))))
-        g = max(0, min(255, g + random.randint(-int(variance * 255), int(variance * 255))))
-        b = max(0, min(255, b + random.randint(-int(variance * 255), int(variance * 255))))
-        
-        return (r, g, b)
+    def _uniform_into(self, out: np.ndarray, low: float, high: float):
+        """Tire une loi uniforme [low, high) directement dans le tableau float32 out"""
+        self._rng.random(dtype=np.float32, out=out)
+        out *= high - low
+        out += low
     
     def update(self, dt: float):
         """Met à jour l'émetteur et ses particules"""
-        if not self.active:
+        if not self.active or (self.emission_rate <= 0 and self.particle_count == 0):
             return
         
         # Émission continue
         if self.emission_rate > 0:
             self.emission_accumulator += self.emission_rate * dt
-            while self.emission_accumulator >= 1.0:
-                self._create_particle()
-                self.emission_accumulator -= 1.0
+            if self.emission_accumulator >= 1.0:
+                count = int(self.emission_accumulator)
+                self._create_particles_batch(count)
+                self.emission_accumulator -= count
         
-        # Mise à jour des particules
-        for particle in self.particles[:]:  # Copie pour éviter les modifications pendant l'itération
-            self._update_particle(particle, dt)
-            
-            # Supprimer les particules mortes
-            if particle.life <= 0:
-                self.particles.remove(particle)
-    
-    def _update_particle(self, particle: ParticleData, dt: float):
-        """Met à jour une particule individuelle"""
-        # Durée de vie
-        particle.life -= dt
-        if particle.life <= 0:
+        # Particules du pool partagé : intégrées en une passe par l'EffectManager
+        if self._shared:
             return
         
-        # Progrès de vie (1.0 = nouveau, 0.0 = mort)
-        life_progress = particle.life / particle.max_life
-        
-        # Forces
-        total_force = Vector2D(0, 0)
-        
-        # Gravité
-        if self.gravity.magnitude > 0:
-            total_force += self.gravity * particle.gravity_scale * particle.mass
-        
-        # Drag
-        if particle.drag > 0 and particle.velocity.magnitude > 0:
-            drag_force = particle.velocity.normalized * -particle.velocity.magnitude_squared * particle.drag
-            total_force += drag_force
-        
-        # Accélération
-        particle.acceleration = total_force / particle.mass
+        p = self._store
+        n = p.count
+        if n == 0:
+            return
         
-        # Intégration de Verlet
-        particle.velocity += particle.acceleration * dt
-        particle.position += particle.velocity * dt
+        # Supprimer les particules mortes (aucun masque construit si toutes ont survécu)
+        if _integrate_soa(p, self._gravity_table_x, self._gravity_table_y, self._gravity_active, dt, n):
+            p.compact(p.life[:n] > 0)
         
         # Mise à jour des propriétés visuelles
-        self._update_particle_visuals(particle, life_progress)
+        self._update_visuals(slice(0, p.count))
     
-    def _update_particle_visuals(self, particle: ParticleData, life_progress: float):
-        """Met à jour les propriétés visuelles d'une particule"""
+    def _update_visuals(self, index):
+        """Met à jour les propriétés visuelles des particules désignées par index (tranche ou indices)"""
+        p = self._store
+        
+        # Progrès de vie (1.0 = nouveau, 0.0 = mort)
+        life_progress = p.life[index] / p.max_life[index]
+        if life_progress.size == 0:
+            return
+        
         # Taille sur la durée de vie
         if self.size_over_life:
-            particle.size = self.size_over_life(life_progress) * particle.metadata.get('initial_size', particle.size)
+            p.size[index] = self._evaluate_curve(self.size_over_life, life_progress) * p.initial_size[index]
         
         # Alpha sur la durée de vie
         if self.alpha_over_life:
-            particle.alpha = self.alpha_over_life(life_progress)
+            p.alpha[index] = self._evaluate_curve(self.alpha_over_life, life_progress)
         else:
             # Fade out par défaut
-            particle.alpha = life_progress
+            p.alpha[index] = life_progress
         
         # Couleur sur la durée de vie
         if self.color_over_life:
-            particle.color = self.color_over_life(life_progress)
-        elif self.color_start != self.color_end:
-            # Interpolation de couleur
-            t = 1.0 - life_progress
-            r = int(lerp(self.color_start[0], self.color_end[0], t))
-            g = int(lerp(self.color_start[1], self.color_end[1], t))
-            b = int(lerp(self.color_start[2], self.color_end[2], t))
-            particle.color = (r, g, b)
+            colors = [self.color_over_life(t) for t in life_progress.tolist()]
+            p.r[index], p.g[index], p.b[index] = np.array(colors, dtype=np.uint8).T
+        elif self._color_start != self._color_end:
+            # Interpolation de couleur via la table précalculée
+            lut_index = ((1.0 - life_progress) * (_COLOR_LUT_SIZE - 1)).astype(np.intp)
+            np.clip(lut_index, 0, _COLOR_LUT_SIZE - 1, out=lut_index)
+            p.r[index], p.g[index], p.b[index] = self._color_lut[lut_index].T
+    
+    def _evaluate_curve(self, curve: Callable, t: np.ndarray):
+        """Évalue une courbe d'animation sur tout le tableau, ou particule par particule si elle est scalaire"""
+        if self._curve_vectorized.get(curve, True):
+            try:
+                values = curve(t)
+                if np.shape(values) == t.shape:
+                    self._curve_vectorized[curve] = True
+                    return values
+            except (TypeError, ValueError):
+                pass
+            # Courbe écrite pour des scalaires : ne plus tenter l'appel vectorisé
+            self._curve_vectorized[curve] = False
+        return [curve(x) for x in t.tolist()]
     
     def render(self, screen: pygame.Surface):
         """Rendu de toutes les particules"""
-        for particle in self.particles:
-            self._render_particle(screen, particle)
+        self._render_indices(screen, self._particle_index())
     
-    def _render_particle(self, screen: pygame.Surface, particle: ParticleData):
-        """Rendu d'une particule individuelle"""
-        if particle.alpha <= 0 or particle.size <= 0:
+    def _render_indices(self, screen: pygame.Surface, index):
+        """Rendu des particules désignées par index (tranche ou indices)"""
+        p = self._store
+        
+        # Particules visibles et dans l'écran (taille d'écran lue une fois par rendu)
+        screen_w, screen_h = screen.get_size()
+        x, y, size = p.pos_x[index], p.pos_y[index], p.size[index]
+        reach = np.maximum(size, 1.0)
+        visible = np.flatnonzero(
+            (p.alpha[index] > 0) & (size > 0) &
+            (x + reach >= 0) & (x - reach < screen_w) &
+            (y + reach >= 0) & (y - reach < screen_h)
+        )
+        if visible.size == 0:
             return
+        if not isinstance(index, slice):
+            visible = index[visible]
+        rgba = self._fill_rgba(visible)
         
-        pos = (int(particle.position.x), int(particle.position.y))
-        size = max(1, int(particle.size))
-        color = particle.color
+        if self.blend_mode == BlendMode.ADD and not self.texture:
+            self._render_additive(screen, visible, rgba)
+            return
         
-        # Appliquer l'alpha
-        if particle.alpha < 1.0:
-            alpha = int(particle.alpha * 255)
-            color = (*color, alpha)
+        # Petits points (rayon <= 3) : sprites opaques en un seul blits, le reste via draw.circle
+        if not self.texture:
+            tiny = p.size[visible] < _TINY_DOT_MAX_RADIUS + 1
+            if tiny.any():
+                self._render_tiny_dots(screen, visible[tiny], rgba[tiny])
+                visible = visible[~tiny]
+                rgba = rgba[~tiny]
+        
+        columns = zip(p.pos_x[visible].tolist(), p.pos_y[visible].tolist(),
+                      p.size[visible].tolist(), rgba.tolist())
+        for x, y, size, color in columns:
+            self._render_particle(screen, x, y, size, color)
+    
+    def _render_tiny_dots(self, screen: pygame.Surface, visible: np.ndarray, rgba: np.ndarray):
+        """Rendu des particules de rayon <= 3 par blit de disques pré-teintés (mode normal)"""
+        p = self._store
+        radii = np.maximum(p.size[visible].astype(np.int32), 1)
+        xs = p.pos_x[visible].astype(np.int32) - radii
+        ys = p.pos_y[visible].astype(np.int32) - radii
+        
+        # draw.circle ignore l'alpha sur un écran opaque : sprite opaque de même couleur
+        cache = self._sprite_cache
+        if len(cache) > _SPRITE_CACHE_LIMIT:
+            cache.clear()
+        
+        blit_list = []
+        for radius, color, x, y in zip(radii.tolist(), rgba[:, :3].tolist(), xs.tolist(), ys.tolist()):
+            sprite_key = (radius, *color, 255)
+            sprite = cache.get(sprite_key)
+            if sprite is None:
+                sprite = _circle_mask(radius).copy()
+                sprite.fill((*color, 255), special_flags=pygame.BLEND_RGBA_MULT)
+                cache[sprite_key] = sprite
+            blit_list.append((sprite, (x, y)))
+        
+        screen.blits(blit_list, doreturn=False)
+    
+    def _fill_rgba(self, visible: np.ndarray) -> np.ndarray:
+        """Remplit le tampon RGBA (alpha fusionné à la couleur) des particules visibles"""
+        p = self._store
+        k = visible.size
+        if self._rgba_buf.shape[0] < k:
+            self._rgba_buf = np.empty((max(k, 2 * self._rgba_buf.shape[0]), 4), dtype=np.uint8)
+        rgba = self._rgba_buf[:k]
+        rgba[:, 0] = p.r[visible]
+        rgba[:, 1] = p.g[visible]
+        rgba[:, 2] = p.b[visible]
+        alpha = p.alpha[visible]
+        rgba[:, 3] = np.where(alpha < 1.0, alpha * 255, 255)
+        return rgba
+    
+    def _render_additive(self, screen: pygame.Surface, visible: np.ndarray, rgba: np.ndarray):
+        """Rendu additif : sprites mis en cache par (rayon, couleur quantifiée), un seul appel blits"""
+        p = self._store
+        
+        # Rayon entier et couleur RGBA quantifiée (clé du cache de sprites)
+        radii = np.maximum(p.size[visible].astype(np.int32), 1)
+        colors = rgba & _RGBA_QUANT_MASK
+        xs = p.pos_x[visible].astype(np.int32) - radii
+        ys = p.pos_y[visible].astype(np.int32) - radii
+        
+        cache = self._sprite_cache
+        if len(cache) > _SPRITE_CACHE_LIMIT:
+            cache.clear()
+        
+        blit_list = []
+        for radius, color, x, y in zip(radii.tolist(), colors.tolist(), xs.tolist(), ys.tolist()):
+            sprite_key = (radius, *color)
+            sprite = cache.get(sprite_key)
+            if sprite is None:
+                # Teinte d'une copie du disque blanc pré-rendu (pas de rastérisation)
+                sprite = _circle_mask(radius).copy()
+                sprite.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+                cache[sprite_key] = sprite
+            blit_list.append((sprite, (x, y), None, pygame.BLEND_ADD))
+        
+        screen.blits(blit_list, doreturn=False)
+    
+    def _render_particle(self, screen: pygame.Surface, x: float, y: float, size: float,
+                         color: List[int]):
+        """Rendu d'une particule individuelle (couleur RGBA)"""
+        if self.texture:
+            # Rendu avec texture (à implémenter)
+            return
         
-        try:
-            if self.texture:
-                # Rendu avec texture (à implémenter)
-                pass
-            else:
-                # Rendu simple
-                if self.blend_mode == BlendMode.ADD:
-                    # Mode additif
-                    temp_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(temp_surf, color, (size, size), size)
-                    screen.blit(temp_surf, (pos[0] - size, pos[1] - size), special_flags=pygame.BLEND_ADD)
-                else:
-                    # Mode normal
-                    pygame.draw.circle(screen, color, pos, size)
-        except:
-            pass  # Ignore rendering errors
+        # Rendu simple (particule déjà filtrée : visible et dans l'écran)
+        pygame.draw.circle(screen, color, (int(x), int(y)), max(1, int(size)))
 
 class EffectManager:
     """Gestionnaire d'effets visuels"""
@@ -271,8 +626,14 @@ class EffectManager:
         self.emitters = []
         self.screen_effects = []
         
-        # Shake d'écran
-        self.screen_shake = Vector2D(0, 0)
+        # Pool de particules partagé par tous les émetteurs (emitter_id = slot de l'émetteur)
+        self._particles = ParticleSoA(256)
+        self._slots: List[Optional[ParticleEmitter]] = []
+        self._free_slots: List[int] = []
+        
+        # Shake d'écran (composantes scalaires, sans Vector2D par frame)
+        self._shake_x = 0.0
+        self._shake_y = 0.0
         self.screen_shake_decay = 0.9
         
         # Flash d'écran
@@ -280,14 +641,59 @@ class EffectManager:
         self.screen_flash_color = (255, 255, 255)
         self.screen_flash_decay = 0.95
         
+    @property
+    def screen_shake(self) -> Vector2D:
+        """Décalage de shake courant"""
+        return Vector2D(self._shake_x, self._shake_y)
+    
+    @screen_shake.setter
+    def screen_shake(self, value: Vector2D):
+        self._shake_x = float(value.x)
+        self._shake_y = float(value.y)
+    
     def add_emitter(self, emitter: ParticleEmitter):
-        """Ajoute un émetteur"""
+        """Ajoute un émetteur (ses particules rejoignent le pool partagé)"""
+        emitter._dead = False
+        if not emitter._shared:
+            self._attach(emitter)
         self.emitters.append(emitter)
     
+    def _attach(self, emitter: ParticleEmitter):
+        """Branche l'émetteur sur le pool partagé en y déplaçant ses particules existantes"""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._slots)
+            self._slots.append(None)
+        self._slots[slot] = emitter
+        
+        own = emitter._store
+        self._particles.extend(own, slot)
+        emitter._store = self._particles
+        emitter._shared = True
+        emitter._pool_id = slot
+        emitter._particle_count = own.count
+    
+    def _detach(self, emitter: ParticleEmitter):
+        """Libère le slot de l'émetteur et lui rend un stockage propre (vide)"""
+        self._slots[emitter._pool_id] = None
+        self._free_slots.append(emitter._pool_id)
+        emitter._store = ParticleSoA()
+        emitter._shared = False
+        emitter._pool_id = 0
+        emitter._particle_count = 0
+    
+    def _group_particles(self) -> List[np.ndarray]:
+        """Indices des particules du pool regroupés par slot d'émetteur"""
+        pool = self._particles
+        ids = pool.emitter_id[:pool.count]
+        order = np.argsort(ids, kind='stable')
+        counts = np.bincount(ids, minlength=len(self._slots))
+        return np.split(order, np.cumsum(counts)[:-1])
+    
     def remove_emitter(self, emitter: ParticleEmitter):
-        """Supprime un émetteur"""
-        if emitter in self.emitters:
-            self.emitters.remove(emitter)
+        """Supprime un émetteur (retiré de la liste à la fin du prochain update)"""
+        emitter._dead = True
     
     def create_explosion_effect(self, position: Vector2D, intensity: float = 1.0, color: Tuple[int, int, int] = (255, 100, 0)):
         """Crée un effet d'explosion"""
@@ -356,7 +762,7 @@ class EffectManager:
         
         # Couleurs arc-en-ciel
         emitter.color_over_life = lambda t: rainbow_color(t * 2, 1.0, 1.0)
-        emitter.size_over_life = lambda t: math.sin(t * math.pi)
+        emitter.size_over_life = lambda t: np.sin(t * math.pi)
         
         emitter.emit_burst(count)
         self.add_emitter(emitter)
@@ -391,9 +797,8 @@ class EffectManager:
     
     def add_screen_shake(self, intensity: float):
         """Ajoute un shake d'écran"""
-        shake_x = random.uniform(-intensity, intensity)
-        shake_y = random.uniform(-intensity, intensity)
-        self.screen_shake += Vector2D(shake_x, shake_y)
+        self._shake_x += random.uniform(-intensity, intensity)
+        self._shake_y += random.uniform(-intensity, intensity)
     
     def add_screen_flash(self, intensity: float, color: Tuple[int, int, int] = (255, 255, 255)):
         """Ajoute un flash d'écran"""
@@ -402,18 +807,51 @@ class EffectManager:
     
     def update(self, dt: float):
         """Met à jour tous les effets"""
-        # Mise à jour des émetteurs
-        for emitter in self.emitters[:]:
-            emitter.update(dt)
+        # Émission dans le pool partagé (les émetteurs one-shot n'ont plus rien à faire ici)
+        for emitter in self.emitters:
+            if emitter.active and emitter.emission_rate > 0 and not emitter._dead:
+                emitter.update(dt)
+        
+        # Une seule intégration pour toutes les particules de tous les émetteurs
+        pool = self._particles
+        n = pool.count
+        if n:
+            # Les particules des émetteurs retirés meurent à ce pas
+            removed = [emitter._pool_id for emitter in self.emitters if emitter._dead]
+            if removed:
+                pool.life[:n][np.isin(pool.emitter_id[:n], removed)] = 0.0
             
-            # Supprimer les émetteurs inactifs sans particules
-            if not emitter.active and len(emitter.particles) == 0:
-                self.emitters.remove(emitter)
+            gx = np.array([emitter._gravity_x if emitter else 0.0 for emitter in self._slots])
+            gy = np.array([emitter._gravity_y if emitter else 0.0 for emitter in self._slots])
+            gravity_active = any(emitter._gravity_active for emitter in self._slots if emitter)
+            if _integrate_soa(pool, gx, gy, gravity_active, dt, n):
+                pool.compact(pool.life[:n] > 0)
+        
+        # Propriétés visuelles, émetteur par émetteur sur ses propres indices
+        groups = self._group_particles()
+        for emitter in self.emitters:
+            if emitter._dead:
+                continue
+            index = groups[emitter._pool_id]
+            emitter._particle_count = index.size
+            if index.size:
+                emitter._update_visuals(index)
+            elif not emitter.active:
+                # Émetteur inactif sans particules : retiré
+                emitter._dead = True
+        
+        # Compaction en une passe des émetteurs retirés
+        for emitter in self.emitters:
+            if emitter._dead:
+                self._detach(emitter)
+        self.emitters = [emitter for emitter in self.emitters if not emitter._dead]
         
         # Décroissance du shake
-        self.screen_shake *= self.screen_shake_decay
-        if self.screen_shake.magnitude < 0.1:
-            self.screen_shake = Vector2D(0, 0)
+        self._shake_x *= self.screen_shake_decay
+        self._shake_y *= self.screen_shake_decay
+        if self._shake_x * self._shake_x + self._shake_y * self._shake_y < 0.01:
+            self._shake_x = 0.0
+            self._shake_y = 0.0
         
         # Décroissance du flash
         self.screen_flash *= self.screen_flash_decay
@@ -422,9 +860,12 @@ class EffectManager:
     
     def render(self, screen: pygame.Surface):
         """Rendu de tous les effets"""
-        # Rendu des particules
+        # Rendu des particules, émetteur par émetteur (mode de mélange propre à chacun)
+        groups = self._group_particles()
         for emitter in self.emitters:
-            emitter.render(screen)
+            index = groups[emitter._pool_id]
+            if index.size and not emitter._dead:
+                emitter._render_indices(screen, index)
         
         # Flash d'écran
         if self.screen_flash > 0:
@@ -435,50 +876,46 @@ class EffectManager:
     
     def get_screen_offset(self) -> Tuple[int, int]:
         """Retourne l'offset d'écran pour le shake"""
-        return (int(self.screen_shake.x), int(self.screen_shake.y))
+        return (int(self._shake_x), int(self._shake_y))
     
     def clear_all_effects(self):
         """Supprime tous les effets"""
+        for emitter in self.emitters:
+            self._detach(emitter)
         self.emitters.clear()
-        self.screen_shake = Vector2D(0, 0)
+        self._particles.clear()
+        self._shake_x = 0.0
+        self._shake_y = 0.0
         self.screen_flash = 0.0
 
-# Fonctions d'aide pour créer des courbes d'animation
-def ease_in_quad(t: float) -> float:
+# Fonctions d'aide pour créer des courbes d'animation (scalaires ou tableaux NumPy)
+def ease_in_quad(t):
     """Ease-in quadratique"""
     return t * t
 
-def ease_out_quad(t: float) -> float:
+def ease_out_quad(t):
     """Ease-out quadratique"""
     return 1 - (1 - t) * (1 - t)
 
-def ease_in_out_quad(t: float) -> float:
+def ease_in_out_quad(t):
     """Ease-in-out quadratique"""
-    if t < 0.5:
-        return 2 * t * t
-    return 1 - 2 * (1 - t) * (1 - t)
+    t = np.asarray(t, dtype=np.float64)
+    return np.where(t < 0.5, 2 * t * t, 1 - 2 * (1 - t) * (1 - t))[()]
 
-def bounce(t: float) -> float:
+def bounce(t):
     """Fonction de rebond"""
-    if t < 1/2.75:
-        return 7.5625 * t * t
-    elif t < 2/2.75:
-        t -= 1.5/2.75
-        return 7.5625 * t * t + 0.75
-    elif t < 2.5/2.75:
-        t -= 2.25/2.75
-        return 7.5625 * t * t + 0.9375
-    else:
-        t -= 2.625/2.75
-        return 7.5625 * t * t + 0.984375
+    t = np.asarray(t, dtype=np.float64)
+    return np.where(
+        t < 1/2.75, 7.5625 * t * t,
+        np.where(t < 2/2.75, 7.5625 * (t - 1.5/2.75) ** 2 + 0.75,
+        np.where(t < 2.5/2.75, 7.5625 * (t - 2.25/2.75) ** 2 + 0.9375,
+                 7.5625 * (t - 2.625/2.75) ** 2 + 0.984375))
+    )[()]
 
-def elastic(t: float) -> float:
+def elastic(t):
     """Fonction élastique"""
-    if t <= 0:
-        return 0
-    if t >= 1:
-        return 1
-    
+    t = np.asarray(t, dtype=np.float64)
     p = 0.3
     s = p / 4
-    return -(2**(-10*t)) * math.sin((t - s) * (2 * math.pi) / p) + 1
\ No newline at end of file
+    curve = -np.exp2(-10 * t) * np.sin((t - s) * (2 * math.pi) / p) + 1
+    return np.where(t <= 0, 0.0, np.where(t >= 1, 1.0, curve))[()]
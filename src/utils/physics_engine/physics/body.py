@@ -4,23 +4,168 @@ Corps physiques pour le moteur de physique
 """
 import pygame
 import math
-from typing import List, Optional, Tuple, Union
+import numpy as np
+from collections import deque
+from itertools import islice
+from typing import Dict, List, Optional, Tuple, Union
 from abc import ABC, abstractmethod
 
 from ..core.vector import Vector2D
-from ..core.utils import rainbow_color, hsv_to_rgb
+from ..core.utils import rainbow_color, lerp
+from ..core.jit import njit, prange, NUMBA_AVAILABLE
+
+# Coordonnées de dessin acceptées par SDL (entiers 16 bits signés)
+_DRAW_COORD_LIMIT = 32768
+
+def _safe_int(value: float) -> Optional[int]:
+    """int(value) si la coordonnée est finie et dessinable, sinon None (NaN compris)"""
+    if -_DRAW_COORD_LIMIT < value < _DRAW_COORD_LIMIT:
+        return int(value)
+    return None
+
+# Nombre de paliers de fondu de la trainée (multiple de 3 pour que l'épaisseur
+# soit constante sur chaque palier)
+_TRAIL_FADE_STEPS = 6
+
+# Masque de quantification des couleurs de lueur (5 bits par canal) : un corps
+# dont la couleur varie réutilise le même sprite sur des teintes voisines
+_GLOW_COLOR_MASK = 0xF8
+
+# Pas angulaire (degrés) des sprites pré-tournés d'un anneau à gap, et budget
+# en pixels au-delà duquel l'anneau est redessiné directement chaque frame
+_RING_ANGLE_STEP = 2.0
+_RING_ROTATION_CACHE_MAX_PIXELS = 16 * 1024 * 1024
+
+# En dessous de cette épaisseur, un disque d'extrémité (rayon <= 1 px) ne se
+# distingue pas d'un prolongement carré de la ligne
+_ROUND_CAP_MIN_THICKNESS = 4
+
+# Nombre maximal de sprites de motif en cache (vidé au-delà)
+_PATTERN_CACHE_LIMIT = 256
+
+# Taille maximale (pixels) du sprite de pointillés d'un segment statique ; au-delà
+# les tirets sont redessinés directement chaque frame
+_DASH_SPRITE_MAX_PIXELS = 4 * 1024 * 1024
+
+# Sprites de cercles pleins avec contour : (rayon, couleur, contour, épaisseur) -> Surface
+_OUTLINED_CIRCLES: Dict[Tuple, pygame.Surface] = {}
+_OUTLINED_CIRCLE_LIMIT = 1024
+
+def outlined_circle_sprite(radius: int, color, outline_color, outline_width: int) -> pygame.Surface:
+    """Sprite (colorkey RLE) d'un disque et de son contour, centré en (radius, radius)
+    
+    Un blit RLE coûte moins que les deux rastérisations draw.circle qu'il remplace.
+    """
+    key = (radius, tuple(color), tuple(outline_color), outline_width)
+    sprite = _OUTLINED_CIRCLES.get(key)
+    if sprite is None:
+        if len(_OUTLINED_CIRCLES) >= _OUTLINED_CIRCLE_LIMIT:
+            _OUTLINED_CIRCLES.clear()
+        
+        # Couleur de transparence distincte des deux couleurs dessinées
+        transparent = (255, 0, 255)
+        if transparent in (tuple(color[:3]), tuple(outline_color[:3])):
+            transparent = (1, 0, 1)
+        
+        size = 2 * radius + 1
+        sprite = pygame.Surface((size, size))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        sprite.fill(transparent)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        pygame.draw.circle(sprite, outline_color, (radius, radius), radius, outline_width)
+        sprite.set_colorkey(transparent, pygame.RLEACCEL)
+        _OUTLINED_CIRCLES[key] = sprite
+    return sprite
+
+# Type de contact renvoyé par les noyaux cercle-anneau
+_RING_NO_CONTACT = 0
+_RING_INNER = 1
+_RING_OUTER = 2
+
+@njit(fastmath=True, cache=True)
+def _ring_circle_contact(cx, cy, inner, outer, has_gap, bisector_x, bisector_y, cos_half, px, py, r):
+    """Contact cercle-anneau : (type, nx, ny, pénétration, contact_x, contact_y)"""
+    dx = px - cx
+    dy = py - cy
+    distance = math.sqrt(dx * dx + dy * dy)
+    
+    # Hors de la zone de l'anneau
+    if distance + r < inner or distance - r > outer:
+        return _RING_NO_CONTACT, 0.0, 0.0, 0.0, 0.0, 0.0
+    
+    # Dans le gap (écart à la bissectrice inférieur au demi-angle)
+    if has_gap and distance > 0 and dx * bisector_x + dy * bisector_y > cos_half * distance:
+        return _RING_NO_CONTACT, 0.0, 0.0, 0.0, 0.0, 0.0
+    
+    ux = 0.0
+    uy = 0.0
+    if distance > 0:
+        ux = dx / distance
+        uy = dy / distance
+    
+    if distance < inner + r:
+        return _RING_INNER, ux, uy, inner + r - distance, cx + ux * inner, cy + uy * inner
+    if distance + r > outer:
+        return _RING_OUTER, -ux, -uy, r + distance - outer, cx + ux * outer, cy + uy * outer
+    return _RING_NO_CONTACT, 0.0, 0.0, 0.0, 0.0, 0.0
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _ring_circles_kernel(cx, cy, inner, outer, has_gap, bisector_x, bisector_y, cos_half,
+                         xs, ys, radii, kind, nx, ny, penetration, contact_x, contact_y):
+    """Contacts d'un anneau avec tous les cercles (un cercle par itération)"""
+    for i in prange(xs.shape[0]):
+        k, a, b, pen, qx, qy = _ring_circle_contact(cx, cy, inner, outer, has_gap,
+                                                    bisector_x, bisector_y, cos_half,
+                                                    xs[i], ys[i], radii[i])
+        kind[i] = k
+        nx[i] = a
+        ny[i] = b
+        penetration[i] = pen
+        contact_x[i] = qx
+        contact_y[i] = qy
 
 class PhysicsBody(ABC):
     """Classe de base pour tous les corps physiques"""
     
+    # Tag entier de type pour le dispatch des collisions (7 = type sans collision)
+    TAG = 7
+    
+    # Attributs dont la modification invalide la géométrie de collision
+    _GEOMETRY_ATTRS = frozenset({'position'})
+    
+    # Sous-ensemble de _GEOMETRY_ATTRS dont dépend la bounding box
+    _AABB_ATTRS = _GEOMETRY_ATTRS
+    
+    # Attributs d'instance fixes (pas de __dict__ par corps)
+    __slots__ = (
+        '_moved', '_aabb_version', '_aabb', '_aabb_box',
+        'position', 'velocity', 'acceleration', 'mass', 'inv_mass', 'static',
+        'restitution', 'friction', 'drag_coefficient', 'forces',
+        'sleeping', 'sleep_timer',
+        'color', 'visible', 'glow', 'glow_radius', '_glow_cache', '_glow_cache_key',
+        'trail_enabled', 'trail_points', '_trail_style_color', '_trail_style', '_trail_max_length',
+        'engine', '_idx', 'tags', 'on_collision',
+    )
+    
     def __init__(self, position: Vector2D, mass: float = 1.0, static: bool = False):
+        # Drapeau "sale" pour la détection de collisions (remis à False par le détecteur)
+        self._moved = True
+        
+        # Version de la géométrie, incrémentée à chaque modification (jamais remise à zéro)
+        self._aabb_version = 0
+        
+        # AABB (min_x, min_y, max_x, max_y) en cache, recalculée après modification,
+        # et sa version Vector2D (aabb, (min, max)) pour get_bounding_box
+        self._aabb = None
+        self._aabb_box = None
+        
         # Propriétés physiques
         self.position = position.copy()
         self.velocity = Vector2D(0, 0)
         self.acceleration = Vector2D(0, 0)
         self.mass = mass
-        self.inv_mass = 0.0 if static else 1.0 / mass
-        self.static = static
+        self.static = static  # Met aussi à jour inv_mass (voir __setattr__)
         
         # Propriétés matérielles
         self.restitution = 0.8  # Coefficient de rebond
@@ -30,14 +175,22 @@ class PhysicsBody(ABC):
         # Forces accumulées
         self.forces = []
         
+        # Sommeil (géré par le moteur quand sleep_enabled est actif)
+        self.sleeping = False
+        self.sleep_timer = 0
+        
         # Propriétés visuelles
         self.color = (255, 255, 255)
         self.visible = True
         self.glow = False
         self.glow_radius = 0
+        self._glow_cache = None
+        self._glow_cache_key = None
         self.trail_enabled = False
-        self.trail_points = []
-        self.trail_max_length = 50
+        self.trail_points = deque(maxlen=50)
+        self._trail_style_color = None  # Couleur pour laquelle _trail_style est calculé
+        self._trail_style = ()  # (couleur, épaisseur) de chaque palier de fondu
+        self.trail_max_length = 50  # Reconstruit trail_points (voir la propriété)
         
         # Référence au moteur
         self.engine = None
@@ -48,14 +201,33 @@ class PhysicsBody(ABC):
         # Callbacks personnalisés
         self.on_collision = None
     
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in self._GEOMETRY_ATTRS:
+            object.__setattr__(self, '_moved', True)
+            if name in self._AABB_ATTRS:
+                object.__setattr__(self, '_aabb_version', getattr(self, '_aabb_version', 0) + 1)
+                object.__setattr__(self, '_aabb', None)
+        elif name == 'mass' or name == 'static':
+            # Masse inverse en cache (nulle pour un corps statique)
+            static = getattr(self, 'static', False)
+            object.__setattr__(self, 'inv_mass', 0.0 if static else 1.0 / self.mass)
+    
     def add_force(self, force: Vector2D):
         """Ajoute une force au corps"""
         self.forces.append(force)
+        self.wake()
     
     def add_impulse(self, impulse: Vector2D):
         """Ajoute une impulsion au corps"""
         if not self.static:
             self.velocity += impulse * self.inv_mass
+            self.wake()
+    
+    def wake(self):
+        """Réveille le corps"""
+        self.sleeping = False
+        self.sleep_timer = 0
     
     def add_tag(self, tag: str):
         """Ajoute un tag"""
@@ -65,45 +237,83 @@ class PhysicsBody(ABC):
         """Vérifie si le corps a un tag"""
         return tag in self.tags
     
+    @property
+    def trail_max_length(self) -> int:
+        """Longueur maximale de la trainée"""
+        return self._trail_max_length
+    
+    @trail_max_length.setter
+    def trail_max_length(self, value: int):
+        self._trail_max_length = value
+        if self.trail_points.maxlen != value:
+            # Garde les points les plus récents
+            self.trail_points = deque(self.trail_points, maxlen=value)
+    
     def update_trail(self):
         """Met à jour la trainée"""
         if self.trail_enabled:
-            self.trail_points.append(self.position.copy())
-            if len(self.trail_points) > self.trail_max_length:
-                self.trail_points.pop(0)
+            # Tuples (x, y) entiers validés une fois ici : directement utilisables par
+            # pygame.draw.lines ; le deque borné supprime le point le plus ancien en O(1)
+            x = _safe_int(self.position.x)
+            y = _safe_int(self.position.y)
+            if x is not None and y is not None:
+                self.trail_points.append((x, y))
     
     def render_trail(self, screen: pygame.Surface):
-        """Rendu de la trainée"""
-        if not self.trail_enabled or len(self.trail_points) < 2:
+        """Rendu de la trainée (un draw.lines par palier de fondu)"""
+        count = len(self.trail_points)
+        if not self.trail_enabled or count < 2:
             return
         
-        for i in range(1, len(self.trail_points)):
-            alpha = i / len(self.trail_points)
-            color = tuple(int(c * alpha) for c in self.color)
-            width = max(1, int(alpha * 3))
-            
-            start = self.trail_points[i-1].tuple()
-            end = self.trail_points[i].tuple()
+        # Parcours séquentiel du deque (pas d'accès indexé)
+        points = iter(self.trail_points)
+        last = next(points)
+        
+        # Couleur et épaisseur de chaque palier, recalculées seulement si la couleur change
+        if self.color != self._trail_style_color:
+            self._trail_style_color = self.color
+            self._trail_style = tuple(
+                (tuple(int(c * (bucket + 0.5) / _TRAIL_FADE_STEPS) for c in self.color),
+                 max(1, int(bucket / _TRAIL_FADE_STEPS * 3)))
+                for bucket in range(_TRAIL_FADE_STEPS))
+        style = self._trail_style
+        
+        # Le segment i (1..count-1) a un alpha de i/count ; les segments consécutifs
+        # d'un même palier partagent couleur et épaisseur
+        steps = _TRAIL_FADE_STEPS
+        start = 1
+        while start < count:
+            bucket = start * steps // count
+            end = max(start + 1, min(count, -(-(bucket + 1) * count // steps)))
+            color, width = style[bucket]
             
-            try:
-                pygame.draw.line(screen, color, start, end, width)
-            except:
-                pass  # Ignore invalid coordinates
+            chunk = [last]
+            chunk.extend(islice(points, end - start))
+            last = chunk[-1]
+            pygame.draw.lines(screen, color, False, chunk, width)
+            start = end
     
     def render_glow(self, screen: pygame.Surface):
         """Rendu de l'effet de lueur"""
         if not self.glow or self.glow_radius <= 0:
             return
         
-        # Créer une surface pour l'effet de lueur
-        glow_surf = pygame.Surface((self.glow_radius * 4, self.glow_radius * 4), pygame.SRCALPHA)
-        center = (self.glow_radius * 2, self.glow_radius * 2)
-        
-        # Dégradé radial
-        for r in range(self.glow_radius, 0, -2):
-            alpha = int(30 * (1 - r / self.glow_radius))
-            color = (*self.color, alpha)
-            pygame.draw.circle(glow_surf, color, center, r)
+        # Sprite de lueur en cache, reconstruit seulement si couleur ou rayon changent
+        base = tuple(int(c) & _GLOW_COLOR_MASK for c in self.color)
+        key = (base, self.glow_radius)
+        glow_surf = self._glow_cache
+        if key != self._glow_cache_key:
+            glow_surf = pygame.Surface((self.glow_radius * 4, self.glow_radius * 4), pygame.SRCALPHA)
+            center = (self.glow_radius * 2, self.glow_radius * 2)
+            
+            # Dégradé radial
+            for r in range(self.glow_radius, 0, -2):
+                alpha = int(30 * (1 - r / self.glow_radius))
+                color = (*base, alpha)
+                pygame.draw.circle(glow_surf, color, center, r)
+            
+            self._glow_cache = glow_surf
+            self._glow_cache_key = key
         
         # Blitter sur l'écran
         glow_pos = (self.position.x - self.glow_radius * 2, 
@@ -115,14 +325,54 @@ class PhysicsBody(ABC):
         """Rendu du corps (à implémenter dans les sous-classes)"""
         pass
     
-    @abstractmethod
+    def invalidate_aabb(self):
+        """Signale une géométrie modifiée en place (ex. position.x += ...)"""
+        object.__setattr__(self, '_moved', True)
+        object.__setattr__(self, '_aabb_version', self._aabb_version + 1)
+        object.__setattr__(self, '_aabb', None)
+    
+    def get_bounding_box_raw(self) -> Tuple[float, float, float, float]:
+        """Bounding box (min_x, min_y, max_x, max_y) en cache, sans allocation de Vector2D"""
+        aabb = self._aabb
+        if aabb is None:
+            aabb = self._compute_aabb()
+            object.__setattr__(self, '_aabb', aabb)
+        return aabb
+    
+    # Nom court : (min_x, min_y, max_x, max_y) en flottants
+    get_aabb_xyxy = get_bounding_box_raw
+    
     def get_bounding_box(self) -> Tuple[Vector2D, Vector2D]:
         """Retourne la bounding box (min, max)"""
+        aabb = self.get_bounding_box_raw()
+        box = self._aabb_box
+        if box is None or box[0] is not aabb:
+            min_x, min_y, max_x, max_y = aabb
+            box = (aabb, (Vector2D(min_x, min_y), Vector2D(max_x, max_y)))
+            object.__setattr__(self, '_aabb_box', box)
+        return box[1]
+    
+    @abstractmethod
+    def _compute_aabb(self) -> Tuple[float, float, float, float]:
+        """Calcule la bounding box (à implémenter dans les sous-classes)"""
         pass
 
 class Circle(PhysicsBody):
     """Corps physique circulaire"""
     
+    TAG = 0
+    _GEOMETRY_ATTRS = frozenset({'position', 'radius'})
+    _AABB_ATTRS = _GEOMETRY_ATTRS
+    
+    # Sprites rayés partagés par tous les cercles : (rayon, couleur, densité) -> Surface
+    _stripe_cache: Dict[Tuple[int, Tuple[int, ...], int], pygame.Surface] = {}
+    
+    __slots__ = (
+        'radius', 'original_radius', 'outline_width', 'outline_color',
+        'pulsing', 'pulse_speed', 'pulse_amplitude', 'pulse_phase',
+        'rotation', 'angular_velocity', 'pattern', 'pattern_density',
+    )
+    
     def __init__(self, position: Vector2D, radius: float, mass: float = 1.0, static: bool = False):
         super().__init__(position, mass, static)
         self.radius = radius
@@ -174,6 +424,12 @@ class Circle(PhysicsBody):
             return
         
         # Cercle principal
+        if self.pattern is None and self.outline_width > 0:
+            # Disque + contour en un seul blit
+            sprite = outlined_circle_sprite(radius, self.color, self.outline_color, self.outline_width)
+            screen.blit(sprite, (pos[0] - radius, pos[1] - radius))
+            return
+        
         if self.pattern == 'stripes':
             self._render_striped_circle(screen, pos, radius)
         elif self.pattern == 'checker':
@@ -187,20 +443,28 @@ class Circle(PhysicsBody):
     
     def _render_striped_circle(self, screen: pygame.Surface, pos: Tuple[int, int], radius: int):
         """Rendu d'un cercle avec motif rayé"""
-        # Créer une surface temporaire
-        temp_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        temp_center = (radius, radius)
-        
-        # Dessiner les rayures
-        stripe_width = max(1, radius // self.pattern_density)
-        for i in range(-radius, radius, stripe_width * 2):
-            color = self.color if (i // stripe_width) % 2 == 0 else (0, 0, 0, 0)
-            pygame.draw.rect(temp_surf, color, (i + radius, 0, stripe_width, radius * 2))
-        
-        # Masquer avec un cercle
-        mask_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(mask_surf, (255, 255, 255, 255), temp_center, radius)
-        temp_surf.blit(mask_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        key = (radius, tuple(self.color), self.pattern_density)
+        cache = Circle._stripe_cache
+        temp_surf = cache.get(key)
+        if temp_surf is None:
+            if len(cache) >= _PATTERN_CACHE_LIMIT:
+                cache.clear()
+            
+            # Créer une surface temporaire
+            temp_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            temp_center = (radius, radius)
+            
+            # Dessiner les rayures
+            stripe_width = max(1, radius // self.pattern_density)
+            for i in range(-radius, radius, stripe_width * 2):
+                color = self.color if (i // stripe_width) % 2 == 0 else (0, 0, 0, 0)
+                pygame.draw.rect(temp_surf, color, (i + radius, 0, stripe_width, radius * 2))
+            
+            # Masquer avec un cercle
+            mask_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(mask_surf, (255, 255, 255, 255), temp_center, radius)
+            temp_surf.blit(mask_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            cache[key] = temp_surf
         
         # Blitter sur l'écran
         screen.blit(temp_surf, (pos[0] - radius, pos[1] - radius))
@@ -210,17 +474,32 @@ class Circle(PhysicsBody):
         # Similaire aux rayures mais en damier
         pygame.draw.circle(screen, self.color, pos, radius)
     
-    def get_bounding_box(self) -> Tuple[Vector2D, Vector2D]:
+    def _compute_aabb(self) -> Tuple[float, float, float, float]:
         """Bounding box du cercle"""
-        min_pos = Vector2D(self.position.x - self.radius, self.position.y - self.radius)
-        max_pos = Vector2D(self.position.x + self.radius, self.position.y + self.radius)
-        return (min_pos, max_pos)
+        x = self.position.x
+        y = self.position.y
+        r = self.radius
+        return (x - r, y - r, x + r, y + r)
 
 class Segment(PhysicsBody):
     """Segment de ligne pour les collisions"""
     
+    TAG = 1
+    _GEOMETRY_ATTRS = frozenset({'position', 'start', 'end', 'thickness'})
+    _AABB_ATTRS = _GEOMETRY_ATTRS
+    
+    __slots__ = (
+        '_line', 'start', 'end', 'thickness', 'original_thickness',
+        'rounded_ends', 'fast_caps', 'dashed', 'dash_length', 'dash_gap',
+        '_dash_sprite', '_dash_key',
+        'flow_effect', 'flow_speed', 'flow_phase',
+    )
+    
     def __init__(self, start: Vector2D, end: Vector2D, thickness: float = 5.0, static: bool = True):
         center = (start + end) / 2
+        
+        # Vecteur directeur en cache (version de géométrie, lx, ly, 1/longueur²)
+        self._line = None
         super().__init__(center, float('inf'), static)
         
         self.start = start.copy()
@@ -228,45 +507,83 @@ class Segment(PhysicsBody):
         self.thickness = thickness
         self.original_thickness = thickness
         
+        # Bounding box d'un segment statique calculée une fois pour toutes
+        if static:
+            self.get_bounding_box_raw()
+        
         # Propriétés visuelles
         self.rounded_ends = True
+        self.fast_caps = False  # Extrémités carrées prolongées (un seul appel de dessin)
         self.dashed = False
         self.dash_length = 10
         self.dash_gap = 5
+        self._dash_sprite = None  # Pointillés pré-rendus (segments statiques)
+        self._dash_key = None
         
         # Animation
         self.flow_effect = False
         self.flow_speed = 1.0
         self.flow_phase = 0.0
     
+    def set_endpoints(self, start: Vector2D, end: Vector2D):
+        """Déplace les extrémités (et le centre) du segment"""
+        self.start = start.copy()
+        self.end = end.copy()
+        self.position = (start + end) / 2
+    
+    def _line_vector(self) -> Tuple[int, float, float, float]:
+        """Vecteur directeur en cache, recalculé quand la géométrie change de version"""
+        line = self._line
+        if line is None or line[0] != self._aabb_version:
+            lx = self.end.x - self.start.x
+            ly = self.end.y - self.start.y
+            length_sq = lx * lx + ly * ly
+            line = (self._aabb_version, lx, ly, 1.0 / length_sq if length_sq else 0.0)
+            object.__setattr__(self, '_line', line)
+        return line
+    
     def get_length(self) -> float:
         """Longueur du segment"""
         return self.start.distance_to(self.end)
     
     def get_direction(self) -> Vector2D:
         """Direction normalisée du segment"""
-        return (self.end - self.start).normalized
+        _, lx, ly, inv_length_sq = self._line_vector()
+        k = math.sqrt(inv_length_sq)
+        return Vector2D(lx * k, ly * k)
     
     def get_normal(self) -> Vector2D:
         """Normale perpendiculaire au segment"""
-        direction = self.get_direction()
-        return Vector2D(-direction.y, direction.x)
+        _, lx, ly, inv_length_sq = self._line_vector()
+        k = math.sqrt(inv_length_sq)
+        return Vector2D(-ly * k, lx * k)
+    
+    def _closest_point_xy(self, px: float, py: float) -> Tuple[float, float]:
+        """Point le plus proche sur le segment, en flottants (sans Vector2D intermédiaire)"""
+        _, lx, ly, inv_length_sq = self._line_vector()
+        start = self.start
+        sx = start.x
+        sy = start.y
+        if inv_length_sq == 0:
+            return sx, sy
+        
+        t = ((px - sx) * lx + (py - sy) * ly) * inv_length_sq
+        if t < 0.0:
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
+        return sx + lx * t, sy + ly * t
     
     def closest_point_on_segment(self, point: Vector2D) -> Vector2D:
         """Point le plus proche sur le segment"""
-        line_vec = self.end - self.start
-        point_vec = point - self.start
-        
-        if line_vec.magnitude_squared == 0:
-            return self.start.copy()
-        
-        t = max(0, min(1, point_vec.dot(line_vec) / line_vec.magnitude_squared))
-        return self.start + line_vec * t
+        return Vector2D(*self._closest_point_xy(point.x, point.y))
     
     def distance_to_point(self, point: Vector2D) -> float:
         """Distance du point au segment"""
-        closest = self.closest_point_on_segment(point)
-        return point.distance_to(closest)
+        px = point.x
+        py = point.y
+        cx, cy = self._closest_point_xy(px, py)
+        return math.hypot(px - cx, py - cy)
     
     def update_flow(self, dt: float):
         """Met à jour l'effet de flow"""
@@ -278,50 +595,97 @@ class Segment(PhysicsBody):
         if not self.visible:
             return
         
-        start_pos = self.start.tuple()
-        end_pos = self.end.tuple()
+        start_pos = self.start
+        end_pos = self.end
         thickness = max(1, int(self.thickness))
         
-        try:
-            if self.dashed:
-                self._render_dashed_line(screen, start_pos, end_pos, thickness)
-            elif self.flow_effect:
-                self._render_flow_line(screen, start_pos, end_pos, thickness)
-            else:
-                pygame.draw.line(screen, self.color, start_pos, end_pos, thickness)
-                
-                if self.rounded_ends:
-                    pygame.draw.circle(screen, self.color, start_pos, thickness // 2)
-                    pygame.draw.circle(screen, self.color, end_pos, thickness // 2)
-        except:
-            pass  # Ignore invalid coordinates
+        # Coordonnées invalides (NaN, infinies, hors plage SDL) : rien à dessiner
+        sx = _safe_int(start_pos.x)
+        sy = _safe_int(start_pos.y)
+        ex = _safe_int(end_pos.x)
+        ey = _safe_int(end_pos.y)
+        if sx is None or sy is None or ex is None or ey is None:
+            return
+        
+        if self.dashed:
+            self._render_dashed_line(screen, start_pos, end_pos, thickness)
+        elif self.flow_effect:
+            self._render_flow_line(screen, start_pos, end_pos, thickness)
+        elif self.rounded_ends and (self.fast_caps or thickness < _ROUND_CAP_MIN_THICKNESS):
+            # Extrémités prolongées de thickness/2 : une seule ligne au lieu de ligne + 2 disques
+            fx, fy = start_pos.x, start_pos.y
+            dx = end_pos.x - fx
+            dy = end_pos.y - fy
+            length = math.hypot(dx, dy)
+            if length > 0:
+                k = thickness * 0.5 / length
+                dx *= k
+                dy *= k
+            pygame.draw.line(screen, self.color, (fx - dx, fy - dy),
+                             (end_pos.x + dx, end_pos.y + dy), thickness)
+        else:
+            pygame.draw.line(screen, self.color, (sx, sy), (ex, ey), thickness)
+            
+            if self.rounded_ends:
+                pygame.draw.circle(screen, self.color, (sx, sy), thickness // 2)
+                pygame.draw.circle(screen, self.color, (ex, ey), thickness // 2)
     
     def _render_dashed_line(self, screen: pygame.Surface, start: tuple, end: tuple, thickness: int):
         """Rendu d'une ligne pointillée"""
-        line_vec = Vector2D(end[0] - start[0], end[1] - start[1])
-        length = line_vec.magnitude
+        sx = start[0]
+        sy = start[1]
+        dx = end[0] - sx
+        dy = end[1] - sy
+        length = math.hypot(dx, dy)
         
         if length == 0:
             return
         
-        direction = line_vec / length
-        pattern_length = self.dash_length + self.dash_gap
+        # Origine entière du sprite : les coordonnées y gardent leur partie fractionnaire
+        pad = thickness + 1
+        ox = math.floor(min(sx, sx + dx)) - pad
+        oy = math.floor(min(sy, sy + dy)) - pad
+        width = math.ceil(abs(dx)) + 2 * pad + 1
+        height = math.ceil(abs(dy)) + 2 * pad + 1
         
-        current_pos = 0
-        drawing = True
+        if not self.static or width * height > _DASH_SPRITE_MAX_PIXELS:
+            self._draw_dashes(screen, sx, sy, dx, dy, length, thickness)
+            return
         
-        while current_pos < length:
-            segment_length = min(self.dash_length if drawing else self.dash_gap, length - current_pos)
-            
-            if drawing:
-                seg_start = (start[0] + direction.x * current_pos, 
-                           start[1] + direction.y * current_pos)
-                seg_end = (start[0] + direction.x * (current_pos + segment_length),
-                         start[1] + direction.y * (current_pos + segment_length))
-                pygame.draw.line(screen, self.color, seg_start, seg_end, thickness)
+        # Segment statique : tirets rastérisés une fois, puis un seul blit par frame
+        key = (sx - ox, sy - oy, dx, dy, thickness, tuple(self.color),
+               self.dash_length, self.dash_gap)
+        if key != self._dash_key:
+            transparent = (255, 0, 255)
+            if tuple(self.color[:3]) == transparent:
+                transparent = (1, 0, 1)
             
-            current_pos += segment_length
-            drawing = not drawing
+            sprite = pygame.Surface((width, height))
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            sprite.fill(transparent)
+            self._draw_dashes(sprite, sx - ox, sy - oy, dx, dy, length, thickness)
+            sprite.set_colorkey(transparent, pygame.RLEACCEL)
+            self._dash_sprite = sprite
+            self._dash_key = key
+        
+        screen.blit(self._dash_sprite, (ox, oy))
+    
+    def _draw_dashes(self, surface: pygame.Surface, sx: float, sy: float,
+                     dx: float, dy: float, length: float, thickness: int):
+        """Dessine les tirets de (sx, sy) à (sx + dx, sy + dy)"""
+        ux = dx / length
+        uy = dy / length
+        dash_length = self.dash_length
+        dash_gap = self.dash_gap
+        color = self.color
+        
+        current_pos = 0
+        while current_pos < length:
+            stop = current_pos + min(dash_length, length - current_pos)
+            pygame.draw.line(surface, color, (sx + ux * current_pos, sy + uy * current_pos),
+                             (sx + ux * stop, sy + uy * stop), thickness)
+            current_pos = stop + min(dash_gap, length - stop)
     
     def _render_flow_line(self, screen: pygame.Surface, start: tuple, end: tuple, thickness: int):
         """Rendu d'une ligne avec effet de flow"""
@@ -356,20 +720,39 @@ class Segment(PhysicsBody):
                 bright_color = tuple(min(255, c + 100) for c in self.color)
                 pygame.draw.line(screen, bright_color, seg_start, seg_end, thickness)
     
-    def get_bounding_box(self) -> Tuple[Vector2D, Vector2D]:
+    def _compute_aabb(self) -> Tuple[float, float, float, float]:
         """Bounding box du segment"""
         min_x = min(self.start.x, self.end.x) - self.thickness
         min_y = min(self.start.y, self.end.y) - self.thickness
         max_x = max(self.start.x, self.end.x) + self.thickness
         max_y = max(self.start.y, self.end.y) + self.thickness
         
-        return (Vector2D(min_x, min_y), Vector2D(max_x, max_y))
+        return (min_x, min_y, max_x, max_y)
 
 class Ring(PhysicsBody):
     """Anneau pour les simulations de type TikTok"""
     
+    TAG = 2
+    _GEOMETRY_ATTRS = frozenset({'position', 'inner_radius', 'outer_radius',
+                                 'gap_angle', 'gap_start', 'rotation'})
+    
+    # La rotation et le gap ne changent pas la bounding box (carré du rayon extérieur)
+    _AABB_ATTRS = frozenset({'position', 'inner_radius', 'outer_radius'})
+    
+    # Attributs dont dépend l'axe du gap (bissectrice et cosinus du demi-angle)
+    _GAP_ATTRS = frozenset({'gap_angle', 'gap_start', 'rotation'})
+    
+    __slots__ = (
+        '_gap_axis', 'inner_radius', 'outer_radius', 'gap_angle', 'gap_start',
+        'rotation', 'rotation_speed', 'gradient_enabled', 'gradient_colors', 'segments',
+        'color_shift_enabled', 'color_shift_speed', 'color_phase',
+        '_ring_cache', '_ring_cache_key', '_ring_source',
+    )
+    
     def __init__(self, center: Vector2D, inner_radius: float, outer_radius: float, 
                  gap_angle: float = 0, gap_start: float = 0, static: bool = True):
+        # Axe du gap en cache, recalculé à la demande (voir __setattr__)
+        self._gap_axis = None
         super().__init__(center, float('inf'), static)
         
         self.inner_radius = inner_radius
@@ -390,11 +773,31 @@ class Ring(PhysicsBody):
         self.color_shift_enabled = False
         self.color_shift_speed = 1.0
         self.color_phase = 0.0
+        
+        # Sprites pré-rendus (un seul sans gap, un par pas de rotation sinon)
+        self._ring_cache = None
+        self._ring_cache_key = None
+        self._ring_source = None
+        
+        # Bounding box d'un anneau statique calculée une fois pour toutes
+        if static:
+            self.get_bounding_box_raw()
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self._GAP_ATTRS:
+            object.__setattr__(self, '_gap_axis', None)
     
     def update_rotation(self, dt: float):
         """Met à jour la rotation"""
-        self.rotation += self.rotation_speed * dt
-        self.rotation = self.rotation % 360
+        self.rotation = (self.rotation + self.rotation_speed * dt) % 360
+    
+    def _compute_gap_axis(self) -> Tuple[float, float, float]:
+        """Bissectrice unitaire du gap et cosinus de son demi-angle"""
+        theta = math.radians(self.gap_start + self.rotation + self.gap_angle / 2)
+        axis = (math.cos(theta), math.sin(theta), math.cos(math.radians(self.gap_angle / 2)))
+        object.__setattr__(self, '_gap_axis', axis)
+        return axis
     
     def update_color_shift(self, dt: float):
         """Met à jour le décalage de couleur"""
@@ -410,62 +813,130 @@ class Ring(PhysicsBody):
         if not self.has_gap():
             return False
         
-        # Angle du point par rapport au centre
-        relative_pos = point - self.position
-        angle = math.degrees(math.atan2(relative_pos.y, relative_pos.x))
-        angle = (angle + 360) % 360  # Normaliser à [0, 360]
-        
-        # Angle du gap avec rotation
-        gap_start_rotated = (self.gap_start + self.rotation) % 360
-        gap_end = (gap_start_rotated + self.gap_angle) % 360
+        axis = self._gap_axis or self._compute_gap_axis()
         
-        # Vérifier si l'angle est dans le gap
-        if gap_start_rotated <= gap_end:
-            return gap_start_rotated <= angle <= gap_end
-        else:  # Le gap traverse 0°
-            return angle >= gap_start_rotated or angle <= gap_end
+        # Dans le gap si l'écart angulaire à la bissectrice est inférieur au
+        # demi-angle : cos(écart) = dot(direction, bissectrice) > cos(demi-angle)
+        dx = point.x - self.position.x
+        dy = point.y - self.position.y
+        distance = math.hypot(dx, dy)
+        if distance == 0:
+            return False
+        return (dx * axis[0] + dy * axis[1]) > axis[2] * distance
     
     def collision_with_circle(self, circle_pos: Vector2D, circle_radius: float) -> dict:
         """Détection de collision avec un cercle"""
-        distance = self.position.distance_to(circle_pos)
+        # Calcul en flottants : les Vector2D ne sont créés que pour le résultat
+        cx = self.position.x
+        cy = self.position.y
+        dx = circle_pos.x - cx
+        dy = circle_pos.y - cy
+        distance = math.hypot(dx, dy)
+        inner_radius = self.inner_radius
+        outer_radius = self.outer_radius
         
         # Vérifier si le cercle est dans la zone de l'anneau
-        if distance + circle_radius < self.inner_radius:
+        if distance + circle_radius < inner_radius:
             return None  # Complètement à l'intérieur
         
-        if distance - circle_radius > self.outer_radius:
+        if distance - circle_radius > outer_radius:
             return None  # Complètement à l'extérieur
         
         # Vérifier le gap
-        if self.has_gap() and self.point_in_gap(circle_pos):
+        if self.gap_angle > 0 and self.point_in_gap(circle_pos):
             return None  # Dans le gap
         
+        # Direction centre -> cercle (nulle si confondus)
+        if distance > 0:
+            inv_distance = 1.0 / distance
+            ux = dx * inv_distance
+            uy = dy * inv_distance
+        else:
+            ux = uy = 0.0
+        
         # Collision détectée
         collision_info = {}
         
-        if distance < self.inner_radius + circle_radius:
+        if distance < inner_radius + circle_radius:
             # Collision avec le bord intérieur
-            normal = (circle_pos - self.position).normalized
-            penetration = self.inner_radius + circle_radius - distance
             collision_info = {
                 'type': 'inner',
-                'normal': normal,
-                'penetration': penetration,
-                'contact_point': self.position + normal * self.inner_radius
+                'normal': Vector2D(ux, uy),
+                'penetration': inner_radius + circle_radius - distance,
+                'contact_point': Vector2D(cx + ux * inner_radius, cy + uy * inner_radius)
             }
-        elif distance + circle_radius > self.outer_radius:
+        elif distance + circle_radius > outer_radius:
             # Collision avec le bord extérieur
-            normal = (self.position - circle_pos).normalized
-            penetration = circle_radius + distance - self.outer_radius
             collision_info = {
                 'type': 'outer',
-                'normal': normal,
-                'penetration': penetration,
-                'contact_point': self.position + (circle_pos - self.position).normalized * self.outer_radius
+                'normal': Vector2D(-ux, -uy),
+                'penetration': circle_radius + distance - outer_radius,
+                'contact_point': Vector2D(cx + ux * outer_radius, cy + uy * outer_radius)
             }
         
         return collision_info
     
+    def collision_with_circles(self, xs: np.ndarray, ys: np.ndarray, radii: np.ndarray
+                               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Détection vectorisée contre un ensemble de cercles (même résultat que collision_with_circle)
+        
+        Retourne (indices, normales (K, 2), pénétrations, points de contact (K, 2), bord extérieur).
+        """
+        cx = self.position.x
+        cy = self.position.y
+        
+        if NUMBA_AVAILABLE:
+            # Une seule passe compilée, sans tableaux temporaires
+            count = xs.shape[0]
+            kind = np.empty(count, dtype=np.int8)
+            nx = np.empty(count)
+            ny = np.empty(count)
+            penetration = np.empty(count)
+            contact_x = np.empty(count)
+            contact_y = np.empty(count)
+            bisector_x, bisector_y, cos_half = self._gap_axis or self._compute_gap_axis()
+            _ring_circles_kernel(cx, cy, float(self.inner_radius), float(self.outer_radius),
+                                 self.gap_angle > 0, bisector_x, bisector_y, cos_half,
+                                 xs, ys, radii, kind, nx, ny, penetration, contact_x, contact_y)
+            
+            indices = np.flatnonzero(kind)
+            return (indices, np.column_stack((nx[indices], ny[indices])), penetration[indices],
+                    np.column_stack((contact_x[indices], contact_y[indices])),
+                    kind[indices] == _RING_OUTER)
+        
+        dx = xs - cx
+        dy = ys - cy
+        distance = np.hypot(dx, dy)
+        
+        # Cercles dans la zone de l'anneau, touchant le bord intérieur ou extérieur
+        inner = distance < self.inner_radius + radii
+        outer = distance + radii > self.outer_radius
+        hit = ((distance + radii >= self.inner_radius) & (distance - radii <= self.outer_radius)
+               & (inner | outer))
+        
+        if self.has_gap():
+            axis = self._gap_axis or self._compute_gap_axis()
+            hit &= ~((dx * axis[0] + dy * axis[1] > axis[2] * distance) & (distance > 0))
+        
+        indices = np.flatnonzero(hit)
+        distance = distance[indices]
+        inner = inner[indices]
+        r = radii[indices]
+        
+        # Direction centre -> cercle (nulle si confondus)
+        safe = np.where(distance > 0, distance, 1.0)
+        ux = np.where(distance > 0, dx[indices] / safe, 0.0)
+        uy = np.where(distance > 0, dy[indices] / safe, 0.0)
+        
+        # Bord intérieur : normale vers le cercle ; bord extérieur : vers le centre
+        sign = np.where(inner, 1.0, -1.0)
+        normals = np.column_stack((ux * sign, uy * sign))
+        penetrations = np.where(inner, self.inner_radius + r - distance, r + distance - self.outer_radius)
+        edge = np.where(inner, self.inner_radius, self.outer_radius)
+        contacts = np.column_stack((cx + ux * edge, cy + uy * edge))
+        
+        return indices, normals, penetrations, contacts, ~inner
+    
     def render(self, screen: pygame.Surface):
         """Rendu de l'anneau"""
         if not self.visible:
@@ -473,12 +944,63 @@ class Ring(PhysicsBody):
         
         center = (int(self.position.x), int(self.position.y))
         
+        # Anneau plein uni : un seul draw.circle, plus rapide qu'un blit SRCALPHA ;
+        # couleur animée : change à chaque frame, rien à mettre en cache
+        sprite = None
+        if not self.color_shift_enabled and (self.has_gap() or self.gradient_enabled):
+            sprite = self._ring_sprite()
+        if sprite is None:
+            self._render_ring(screen, center, self.rotation)
+        else:
+            screen.blit(sprite, (center[0] - sprite.get_width() // 2,
+                                 center[1] - sprite.get_height() // 2))
+    
+    def _ring_sprite(self) -> Optional[pygame.Surface]:
+        """Sprite pré-rendu de l'anneau pour la rotation courante (None si non mis en cache)"""
+        key = (self.inner_radius, self.outer_radius, self.color, self.gap_angle,
+               self.gap_start, self.segments, self.gradient_enabled,
+               tuple(self.gradient_colors) if self.gradient_enabled else None)
+        if key != self._ring_cache_key:
+            self._ring_cache_key = key
+            self._ring_cache = None
+            self._ring_source = None
+            
+            size = 2 * int(self.outer_radius) + 2
+            source = pygame.Surface((size, size), pygame.SRCALPHA)
+            self._render_ring(source, (size // 2, size // 2), 0.0)
+            
+            if not self.has_gap():
+                # Anneau complet : invariant par rotation
+                self._ring_cache = [source]
+            else:
+                # Sprites tournés générés à la demande (un tourné fait jusqu'à 2x la source)
+                steps = math.ceil(360 / _RING_ANGLE_STEP)
+                if 2 * size * size * steps <= _RING_ROTATION_CACHE_MAX_PIXELS:
+                    self._ring_source = source
+                    self._ring_cache = [None] * steps
+        
+        cache = self._ring_cache
+        if cache is None:
+            return None
+        if len(cache) == 1:
+            return cache[0]
+        
+        index = int(round(self.rotation / _RING_ANGLE_STEP)) % len(cache)
+        sprite = cache[index]
+        if sprite is None:
+            # rotate() tourne dans le sens trigonométrique, l'écran a l'axe y vers le bas
+            sprite = pygame.transform.rotate(self._ring_source, -index * _RING_ANGLE_STEP)
+            cache[index] = sprite
+        return sprite
+    
+    def _render_ring(self, surface: pygame.Surface, center: tuple, rotation: float):
+        """Dessine l'anneau sur une surface pour une rotation donnée"""
         if self.gradient_enabled:
-            self._render_gradient_ring(screen, center)
+            self._render_gradient_ring(surface, center, rotation)
         else:
-            self._render_solid_ring(screen, center)
+            self._render_solid_ring(surface, center, rotation)
     
-    def _render_solid_ring(self, screen: pygame.Surface, center: tuple):
+    def _render_solid_ring(self, surface: pygame.Surface, center: tuple, rotation: float):
         """Rendu d'un anneau couleur unie"""
         thickness = int(self.outer_radius - self.inner_radius)
         if thickness <= 0:
@@ -487,18 +1009,70 @@ class Ring(PhysicsBody):
         # Calculer la couleur
         color = self.color
         if self.color_shift_enabled:
-            hue = (self.color_phase / 360.0) % 1.0
-            color = hsv_to_rgb(hue, 1.0, 1.0)
+            # Teinte pleine : lue dans la table partagée de rainbow_color
+            color = rainbow_color(self.color_phase / 360.0)
         
         if not self.has_gap():
             # Anneau complet
-            pygame.draw.circle(screen, color, center, int(self.outer_radius), thickness)
+            pygame.draw.circle(surface, color, center, int(self.outer_radius), thickness)
         else:
             # Anneau avec gap - dessiner par segments
-            self._render_segmented_ring(screen, center, color)
+            self._render_segmented_ring(surface, center, color, rotation)
+    
+    def _arc_angles(self, rotation: float) -> List[float]:
+        """Angles (radians) des sommets de la partie pleine de l'anneau"""
+        arc = 360.0 - self.gap_angle if self.has_gap() else 360.0
+        steps = max(2, int(self.segments * arc / 360.0))
+        
+        # La partie pleine commence à la fin du gap
+        start = math.radians(self.gap_start + self.gap_angle + rotation) if self.has_gap() else 0.0
+        step = math.radians(arc) / steps
+        return [start + i * step for i in range(steps + 1)]
     
-    def _render_segmented_ring(self, screen: pygame.Surface, center: tuple, color: tuple):
+    def _render_segmented_ring(self, surface: pygame.Surface, center: tuple, color: tuple,
+                               rotation: float):
         """Rendu d'un anneau segmenté avec gap"""
-        # Angles en radians
-        gap_start_rad = math.radians(self.gap_start + self.rotation)
-        gap_end_rad = math.r
\ No newline at end of file
+        cx, cy = center
+        angles = self._arc_angles(rotation)
+        outer = [(cx + math.cos(a) * self.outer_radius, cy + math.sin(a) * self.outer_radius)
+                 for a in angles]
+        inner = [(cx + math.cos(a) * self.inner_radius, cy + math.sin(a) * self.inner_radius)
+                 for a in reversed(angles)]
+        
+        # Un seul polygone : arc extérieur puis arc intérieur en sens inverse
+        pygame.draw.polygon(surface, color, outer + inner)
+    
+    def _gradient_color(self, t: float) -> tuple:
+        """Couleur du dégradé (cyclique) à la position t dans [0, 1]"""
+        colors = self.gradient_colors
+        pos = (t % 1.0) * len(colors)
+        i = int(pos)
+        c0 = colors[i % len(colors)]
+        c1 = colors[(i + 1) % len(colors)]
+        f = pos - i
+        return tuple(int(lerp(a, b, f)) for a, b in zip(c0, c1))
+    
+    def _render_gradient_ring(self, surface: pygame.Surface, center: tuple, rotation: float):
+        """Rendu d'un anneau en dégradé (suit la rotation)"""
+        if self.outer_radius <= self.inner_radius or not self.gradient_colors:
+            return
+        
+        cx, cy = center
+        angles = self._arc_angles(rotation)
+        outer = [(cx + math.cos(a) * self.outer_radius, cy + math.sin(a) * self.outer_radius)
+                 for a in angles]
+        inner = [(cx + math.cos(a) * self.inner_radius, cy + math.sin(a) * self.inner_radius)
+                 for a in angles]
+        
+        # Un quadrilatère par segment, coloré selon sa position sur l'arc
+        count = len(angles) - 1
+        for i in range(count):
+            color = self._gradient_color(i / count)
+            pygame.draw.polygon(surface, color, (outer[i], outer[i + 1], inner[i + 1], inner[i]))
+    
+    def _compute_aabb(self) -> Tuple[float, float, float, float]:
+        """Bounding box de l'anneau"""
+        x = self.position.x
+        y = self.position.y
+        r = self.outer_radius
+        return (x - r, y - r, x + r, y + r)
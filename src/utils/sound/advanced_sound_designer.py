@@ -11,30 +11,46 @@ import numpy as np
 import pygame
 import json
 import os
-from typing import Dict, List, Any
-from src.audio_generators.simple_midi_audio_generator import AdvancedSoundGenerator
+import io
+import contextlib
+import struct
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Callable
+from src.audio_generators.simple_midi_audio_generator import AdvancedSoundGenerator, CompiledPreset, NoisePool
+
+# soundfile est optionnel : sans lui, écriture directe du WAV (voir _write_wav_fast)
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
 
 def demo_basic_waveforms():
     """Démontre les différentes formes d'ondes de base"""
     print("🎵 Démonstration des formes d'ondes de base...")
     
+    os.makedirs("temp", exist_ok=True)
     generator = AdvancedSoundGenerator()
     
     waveforms = ["sine", "square", "sawtooth", "triangle", "pulse", "noise", "pink_noise", "brown_noise"]
+    samples = int(generator.sample_rate * 1.0)  # 1 seconde
+    
+    # Toutes les formes d'ondes en un passage (base de temps et bruit blanc partagés)
+    waves = generator.generate_waveforms(waveforms, 440.0, samples)
     
     for waveform in waveforms:
         print(f"   Génération: {waveform}")
-        samples = int(generator.sample_rate * 1.0)  # 1 seconde
-        wave = generator.generate_waveform(waveform, 440.0, samples)
         
         # Sauvegarde pour écoute
         filename = f"temp/demo_waveform_{waveform}.wav"
-        save_audio_to_wav(wave, filename, generator.sample_rate)
+        save_audio_to_wav(waves[waveform], filename, generator.sample_rate)
 
 def demo_harmonics_system():
     """Démontre le système d'harmoniques avancé"""
     print("🎵 Démonstration du système d'harmoniques...")
     
+    os.makedirs("temp", exist_ok=True)
     generator = AdvancedSoundGenerator()
     frequency = 440.0  # La 440Hz
     duration = 2.0
@@ -69,6 +85,7 @@ def demo_advanced_envelopes():
     """Démontre les enveloppes avancées"""
     print("🎵 Démonstration des enveloppes avancées...")
     
+    os.makedirs("temp", exist_ok=True)
     generator = AdvancedSoundGenerator()
     samples = int(generator.sample_rate * 3.0)
     
@@ -105,6 +122,7 @@ def demo_modulations_and_turbulence():
     """Démontre les modulations et turbulences"""
     print("🎵 Démonstration des modulations et turbulences...")
     
+    os.makedirs("temp", exist_ok=True)
     generator = AdvancedSoundGenerator()
     duration = 4.0
     samples = int(generator.sample_rate * duration)
@@ -138,14 +156,18 @@ def demo_filters():
     """Démontre les différents filtres"""
     print("🎵 Démonstration des filtres...")
     
+    os.makedirs("temp", exist_ok=True)
     generator = AdvancedSoundGenerator()
     duration = 3.0
     samples = int(generator.sample_rate * duration)
     
-    # Signal riche en harmoniques
-    signal = (generator.generate_waveform("square", 220, samples) * 0.3 +
-              generator.generate_waveform("sawtooth", 440, samples) * 0.4 +
-              generator.generate_waveform("sine", 880, samples) * 0.3)
+    # Signal riche en harmoniques : mixage pondéré en un seul produit matrice-vecteur
+    waves = np.stack([
+        generator.generate_waveform("square", 220, samples),
+        generator.generate_waveform("sawtooth", 440, samples),
+        generator.generate_waveform("sine", 880, samples),
+    ])
+    signal = np.dot(np.array([0.3, 0.4, 0.3], dtype=np.float32), waves)
     
     # Différents filtres
     lowpass = generator.apply_lowpass_filter(signal, 800, resonance=0.7)
@@ -163,6 +185,7 @@ def demo_effects():
     """Démontre les effets audio"""
     print("🎵 Démonstration des effets...")
     
+    os.makedirs("temp", exist_ok=True)
     generator = AdvancedSoundGenerator()
     duration = 2.0
     samples = int(generator.sample_rate * duration)
@@ -190,7 +213,8 @@ def demo_complete_instruments():
     """Démontre la création d'instruments complets"""
     print("🎵 Démonstration d'instruments complets...")
     
-    generator = AdvancedSoundGenerator()
+    os.makedirs("temp", exist_ok=True)
+    generator = AdvancedSoundGenerator(noise_pool=NoisePool())  # Bruits tirés une fois
     
     # 1. Piano synthétique avancé
     piano_config = {
@@ -293,7 +317,8 @@ def demo_extreme_sound_design():
     """Démontre la création de sons complètement innovants"""
     print("🎵 Démonstration de sound design extrême...")
     
-    generator = AdvancedSoundGenerator()
+    os.makedirs("temp", exist_ok=True)
+    generator = AdvancedSoundGenerator(noise_pool=NoisePool())  # Bruits tirés une fois
     
     # 1. Son "alien" complexe
     alien_config = {
@@ -390,229 +415,282 @@ def demo_extreme_sound_design():
     texture_sound = generator.generate_advanced_sound(texture_config)
     save_audio_to_wav(texture_sound, "temp/demo_extreme_texture.wav", generator.sample_rate)
 
+# Bibliothèque de presets avancés (sauvegardée en JSON par create_preset_library)
+PRESET_LIBRARY: Dict[str, Dict[str, Any]] = {
+    "ultra_satisfying_bounce": {
+        "name": "Ultra Satisfying Bounce",
+        "description": "Rebond ultra-satisfaisant avec harmoniques dorées",
+        "config": {
+            "frequency": 440.0,
+            "duration": 0.8,
+            "volume": 0.7,
+            "waveform": "sine",
+            "harmonics": [
+                {"harmonic": 1.618, "amplitude": 0.3, "waveform": "sine"},
+                {"harmonic": 2.618, "amplitude": 0.2, "waveform": "triangle"}
+            ],
+            "envelope": {
+                "type": "adsr",
+                "attack_ms": 2,
+                "decay_ms": 80,
+                "sustain_level": 0.4,
+                "release_ms": 300,
+                "curve_type": "exponential"
+            },
+            "modulation": {
+                "fm_frequency": 8.0,
+                "fm_depth": 0.03
+            },
+            "turbulence": {
+                "noise_type": "pink",
+                "noise_amount": 0.01
+            },
+            "effects": [
+                {"type": "reverb", "room_size": 0.2, "wet_level": 0.15}
+            ]
+        }
+    },
+    
+    "crystalline_magic": {
+        "name": "Crystalline Magic",
+        "description": "Son cristallin magique avec harmoniques complexes",
+        "config": {
+            "frequency": 523.25,
+            "duration": 2.0,
+            "volume": 0.6,
+            "waveform": "sine",
+            "harmonics": [
+                {"harmonic": 2.1, "amplitude": 0.4, "waveform": "sine"},
+                {"harmonic": 3.3, "amplitude": 0.2, "waveform": "sine"},
+                {"harmonic": 4.7, "amplitude": 0.15, "waveform": "triangle"},
+                {"harmonic": 6.1, "amplitude": 0.1, "waveform": "sine"}
+            ],
+            "envelope": {
+                "type": "adsr",
+                "attack_ms": 5,
+                "decay_ms": 400,
+                "sustain_level": 0.3,
+                "release_ms": 800,
+                "curve_type": "exponential"
+            },
+            "modulation": {
+                "am_frequency": 3.0,
+                "am_depth": 0.08
+            },
+            "effects": [
+                {"type": "chorus", "rate": 0.5, "depth": 0.02, "mix": 0.3},
+                {"type": "reverb", "room_size": 0.8, "wet_level": 0.5}
+            ]
+        }
+    },
+    
+    "organic_bubble": {
+        "name": "Organic Bubble Pop",
+        "description": "Bulle organique qui éclate avec texture naturelle",
+        "config": {
+            "frequency": 300.0,
+            "duration": 0.3,
+            "volume": 0.8,
+            "waveform": "sine",
+            "harmonics": [
+                {"harmonic": 1.5, "amplitude": 0.4, "waveform": "triangle"}
+            ],
+            "envelope": {
+                "type": "custom",
+                "points": [(0, 0), (0.02, 1), (0.1, 0.2), (1, 0)]
+            },
+            "turbulence": {
+                "noise_type": "pink",
+                "noise_amount": 0.2,
+                "flutter_rate": 15.0,
+                "flutter_depth": 0.1
+            },
+            "filters": [
+                {"type": "highpass", "cutoff": 200}
+            ],
+            "effects": [
+                {"type": "reverb", "room_size": 0.3, "wet_level": 0.2}
+            ]
+        }
+    },
+    
+    "deep_wobble": {
+        "name": "Deep Wobble Bass",
+        "description": "Basse profonde avec wobble intense",
+        "config": {
+            "frequency": 80.0,
+            "duration": 2.0,
+            "volume": 0.9,
+            "waveform": "sawtooth",
+            "harmonics": [
+                {"harmonic": 2, "amplitude": 0.5, "waveform": "square"},
+                {"harmonic": 3, "amplitude": 0.3, "waveform": "triangle"}
+            ],
+            "envelope": {
+                "type": "adsr",
+                "attack_ms": 10,
+                "decay_ms": 100,
+                "sustain_level": 0.8,
+                "release_ms": 200,
+                "curve_type": "exponential"
+            },
+            "modulation": {
+                "fm_frequency": 4.0,
+                "fm_depth": 0.5
+            },
+            "filters": [
+                {"type": "lowpass", "cutoff": 300, "resonance": 0.8}
+            ],
+            "effects": [
+                {"type": "distortion", "drive": 2.0, "tone": 0.3}
+            ]
+        }
+    },
+    
+    "space_pad": {
+        "name": "Ethereal Space Pad",
+        "description": "Nappe spatiale éthérée et évolutive",
+        "config": {
+            "frequency": 220.0,
+            "duration": 6.0,
+            "volume": 0.4,
+            "waveform": "triangle",
+            "harmonics": [
+                {"harmonic": 1.5, "amplitude": 0.4, "waveform": "sine"},
+                {"harmonic": 2.3, "amplitude": 0.3, "waveform": "triangle"},
+                {"harmonic": 3.7, "amplitude": 0.2, "waveform": "sine"}
+            ],
+            "envelope": {
+                "type": "adsr",
+                "attack_ms": 800,
+                "decay_ms": 500,
+                "sustain_level": 0.7,
+                "release_ms": 2000,
+                "curve_type": "exponential"
+            },
+            "modulation": {
+                "am_frequency": 0.3,
+                "am_depth": 0.2,
+                "fm_frequency": 0.1,
+                "fm_depth": 0.05
+            },
+            "filters": [
+                {"type": "lowpass", "cutoff": 1000, "resonance": 0.3}
+            ],
+            "effects": [
+                {"type": "chorus", "rate": 0.2, "depth": 0.03, "mix": 0.6},
+                {"type": "reverb", "room_size": 0.9, "wet_level": 0.7}
+            ]
+        }
+    }
+}
+
+@lru_cache(maxsize=None)
+def _compiled_library_preset(name: str) -> CompiledPreset:
+    """Config d'un preset de PRESET_LIBRARY, compilée une seule fois"""
+    return AdvancedSoundGenerator.compile_config(PRESET_LIBRARY[name]['config'])
+
 def create_preset_library():
     """Crée une bibliothèque de presets avancés"""
     print("🎵 Création de la bibliothèque de presets...")
     
-    presets = {
-        "ultra_satisfying_bounce": {
-            "name": "Ultra Satisfying Bounce",
-            "description": "Rebond ultra-satisfaisant avec harmoniques dorées",
-            "config": {
-                "frequency": 440.0,
-                "duration": 0.8,
-                "volume": 0.7,
-                "waveform": "sine",
-                "harmonics": [
-                    {"harmonic": 1.618, "amplitude": 0.3, "waveform": "sine"},
-                    {"harmonic": 2.618, "amplitude": 0.2, "waveform": "triangle"}
-                ],
-                "envelope": {
-                    "type": "adsr",
-                    "attack_ms": 2,
-                    "decay_ms": 80,
-                    "sustain_level": 0.4,
-                    "release_ms": 300,
-                    "curve_type": "exponential"
-                },
-                "modulation": {
-                    "fm_frequency": 8.0,
-                    "fm_depth": 0.03
-                },
-                "turbulence": {
-                    "noise_type": "pink",
-                    "noise_amount": 0.01
-                },
-                "effects": [
-                    {"type": "reverb", "room_size": 0.2, "wet_level": 0.15}
-                ]
-            }
-        },
-        
-        "crystalline_magic": {
-            "name": "Crystalline Magic",
-            "description": "Son cristallin magique avec harmoniques complexes",
-            "config": {
-                "frequency": 523.25,
-                "duration": 2.0,
-                "volume": 0.6,
-                "waveform": "sine",
-                "harmonics": [
-                    {"harmonic": 2.1, "amplitude": 0.4, "waveform": "sine"},
-                    {"harmonic": 3.3, "amplitude": 0.2, "waveform": "sine"},
-                    {"harmonic": 4.7, "amplitude": 0.15, "waveform": "triangle"},
-                    {"harmonic": 6.1, "amplitude": 0.1, "waveform": "sine"}
-                ],
-                "envelope": {
-                    "type": "adsr",
-                    "attack_ms": 5,
-                    "decay_ms": 400,
-                    "sustain_level": 0.3,
-                    "release_ms": 800,
-                    "curve_type": "exponential"
-                },
-                "modulation": {
-                    "am_frequency": 3.0,
-                    "am_depth": 0.08
-                },
-                "effects": [
-                    {"type": "chorus", "rate": 0.5, "depth": 0.02, "mix": 0.3},
-                    {"type": "reverb", "room_size": 0.8, "wet_level": 0.5}
-                ]
-            }
-        },
-        
-        "organic_bubble": {
-            "name": "Organic Bubble Pop",
-            "description": "Bulle organique qui éclate avec texture naturelle",
-            "config": {
-                "frequency": 300.0,
-                "duration": 0.3,
-                "volume": 0.8,
-                "waveform": "sine",
-                "harmonics": [
-                    {"harmonic": 1.5, "amplitude": 0.4, "waveform": "triangle"}
-                ],
-                "envelope": {
-                    "type": "custom",
-                    "points": [(0, 0), (0.02, 1), (0.1, 0.2), (1, 0)]
-                },
-                "turbulence": {
-                    "noise_type": "pink",
-                    "noise_amount": 0.2,
-                    "flutter_rate": 15.0,
-                    "flutter_depth": 0.1
-                },
-                "filters": [
-                    {"type": "highpass", "cutoff": 200}
-                ],
-                "effects": [
-                    {"type": "reverb", "room_size": 0.3, "wet_level": 0.2}
-                ]
-            }
-        },
-        
-        "deep_wobble": {
-            "name": "Deep Wobble Bass",
-            "description": "Basse profonde avec wobble intense",
-            "config": {
-                "frequency": 80.0,
-                "duration": 2.0,
-                "volume": 0.9,
-                "waveform": "sawtooth",
-                "harmonics": [
-                    {"harmonic": 2, "amplitude": 0.5, "waveform": "square"},
-                    {"harmonic": 3, "amplitude": 0.3, "waveform": "triangle"}
-                ],
-                "envelope": {
-                    "type": "adsr",
-                    "attack_ms": 10,
-                    "decay_ms": 100,
-                    "sustain_level": 0.8,
-                    "release_ms": 200,
-                    "curve_type": "exponential"
-                },
-                "modulation": {
-                    "fm_frequency": 4.0,
-                    "fm_depth": 0.5
-                },
-                "filters": [
-                    {"type": "lowpass", "cutoff": 300, "resonance": 0.8}
-                ],
-                "effects": [
-                    {"type": "distortion", "drive": 2.0, "tone": 0.3}
-                ]
-            }
-        },
-        
-        "space_pad": {
-            "name": "Ethereal Space Pad",
-            "description": "Nappe spatiale éthérée et évolutive",
-            "config": {
-                "frequency": 220.0,
-                "duration": 6.0,
-                "volume": 0.4,
-                "waveform": "triangle",
-                "harmonics": [
-                    {"harmonic": 1.5, "amplitude": 0.4, "waveform": "sine"},
-                    {"harmonic": 2.3, "amplitude": 0.3, "waveform": "triangle"},
-                    {"harmonic": 3.7, "amplitude": 0.2, "waveform": "sine"}
-                ],
-                "envelope": {
-                    "type": "adsr",
-                    "attack_ms": 800,
-                    "decay_ms": 500,
-                    "sustain_level": 0.7,
-                    "release_ms": 2000,
-                    "curve_type": "exponential"
-                },
-                "modulation": {
-                    "am_frequency": 0.3,
-                    "am_depth": 0.2,
-                    "fm_frequency": 0.1,
-                    "fm_depth": 0.05
-                },
-                "filters": [
-                    {"type": "lowpass", "cutoff": 1000, "resonance": 0.3}
-                ],
-                "effects": [
-                    {"type": "chorus", "rate": 0.2, "depth": 0.03, "mix": 0.6},
-                    {"type": "reverb", "room_size": 0.9, "wet_level": 0.7}
-                ]
-            }
-        }
-    }
+    presets = PRESET_LIBRARY
     
-    # Sauvegarde des presets
+    # Sauvegarde des presets (temp/ reçoit les exemples générés plus bas)
     os.makedirs("sound_presets", exist_ok=True)
+    os.makedirs("temp", exist_ok=True)
     with open("sound_presets/advanced_presets.json", "w", encoding="utf-8") as f:
         json.dump(presets, f, indent=2, ensure_ascii=False)
     
     print("✅ Bibliothèque de presets sauvegardée dans sound_presets/advanced_presets.json")
     
-    # Génération d'exemples de chaque preset
+    # Génération d'exemples de chaque preset : NumPy et les noyaux Numba relâchent le GIL,
+    # des threads suffisent (le générateur est sans état, partagé en lecture seule)
     generator = AdvancedSoundGenerator()
-    for preset_name, preset_data in presets.items():
-        print(f"   Génération: {preset_data['name']}")
-        sound = generator.generate_advanced_sound(preset_data['config'])
-        save_audio_to_wav(sound, f"temp/preset_{preset_name}.wav", generator.sample_rate)
+    with ThreadPoolExecutor(max_workers=min(len(presets), os.cpu_count() or 1)) as executor:
+        futures = []
+        for preset_name, preset_data in presets.items():
+            print(f"   Génération: {preset_data['name']}")
+            futures.append(executor.submit(_render_preset, generator, preset_name))
+        for future in futures:
+            future.result()  # Propage les erreurs éventuelles
+
+def _render_preset(generator: AdvancedSoundGenerator, preset_name: str):
+    """Génère et sauvegarde l'exemple d'un preset"""
+    sound = generator.generate_advanced_sound(_compiled_library_preset(preset_name))
+    save_audio_to_wav(sound, f"temp/preset_{preset_name}.wav", generator.sample_rate)
 
 def save_audio_to_wav(audio_data: np.ndarray, filename: str, sample_rate: int):
-    """Sauvegarde audio en WAV"""
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    
-    # Normalisation
-    if np.max(np.abs(audio_data)) > 0:
-        audio_data = audio_data / np.max(np.abs(audio_data)) * 0.95
-    
-    # Conversion en int16
-    audio_int16 = (audio_data * 32767).astype(np.int16)
-    
-    import wave
-    with wave.open(filename, 'wb') as wav_file:
-        wav_file.setnchannels(1)  # Mono
-        wav_file.setsampwidth(2)  # 2 bytes = 16 bits
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(audio_int16.tobytes())
+    """Sauvegarde audio en WAV (le dossier de filename doit exister : les démos le créent)"""
+    audio_data = np.asarray(audio_data, dtype=np.float32)  # Sans copie si déjà en float32
+    
+    # Normalisation : un seul parcours pour le pic
+    peak = float(np.abs(audio_data).max())
+    scale = 0.95 / peak * 32767 if peak > 0 else 32767
+    
+    # Normalisation et conversion en int16 fusionnées (pas de copie flottante intermédiaire)
+    audio_int16 = np.empty(audio_data.shape, dtype=np.int16)
+    np.multiply(audio_data, scale, out=audio_int16, casting='unsafe')
+    
+    if SOUNDFILE_AVAILABLE:
+        # Écrit directement depuis le tampon int16 (PCM 16 bits mono)
+        sf.write(filename, audio_int16, sample_rate, subtype='PCM_16')
+        return
+    
+    _write_wav_fast(filename, audio_int16, sample_rate)
+
+def _write_wav_fast(path: str, samples_i16: np.ndarray, sample_rate: int):
+    """Écrit un WAV PCM 16 bits mono : en-tête RIFF de 44 octets puis le tampon brut"""
+    # Little-endian imposé par le format (copie uniquement sur machine big-endian)
+    samples_i16 = np.ascontiguousarray(samples_i16, dtype='<i2')
+    data_size = samples_i16.nbytes
+    
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, 1,              # Bloc fmt : PCM, mono
+        sample_rate, sample_rate * 2,   # Fréquence, octets par seconde
+        2, 16,                          # Alignement de bloc, bits par échantillon
+        b'data', data_size,
+    )
+    
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(header)
+        f.write(memoryview(samples_i16).cast('B'))  # Sans copie tobytes()
+
+def _run_demo(demo: Callable[[], None]) -> str:
+    """Exécute une démo dans un processus de travail et retourne ce qu'elle a affiché"""
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        demo()
+    return output.getvalue()
 
 def main():
     """Démonstration complète du système de génération audio avancé"""
     print("🎵 Démonstration du Générateur de Sons Ultra-Avancé")
     print("=" * 60)
     
-    # Création du dossier temporaire
+    # Création du dossier temporaire, une fois pour toutes les sauvegardes
+    # (save_audio_to_wav ne crée pas les dossiers)
     os.makedirs("temp", exist_ok=True)
     
+    # Démos indépendantes (chacune son générateur et ses fichiers) : un processus par démo
+    demos = [
+        demo_basic_waveforms,
+        demo_harmonics_system,
+        demo_advanced_envelopes,
+        demo_modulations_and_turbulence,
+        demo_filters,
+        demo_effects,
+        demo_complete_instruments,
+        demo_extreme_sound_design,
+    ]
+    
     try:
-        # Démos progressives
-        demo_basic_waveforms()
-        demo_harmonics_system()
-        demo_advanced_envelopes()
-        demo_modulations_and_turbulence()
-        demo_filters()
-        demo_effects()
-        demo_complete_instruments()
-        demo_extreme_sound_design()
+        with ProcessPoolExecutor(max_workers=min(len(demos), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(_run_demo, demo) for demo in demos]
+            for future in futures:
+                # Sortie de chaque démo affichée dans l'ordre (propage aussi son exception)
+                print(future.result(), end="")
         
         # Création de la bibliothèque
         create_preset_library()